@@ -0,0 +1,68 @@
+"""
+wordleBatch 일괄 검색 도구의 테스트입니다.
+
+    python -m unittest test_wordleBatch
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import wordleBatch
+
+WORDS = ["crane", "barge", "carve", "farce", "stare", "other"]
+
+class BatchErrorLineTest(unittest.TestCase):
+    """
+    잘못된 줄이 섞인 입력에서 그 줄만 오류 결과가 되고 나머지 검색은 계속되는지 확인합니다.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.base = self._write("words.txt", "\n".join(WORDS) + "\n")
+        self.user = self._write("user_words.txt", "")
+        self.extended = self._write("extended_words.txt", "")
+        self.queries = self._write("queries.txt", "\n".join([
+            "_ a _ _ e | r(1) | s",   # 1: 정상
+            "a|b|c|d",                # 2: 칸이 너무 많음
+            "",
+            "# 주석",
+            "_ [ _ _ _",              # 5: 잘못된 정규식
+            "__r__\te(1)\ts,t",       # 6: 탭 구분, 정상
+        ]) + "\n")
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def run_main(self, workers):
+        output = os.path.join(self.tmp.name, f"results_{workers}.jsonl")
+        wordleBatch.main([self.queries, "-o", output, "-w", str(workers), "--words", self.base,
+                          "--user-words", self.user, "--extended-words", self.extended])
+        with open(output, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_read_queries_keeps_malformed_line(self):
+        with open(self.queries, "r", encoding="utf-8") as f:
+            queries = wordleBatch.read_queries(f)
+        self.assertEqual([query[0] for query in queries], [1, 2, 5, 6])
+        self.assertEqual(len(queries[1]), 5)
+        self.assertEqual(queries[1][1], "a|b|c|d")
+
+    def test_mixed_input(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                records = self.run_main(workers)
+                self.assertEqual([record["line"] for record in records], [1, 2, 5, 6])
+                self.assertEqual(records[0]["words"], ["barge", "carve", "farce"])
+                self.assertIn("error", records[1])
+                self.assertNotIn("words", records[1])
+                self.assertIn("error", records[2])
+                self.assertEqual(records[3]["words"], ["barge", "carve", "farce"])
+
+if __name__ == "__main__":
+    unittest.main()
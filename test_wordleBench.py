@@ -0,0 +1,34 @@
+"""
+wordleBench 벤치마크 도구의 테스트입니다.
+
+    python -m unittest test_wordleBench
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import wordleBench
+
+class TargetMemoryTest(unittest.TestCase):
+    """
+    측정 대상의 메모리(target_rss_mb)가 사전을 준비할 때의 메모리에 묻히지 않는지 확인합니다.
+    """
+
+    def test_build_index_reports_memory(self):
+        if wordleBench.peak_rss_mb() is None:
+            self.skipTest("이 환경에서는 최대 메모리를 잴 수 없습니다.")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, "bench.json")
+            wordleBench.main(["-o", output, "--no-shipped", "--sizes", "100000", "--targets",
+                              "build_bitset,pattern_to_regex", "--queries", "20", "--max-seconds", "0.2"])
+            with open(output, "r", encoding="utf-8") as f:
+                results = {record["target"]: record for record in json.load(f)["results"]}
+        build = results["build_bitset"]
+        self.assertEqual(build["words"], 100_000)
+        self.assertGreater(build["target_rss_mb"], 0)
+        self.assertGreater(build["target_rss_mb"], results["pattern_to_regex"]["target_rss_mb"])
+
+if __name__ == "__main__":
+    unittest.main()
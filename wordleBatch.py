@@ -0,0 +1,127 @@
+"""
+여러 검색 조건을 한 번에 처리하는 명령줄 도구입니다.
+
+입력 파일(또는 표준 입력)의 한 줄이 검색 하나이며, GUI 입력창과 같은 문법의 세 칸을
+탭이나 '|'로 구분합니다. 빈 줄과 '#'로 시작하는 줄은 무시합니다.
+
+    _ a _ b _ | a(1,4) b(3,4) | c,d,e
+    __r__	e(1)	s,t
+
+결과는 입력 순서대로 한 줄에 JSON 객체 하나씩(JSON Lines) 출력합니다.
+칸이 너무 많거나 정규식이 잘못된 줄은 그 줄의 결과에 "error"를 적고 나머지 검색은 계속합니다.
+검색은 프로세스 풀에 나누어 처리하며, 각 작업 프로세스는 단어 목록을 한 번만 읽습니다.
+
+사용 예:
+    python wordleBatch.py queries.txt -o results.jsonl --workers 8 --extended
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from wordleCore import WordStore, add_word_file_arguments, search, word_file_paths
+
+# 작업 프로세스마다 한 번만 만들어 두는 검색 인덱스
+_worker_index = None
+
+def parse_query_line(line):
+    """
+    입력 한 줄을 (패턴, 유동 글자, 제외 글자) 세 값으로 나눕니다.
+    빈 줄이나 주석이면 None을 반환합니다.
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    separator = "\t" if "\t" in line else "|"
+    fields = [field.strip() for field in line.rstrip("\r\n").split(separator)]
+    if len(fields) > 3:
+        raise ValueError(f"칸이 너무 많습니다 (최대 3칸): {stripped}")
+    fields += [""] * (3 - len(fields))
+    return tuple(fields)
+
+def read_queries(stream):
+    """
+    입력 스트림에서 (줄 번호, 패턴, 유동 글자, 제외 글자) 검색 목록을 읽습니다.
+    칸을 나눌 수 없는 줄은 (줄 번호, 줄 내용, "", "", 오류 메시지)로 담아 run_query가 오류 결과를 내게 합니다.
+    """
+    queries = []
+    for line_no, line in enumerate(stream, 1):
+        try:
+            query = parse_query_line(line)
+        except ValueError as e:
+            queries.append((line_no, line.strip(), "", "", str(e)))
+            continue
+        if query is not None:
+            queries.append((line_no,) + query)
+    return queries
+
+def _init_worker(paths, use_extended, backend, db_path=None):
+    """
+    작업 프로세스 시작 시 단어 목록을 읽고 인덱스를 만들어 둡니다.
+    """
+    global _worker_index
+    store = WordStore(paths["base"], paths["user"], paths["extended"], backend=backend, db_path=db_path)
+    _worker_index = store.index(use_extended)
+
+def run_query(query):
+    """
+    검색 하나를 실행해 JSON으로 내보낼 딕셔너리를 반환합니다.
+    """
+    line_no, fixed_pattern, loose_letters, exclude_letters = query[:4]
+    record = {"line": line_no, "pattern": fixed_pattern, "loose": loose_letters, "exclude": exclude_letters}
+    if len(query) > 4:
+        record["error"] = query[4]
+        return record
+    try:
+        matches = search(_worker_index, fixed_pattern, loose_letters, exclude_letters)
+    except (ValueError, re.error) as e:
+        record["error"] = str(e)
+        return record
+    record["count"] = len(matches)
+    record["words"] = matches
+    return record
+
+def run_batch(queries, paths, use_extended=False, backend=None, workers=None, chunksize=64, db_path=None):
+    """
+    검색 목록을 처리해 결과 딕셔너리를 입력 순서대로 돌려줍니다.
+    workers가 1이면 현재 프로세스에서, 아니면 프로세스 풀에서 처리합니다.
+    """
+    if workers == 1 or len(queries) <= 1:
+        _init_worker(paths, use_extended, backend, db_path)
+        yield from map(run_query, queries)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(paths, use_extended, backend, db_path)) as executor:
+        yield from executor.map(run_query, queries, chunksize=chunksize)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워들 단어 사전 일괄 검색 (JSON Lines 출력)")
+    parser.add_argument("queries", nargs="?", default="-", help="검색 조건 파일 (기본값: 표준 입력)")
+    parser.add_argument("-o", "--output", default="-", help="결과 파일 (기본값: 표준 출력)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--extended", action="store_true", help="확장 단어팩 사용")
+    parser.add_argument("--backend", choices=("bitset", "numpy"), default=None, help="검색 엔진 (기본값: 자동)")
+    parser.add_argument("--chunksize", type=int, default=64, help="작업 프로세스에 한 번에 넘기는 검색 수")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = word_file_paths(parser, args, args.extended)
+
+    if args.queries == "-":
+        queries = read_queries(sys.stdin)
+    else:
+        with open(args.queries, "r", encoding="utf-8") as f:
+            queries = read_queries(f)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record in run_batch(queries, paths, args.extended, args.backend, args.workers, args.chunksize, args.db):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
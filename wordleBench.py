@@ -0,0 +1,325 @@
+"""
+단어 읽기와 검색 성능을 재는 벤치마크 도구입니다.
+
+배포되는 단어 목록(기본, 확장)과 길이가 섞인 합성 사전(기본값 10만, 100만, 1000만 단어)에 대해
+load_words, pattern_to_regex, parse_loose_letters, filter_words, 검색 인덱스(비트셋, NumPy, 길이별 버킷),
+조건 없는 전체 목록 출력 경로(정렬 + 알파벳 구분)를 측정합니다.
+
+검색 조건은 실제 게임처럼 만듭니다. 사전에서 정답과 추측 단어를 골라 피드백을 계산하고
+GUI 입력창의 세 값으로 바꿉니다. 초반(추측 1개, 조건 적음)과 후반(추측 3~5개, 조건 많음)을 반씩 섞습니다.
+
+최대 메모리(peak RSS)는 프로세스 전체의 최댓값이므로 사전 × 측정 대상마다 새 프로세스에서 측정합니다.
+합성 사전과 검색 조건은 사전마다 한 번 다른 프로세스에서 파일로 만들어 두고, 측정 프로세스는 그 파일만 읽습니다.
+기록마다 그 프로세스의 최대 메모리(peak_rss_mb), 단어 목록과 검색 조건을 읽은 뒤 측정 직전의 메모리(dataset_rss_mb),
+그 차이인 측정 대상의 메모리(target_rss_mb)가 들어갑니다. (Linux에서는 측정 직전에 최대 메모리를 현재 값으로 되돌립니다.)
+결과는 JSON으로 출력합니다 (초당 처리 수, p50/p99 지연 시간, 최대 메모리).
+
+사용 예:
+    python wordleBench.py -o bench.json
+    python wordleBench.py --sizes 100000 --targets filter_words,filter_bitset --queries 200
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from wordleCore import (DEFAULT_WORD_FILES, LengthBucketIndex, NumpyWordIndex, WordIndex, WordStats, filter_words,
+                        import_numpy, load_words, parse_loose_letters, pattern_to_regex, read_word_file)
+from wordleFeedback import colors_from_code, feedback_code, feedback_to_fields
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없어 최대 메모리를 기록하지 않습니다.
+    resource = None
+
+DEFAULT_SIZES = (100_000, 1_000_000, 10_000_000)
+TARGETS = ("load_words", "load_wdb", "pattern_to_regex", "parse_loose_letters", "filter_words", "filter_planned",
+           "build_bitset", "filter_bitset", "build_numpy", "filter_numpy", "build_buckets", "filter_buckets", "listing")
+# build_*/filter_* 측정 대상의 검색 인덱스
+ENGINES = {"bitset": WordIndex, "numpy": NumpyWordIndex, "buckets": LengthBucketIndex}
+# 합성 사전의 단어 길이 분포 (dwyl words_alpha처럼 5글자가 아닌 단어가 대부분입니다)
+SYNTHETIC_LENGTHS = {4: 7, 5: 11, 6: 15, 7: 17, 8: 17, 9: 14, 10: 10, 11: 9}
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# =========================
+# 데이터 준비
+# =========================
+
+def letter_weights(words):
+    """
+    단어 목록의 알파벳 빈도를 합성 사전의 글자 가중치로 씁니다.
+    """
+    counts = dict.fromkeys(ALPHABET, 1)
+    for word in words:
+        for ch in word:
+            if ch in counts:
+                counts[ch] += 1
+    return [counts[ch] for ch in ALPHABET]
+
+def synthetic_words(size, weights, seed):
+    """
+    길이가 섞인 합성 단어 size개를 만듭니다. 같은 seed면 항상 같은 목록입니다.
+    """
+    rnd = random.Random(seed)
+    lengths = list(SYNTHETIC_LENGTHS)
+    length_weights = list(SYNTHETIC_LENGTHS.values())
+    counts = dict.fromkeys(lengths, 0)
+    for length in rnd.choices(lengths, length_weights, k=size):
+        counts[length] += 1
+    words = []
+    for length, count in counts.items():
+        text = "".join(rnd.choices(ALPHABET, weights, k=count * length))
+        words += [text[i:i + length] for i in range(0, len(text), length)]
+    rnd.shuffle(words)
+    return words
+
+def make_queries(words, count, seed):
+    """
+    사전에서 게임을 흉내 내 검색 조건 count개를 만듭니다. [(단계, (패턴, 유동 글자, 제외 글자))]
+    """
+    rnd = random.Random(seed)
+    buckets = {}
+    for word in words:
+        buckets.setdefault(len(word), []).append(word)
+    queries = []
+    for i in range(count):
+        answer = rnd.choice(words)
+        bucket = buckets[len(answer)]
+        phase = "early" if i % 2 == 0 else "late"
+        turns = 1 if phase == "early" else rnd.randint(3, 5)
+        rows = [(guess, colors_from_code(feedback_code(guess, answer), len(guess)))
+                for guess in (rnd.choice(bucket) for _ in range(turns))]
+        queries.append((phase, feedback_to_fields(rows)))
+    return queries
+
+def _proc_status_kb(field):
+    """
+    Linux의 /proc/self/status에서 field 값(KB)을 읽습니다. 없으면 None입니다.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def peak_rss_mb():
+    """
+    현재 프로세스의 최대 메모리 사용량(MB)을 반환합니다. 측정할 수 없으면 None입니다.
+    Linux에서는 VmHWM을 씁니다. ru_maxrss는 fork/exec 때 부모 프로세스의 값을 물려받아
+    spawn으로 만든 측정 프로세스에서도 부모의 메모리보다 작아지지 않기 때문입니다.
+    """
+    peak = _proc_status_kb("VmHWM")
+    if peak is not None:
+        return round(peak / 1024, 1)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위입니다.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def reset_peak_rss():
+    """
+    Linux에서 최대 메모리(VmHWM)를 현재 사용량으로 되돌립니다. 그 밖의 환경에서는 아무것도 하지 않습니다.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+# =========================
+# 측정
+# =========================
+
+def measure(func, inputs, max_seconds, min_ops=3):
+    """
+    inputs를 차례로 func에 넣어 실행 시간을 잽니다. max_seconds가 지나면 (최소 min_ops번 실행 후) 멈춥니다.
+    """
+    latencies = []
+    started = time.perf_counter()
+    for i, item in enumerate(inputs):
+        t = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - t)
+        if i + 1 >= min_ops and time.perf_counter() - started > max_seconds:
+            break
+    latencies.sort()
+    total = sum(latencies)
+
+    def percentile(q):
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 4)
+
+    return {"ops": len(latencies), "ops_per_sec": round(len(latencies) / total, 2) if total else None,
+            "p50_ms": percentile(0.50), "p99_ms": percentile(0.99), "total_s": round(total, 4)}
+
+def _repeat(value, times):
+    return [value] * times
+
+def prepare_dataset(spec, targets, query_count, seed, tmpdir):
+    """
+    사전 하나를 측정용 파일로 준비합니다. (별도 프로세스에서 호출됩니다.)
+    합성 사전과 검색 조건을 tmpdir에 쓰고, load_wdb를 측정하면 .wdb 파일도 컴파일해 둡니다.
+    측정 프로세스는 이 파일들만 읽으므로 합성 사전을 만드는 동안의 임시 메모리가 측정에 섞이지 않습니다.
+    """
+    name, kind, value = spec
+    missing = os.path.join(tmpdir, "missing.txt")
+    if kind == "shipped":
+        paths = value
+        use_extended = name == "extended"
+        words = load_words(paths["base"], paths["user"], paths["extended"], use_extended=use_extended,
+                           warn=lambda *args: None)
+    else:
+        base_words = read_word_file("extended_words.txt") if os.path.exists("extended_words.txt") else []
+        words = synthetic_words(value, letter_weights(base_words), seed)
+        text_path = os.path.join(tmpdir, "words.txt")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(words))
+        paths = {"base": text_path, "user": missing, "extended": missing}
+        use_extended = False
+    queries_path = os.path.join(tmpdir, "queries.json")
+    with open(queries_path, "w", encoding="utf-8") as f:
+        json.dump(make_queries(words, query_count, seed), f)
+    db_path = None
+    if "load_wdb" in targets:
+        from wordleDb import compile_database
+        db_path = os.path.join(tmpdir, "words.wdb")
+        compile_database(paths, db_path)
+    return {"name": name, "paths": paths, "use_extended": use_extended, "queries": queries_path, "db": db_path}
+
+def run_dataset(dataset, targets, max_seconds):
+    """
+    준비된 사전(prepare_dataset 참고) 하나에 대해 측정 대상들을 실행합니다. (별도 프로세스에서 호출됩니다.)
+    최대 메모리를 대상별로 구하려면 측정 대상 하나마다 새 프로세스에서 호출해야 합니다. (main 참고)
+    """
+    paths = dataset["paths"]
+    load_args = (paths["base"], paths["user"], paths["extended"], dataset["use_extended"])
+    words = load_words(*load_args[:3], use_extended=load_args[3], warn=lambda *args: None)
+    with open(dataset["queries"], "r", encoding="utf-8") as f:
+        queries = [(phase, tuple(query)) for phase, query in json.load(f)]
+    fields = [query for _, query in queries]
+    results = []
+    baseline_rss = None
+    indexes = {}
+
+    def record(target, stats, **extra):
+        peak_rss = peak_rss_mb()
+        stats.update(dataset=dataset["name"], words=len(words), target=target, peak_rss_mb=peak_rss,
+                     dataset_rss_mb=baseline_rss,
+                     target_rss_mb=round(peak_rss - baseline_rss, 1) if peak_rss is not None else None, **extra)
+        results.append(stats)
+
+    for target in targets:
+        # 측정 대상 직전의 메모리입니다. 측정 대상의 메모리(target_rss_mb)는 여기서 늘어난 만큼입니다.
+        reset_peak_rss()
+        baseline_rss = peak_rss_mb()
+        if target == "load_words":
+            record(target, measure(lambda args: load_words(*args[:3], use_extended=args[3], warn=lambda *a: None),
+                                   _repeat(load_args, 1000), max_seconds))
+        elif target == "load_wdb":
+            from wordleDb import WordDatabase
+            record(target, measure(WordDatabase, _repeat(dataset["db"], 1000), max_seconds))
+        elif target == "pattern_to_regex":
+            record(target, measure(pattern_to_regex, [f[0] for f in fields], max_seconds))
+        elif target == "parse_loose_letters":
+            record(target, measure(parse_loose_letters, [f[1] for f in fields], max_seconds))
+        elif target == "filter_words":
+            for phase in ("early", "late"):
+                inputs = [q for p, q in queries if p == phase]
+                record(target, measure(lambda q: filter_words(words, *q), inputs, max_seconds), phase=phase)
+        elif target == "filter_planned":
+            # 글자 빈도 통계로 조건 순서를 정하는 filter_words (통계는 한 번만 만듭니다)
+            stats = WordStats.from_words(words)
+            for phase in ("early", "late"):
+                inputs = [q for p, q in queries if p == phase]
+                record(target, measure(lambda q: filter_words(words, *q, stats=stats), inputs, max_seconds),
+                       phase=phase)
+        elif target in ("build_bitset", "build_numpy", "build_buckets"):
+            backend = target.split("_")[1]
+            if backend == "numpy" and import_numpy() is None:
+                continue
+            engine = ENGINES[backend]
+            record(target, measure(engine, _repeat(words, 100), max_seconds, min_ops=1))
+            indexes[backend] = engine(words)
+        elif target in ("filter_bitset", "filter_numpy", "filter_buckets"):
+            backend = target.split("_")[1]
+            if backend not in indexes:
+                if backend == "numpy" and import_numpy() is None:
+                    continue
+                indexes[backend] = ENGINES[backend](words)
+            index = indexes[backend]
+            for phase in ("early", "late"):
+                inputs = [q for p, q in queries if p == phase]
+                record(target, measure(lambda q: index.filter(*q), inputs, max_seconds), phase=phase)
+        elif target == "listing":
+            from wordleDict import listing_segments
+
+            def listing(words):
+                for _ in listing_segments(sorted(words)):
+                    pass
+
+            record(target, measure(listing, _repeat(words, 100), max_seconds, min_ops=1))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워들 단어 사전 벤치마크 (JSON 출력)")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="합성 사전 크기 목록 (쉼표로 구분, 빈 값이면 합성 사전 생략)")
+    parser.add_argument("--no-shipped", action="store_true", help="배포 단어 목록(기본, 확장) 측정 생략")
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"측정 대상 (쉼표로 구분): {', '.join(TARGETS)}")
+    parser.add_argument("--queries", type=int, default=500, help="사전마다 만드는 검색 조건 수")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="측정 대상 하나에 쓰는 최대 시간 (초)")
+    parser.add_argument("--seed", type=int, default=20240101, help="난수 시드")
+    args = parser.parse_args(argv)
+
+    targets = [target for target in args.targets.split(",") if target]
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"알 수 없는 측정 대상: {', '.join(sorted(unknown))}")
+    specs = []
+    if not args.no_shipped:
+        paths = dict(DEFAULT_WORD_FILES)
+        specs += [("base", "shipped", paths), ("extended", "shipped", paths)]
+    specs += [(f"synthetic_{int(size)}", "synthetic", int(size)) for size in args.sizes.split(",") if size]
+
+    numpy = import_numpy()
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                       "numpy": numpy.__version__ if numpy else None, "seed": args.seed,
+                       "queries": args.queries, "max_seconds": args.max_seconds,
+                       "started": time.strftime("%Y-%m-%dT%H:%M:%S")},
+              "results": []}
+    context = get_context("spawn")
+    for spec in specs:
+        tmpdir = tempfile.mkdtemp(prefix="wordle_bench_")
+        try:
+            print(f"준비 중: {spec[0]}", file=sys.stderr)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                dataset = executor.submit(prepare_dataset, spec, targets, args.queries, args.seed, tmpdir).result()
+            for target in targets:
+                print(f"측정 중: {spec[0]} / {target}", file=sys.stderr)
+                # ru_maxrss는 프로세스 전체의 최댓값이므로 측정 대상마다 새 프로세스에서 측정해
+                # 앞선 대상의 최대 메모리가 뒤의 대상에 섞이지 않게 합니다.
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    report["results"] += executor.submit(run_dataset, dataset, [target], args.max_seconds).result()
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+if __name__ == "__main__":
+    main()
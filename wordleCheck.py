@@ -0,0 +1,274 @@
+"""
+사용자 단어 파일이 바뀌었을 때의 증분 반영이 처음부터 다시 만든 결과와 같은지 확인하는 검사 도구입니다.
+
+WordStore는 user_words.txt가 바뀌면 목록과 인덱스를 새로 만들지 않고 추가/삭제된 단어만 반영합니다.
+(WordIndex / NumpyWordIndex / LengthBucketIndex.updated, WordStats.updated, AnagramIndex.updated)
+이 도구는 임시 폴더에 복사한 단어 파일로 사용자 단어를 무작위로 여러 번 바꾸고, 매번 store.refresh() 뒤에
+아래 항목을 검사합니다.
+- 증분 반영한 인덱스의 비트셋/행렬과 통계가 같은 단어 순서로 새로 만든 인덱스와 같은지
+- 단어 목록, 검색 결과(패턴 검색, 피드백 제약 프로그램), 글자 빈도 통계, 글자 묶음 검색 결과,
+  알파벳순 목록이 같은 파일로 새로 만든 WordStore와 같은지 (단어 순서는 다를 수 있으므로 정렬해 비교)
+- 바뀐 단어가 적을 때 실제로 증분 반영(last_delta)이 일어났는지
+- 처음 .wdb에서 읽은 단어 목록이 텍스트 파일로 만든 목록과 순서까지 같은지
+검색 엔진(비트셋, NumPy), 시작 방법(텍스트 파일, .wdb 파일), 검색 결과 캐시 유무를 모두 조합해 검사합니다.
+다른 것이 하나라도 있으면 내용을 출력하고 종료 코드 1로 끝납니다.
+
+사용 예:
+    python wordleCheck.py
+    python wordleCheck.py --steps 50 --seed 7 --backends bitset
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from wordleCore import (AnagramIndex, LengthBucketIndex, NumpyWordIndex, WordIndex, WordStats, WordStore,
+                        add_word_file_arguments, import_numpy, read_word_file, search, word_file_paths)
+from wordleFeedback import colors_from_code, compile_feedback, feedback_code, feedback_to_fields
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+# 무작위 사용자 단어에 섞는 ASCII가 아닌 단어 (NumpyWordIndex는 따로 검사합니다)
+IRREGULAR_WORDS = ("café", "naïve", "héllo", "crème")
+MAX_FAILURES = 20  # 출력할 최대 불일치 수
+INITIAL_USER_WORDS = 30  # 시나리오를 시작할 때 사용자 단어 파일에 넣어 두는 단어 수
+
+class Checker:
+    """
+    불일치를 모아 두는 객체입니다. check(조건, 설명)로 쓰고, 마지막에 failures를 출력합니다.
+    """
+
+    def __init__(self):
+        self.failures = []
+        self.checks = 0
+
+    def check(self, condition, message):
+        self.checks += 1
+        if not condition:
+            self.failures.append(message)
+        return condition
+
+# =========================
+# 데이터 준비
+# =========================
+
+def random_word(rnd):
+    return "".join(rnd.choice(ALPHABET) for _ in range(rnd.randint(3, 11)))
+
+def word_pool(rnd, base_words, size=2000):
+    """
+    사용자 단어로 쓸 후보입니다. 길이가 섞인 새 단어, 기본 목록에 이미 있는 단어(중복 제거 검사용),
+    ASCII가 아닌 단어를 섞습니다.
+    """
+    pool = [random_word(rnd) for _ in range(size)]
+    pool += rnd.sample(base_words, min(len(base_words), size // 10))
+    return pool + list(IRREGULAR_WORDS)
+
+def next_user_words(rnd, current, pool, big_change):
+    """
+    사용자 단어 목록을 한 번 바꿉니다. 대부분은 몇 단어를 더하거나 빼고, big_change면 한꺼번에 많이 바꿉니다.
+    (WordStore.DELTA_MAX_FRACTION을 넘겨 목록과 인덱스를 새로 만드는 경로도 검사합니다.)
+    """
+    if big_change:
+        return rnd.sample(pool, min(len(pool), rnd.randint(len(pool) // 2, len(pool))))
+    words = list(current)
+    for _ in range(rnd.randint(1, 4)):
+        if words and rnd.random() < 0.4:
+            words.pop(rnd.randrange(len(words)))
+        else:
+            words.insert(rnd.randint(0, len(words)), rnd.choice(pool))
+    return words
+
+def write_user_words(path, words, rnd):
+    """
+    사용자 단어 파일을 씁니다. 같은 시각에 여러 번 써도 바뀐 것으로 보이도록 수정 시각을 앞으로 옮깁니다.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(words) + "\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + rnd.randint(1, 1000) * 1_000_000))
+
+def make_queries(rnd, words, count):
+    """
+    단어 목록에서 게임 한 턴을 흉내 내 [(세 입력값, 제약 프로그램)] 검색 조건을 만듭니다.
+    """
+    buckets = {}
+    for word in words:
+        if word.isascii() and word.isalpha():
+            buckets.setdefault(len(word), []).append(word)
+    lengths = list(buckets)
+    queries = []
+    for _ in range(count):
+        bucket = buckets[rnd.choice(lengths)]
+        answer = rnd.choice(bucket)
+        rows = [(guess, colors_from_code(feedback_code(guess, answer), len(guess)))
+                for guess in (rnd.choice(bucket) for _ in range(rnd.randint(1, 3)))]
+        queries.append((feedback_to_fields(rows), compile_feedback(rows)))
+    return queries
+
+# =========================
+# 검사
+# =========================
+
+def _stats_key(stats):
+    return stats.lengths, stats.positional, stats.contains
+
+def _same_bitsets(a, b):
+    return (a.words == b.words and a.positional == b.positional and a.contains == b.contains
+            and a.lengths == b.lengths and _stats_key(a.stats) == _stats_key(b.stats))
+
+def _same_numpy(a, b):
+    if a.words != b.words or a.irregular_ids != b.irregular_ids or set(a.buckets) != set(b.buckets):
+        return False
+    if _stats_key(a.stats) != _stats_key(b.stats):
+        return False
+    return all((a.buckets[length][0] == b.buckets[length][0]).all()
+               and (a.buckets[length][1] == b.buckets[length][1]).all()
+               and (a.buckets[length][2] == b.buckets[length][2]).all() for length in a.buckets)
+
+def check_engine(checker, engine, label):
+    """
+    증분 반영한 검색 인덱스가 같은 단어 순서로 새로 만든 인덱스와 내부 구조까지 같은지 확인합니다.
+    """
+    if isinstance(engine, LengthBucketIndex):
+        rebuilt = LengthBucketIndex(engine.words, engine.factory)
+        checker.check(engine.bucket_ids == rebuilt.bucket_ids, f"{label}: 길이별 묶음의 단어 번호가 다릅니다.")
+        for length, bucket in engine.buckets.items():
+            other = rebuilt.buckets.get(length)
+            checker.check(other is not None and _same_bitsets(bucket, other),
+                          f"{label}: {length}글자 묶음의 비트셋이 다릅니다.")
+        checker.check(set(engine.buckets) == set(rebuilt.buckets), f"{label}: 길이별 묶음 목록이 다릅니다.")
+    elif isinstance(engine, NumpyWordIndex):
+        checker.check(_same_numpy(engine, NumpyWordIndex(engine.words)), f"{label}: NumPy 행렬이 다릅니다.")
+    elif isinstance(engine, WordIndex):
+        checker.check(_same_bitsets(engine, WordIndex(engine.words)), f"{label}: 비트셋이 다릅니다.")
+
+def check_view(checker, store, fresh, use_extended, queries, racks, label):
+    """
+    증분 반영한 저장소(store)의 한 보기를 같은 파일로 새로 만든 저장소(fresh)와 비교합니다.
+    """
+    words = store.words(use_extended)
+    expected = fresh.words(use_extended)
+    if not checker.check(sorted(words) == sorted(expected) and len(set(words)) == len(words),
+                         f"{label}: 단어 목록이 다릅니다. ({len(words)}개 / {len(expected)}개)"):
+        return
+    index = store.index(use_extended)
+    expected_index = fresh.index(use_extended)
+    checker.check(index.words is words, f"{label}: 인덱스가 현재 단어 목록으로 만들어지지 않았습니다.")
+    engine = getattr(index, "index", index)
+    check_engine(checker, engine, label)
+    for fields, program in queries:
+        checker.check(sorted(search(index, *fields)) == sorted(search(expected_index, *fields)),
+                      f"{label}: 검색 결과가 다릅니다: {fields}")
+        checker.check(sorted(index.filter_program(program)) == sorted(expected_index.filter_program(program)),
+                      f"{label}: 제약 프로그램 결과가 다릅니다: {fields}")
+    # NumpyWordIndex의 통계는 ASCII 단어만 셉니다.
+    counted = words if not isinstance(engine, NumpyWordIndex) else [word for word in words if word.isascii()]
+    checker.check(_stats_key(store.word_stats(use_extended)) == _stats_key(WordStats.from_words(counted)),
+                  f"{label}: 글자 빈도 통계가 다릅니다.")
+    anagram = store.anagram_index(use_extended)
+    rebuilt = AnagramIndex(words)
+    expected_anagram = fresh.anagram_index(use_extended)
+    for mode, letters in racks:
+        result = anagram.search(mode, letters)
+        checker.check(result == rebuilt.search(mode, letters)
+                      and sorted(result) == sorted(expected_anagram.search(mode, letters)),
+                      f"{label}: 글자 묶음 검색 결과가 다릅니다: {mode} {letters}")
+    ordered, letters = store.alphabetical(use_extended)
+    checker.check(ordered == sorted(expected), f"{label}: 알파벳순 목록이 다릅니다.")
+
+def run_scenario(checker, paths, backend, use_db, cache_size, steps, seed):
+    """
+    임시 폴더에서 시나리오 하나(검색 엔진, 시작 방법, 캐시 크기)를 steps번 바꿔 가며 검사합니다.
+    반환값: (증분 반영 횟수, 새로 만든 횟수)
+    """
+    rnd = random.Random(seed)
+    tmpdir = tempfile.mkdtemp(prefix="wordle_check_")
+    try:
+        local = {kind: os.path.join(tmpdir, os.path.basename(path)) for kind, path in paths.items()}
+        for kind in ("base", "extended"):
+            shutil.copy(paths[kind], local[kind])
+        base_words = read_word_file(local["base"])
+        pool = word_pool(rnd, base_words)
+        # 처음부터 지울 사용자 단어가 있도록 후보 몇 개를 미리 넣어 둡니다.
+        user_words = read_word_file(paths["user"]) if os.path.exists(paths["user"]) else []
+        user_words += rnd.sample(pool, INITIAL_USER_WORDS)
+        write_user_words(local["user"], user_words, rnd)
+        db_path = os.path.join(tmpdir, "words.wdb") if use_db else None
+
+        store = WordStore(local["base"], local["user"], local["extended"], backend=backend, db_path=db_path,
+                          cache_size=cache_size)
+        store.load_all()  # .wdb를 쓰면 여기서 컴파일한 뒤 그 파일의 목록과 인덱스를 읽습니다.
+        if use_db:
+            checker.check(store.database() is not None, f"{backend}: 컴파일한 .wdb를 읽지 못했습니다.")
+            text = WordStore(local["base"], local["user"], local["extended"], backend=backend)
+            for use_extended in (False, True):
+                checker.check(store.words(use_extended) == text.words(use_extended),
+                              f"{backend}: .wdb의 단어 순서가 텍스트 파일로 만든 목록과 다릅니다.")
+        label = f"{backend} / {'.wdb' if use_db else '텍스트'} / 캐시 {cache_size}"
+        deltas = rebuilds = 0
+        for step in range(1, steps + 1):
+            big_change = step % 10 == 0
+            user_words = next_user_words(rnd, user_words, pool, big_change)
+            write_user_words(local["user"], user_words, rnd)
+            store.last_delta = None
+            store.refresh()
+            if store.last_delta is None:
+                rebuilds += 1
+                checker.check(big_change, f"{label} {step}단계: 사용자 단어 몇 개만 바뀌었는데 목록과 인덱스를 새로 만들었습니다.")
+            else:
+                deltas += 1
+            fresh = WordStore(local["base"], local["user"], local["extended"], backend=backend)
+            queries = make_queries(rnd, fresh.words(True), 20)
+            racks = ([("anagram", rnd.choice(pool)), ("formable", "".join(rnd.sample(ALPHABET, 8)))]
+                     + [("containing", "".join(rnd.sample(ALPHABET, 2)))])
+            for use_extended in (False, True):
+                check_view(checker, store, fresh, use_extended, queries, racks,
+                           f"{label} {step}단계 {'확장' if use_extended else '기본'}")
+            if len(checker.failures) >= MAX_FAILURES:
+                break
+        return deltas, rebuilds
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사용자 단어 증분 반영이 새로 만든 결과와 같은지 검사합니다.")
+    parser.add_argument("--steps", type=int, default=20, help="시나리오마다 사용자 단어 파일을 바꾸는 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--backends", default="bitset,numpy", help="검사할 검색 엔진 (쉼표로 구분)")
+    add_word_file_arguments(parser, db=False)
+    args = parser.parse_args(argv)
+    paths = word_file_paths(parser, args, False)
+    word_file_paths(parser, args, True)  # 확장 단어 파일도 임시 폴더로 복사하므로 함께 확인합니다.
+
+    backends = [backend for backend in args.backends.split(",") if backend]
+    unknown = set(backends) - {"bitset", "numpy"}
+    if unknown:
+        parser.error(f"알 수 없는 검색 엔진: {', '.join(sorted(unknown))}")
+    if "numpy" in backends and import_numpy() is None:
+        print("NumPy가 설치되어 있지 않아 numpy 엔진은 건너뜁니다.", file=sys.stderr)
+        backends.remove("numpy")
+
+    checker = Checker()
+    started = time.perf_counter()
+    for backend in backends:
+        for use_db in (False, True):
+            for cache_size in (0, 16):
+                deltas, rebuilds = run_scenario(checker, paths, backend, use_db, cache_size, args.steps, args.seed)
+                print(f"{backend} / {'.wdb' if use_db else '텍스트'} / 캐시 {cache_size}: "
+                      f"증분 반영 {deltas}번, 새로 만듦 {rebuilds}번")
+                if len(checker.failures) >= MAX_FAILURES:
+                    break
+    elapsed = time.perf_counter() - started
+    if checker.failures:
+        print(f"불일치 {len(checker.failures)}건 (검사 {checker.checks}개, {elapsed:.1f}초):")
+        for message in checker.failures[:MAX_FAILURES]:
+            print(f"  {message}")
+        sys.exit(1)
+    print(f"모두 같습니다. (검사 {checker.checks}개, {elapsed:.1f}초)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1831 @@
+"""
+워들 단어 사전의 핵심 기능(단어 파일 읽기, 조건 파싱, 단어 필터링)을 모아 둔 모듈입니다.
+tkinter를 전혀 사용하지 않으므로 화면이 없는 환경(서버, 배치 작업, 테스트)에서도 바로 불러올 수 있습니다.
+NumPy는 NumPy 검색 엔진을 처음 만들 때에만 불러옵니다.
+"""
+
+import math
+import os
+import re
+import sys
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from operator import getitem, itemgetter
+
+from wordleTrace import NULL_TIMER
+
+# =========================
+# 선택 의존성
+# =========================
+
+_numpy = None
+_numpy_checked = False
+
+def import_numpy():
+    """
+    NumPy 모듈을 처음 필요할 때 한 번만 불러와 반환합니다. 설치되어 있지 않으면 None을 반환합니다.
+    """
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:  # NumPy가 없으면 순수 파이썬 엔진(WordIndex)만 사용합니다.
+            numpy = None
+        _numpy = numpy
+        _numpy_checked = True
+    return _numpy
+
+# =========================
+# 데이터 처리 함수
+# =========================
+
+def read_word_file(path):
+    """
+    단어 파일 하나를 읽어 소문자 단어 리스트로 반환합니다.
+    빈 줄과 '#'로 시작하는 줄(주석)은 무시합니다.
+    파일이 없으면 FileNotFoundError가 그대로 발생합니다.
+    """
+    words = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.strip()
+            if word and not word.startswith("#"):
+                words.append(word.lower())
+    return words
+
+# 찾지 못한 단어 파일에 대한 안내 문구 (파일 종류 -> 문구)
+MISSING_FILE_MESSAGES = {
+    "base": "기본 단어 파일 '{path}'이 존재하지 않습니다.",
+    "extended": "확장 단어 파일 '{path}'이 존재하지 않습니다.",
+}
+
+def _print_warning(title, message):
+    print(f"[{title}] {message}", file=sys.stderr)
+
+def load_words(filename="words.txt", user_filename="user_words.txt", extended_filename="extended_words.txt",
+               use_extended=False, warn=None):
+    """
+    기본 단어 파일(또는 확장 단어 파일)과 사용자가 추가한 단어 파일을 읽어서 리스트로 반환합니다.
+    '#'로 시작하는 줄(주석)은 무시합니다.
+    파일을 찾지 못하면 warn(제목, 메시지)로 알립니다. warn이 없으면 표준 오류로 출력합니다.
+    """
+    warn = warn or _print_warning
+    words = []
+
+    # 확장 단어 파일 (use_extended가 True일 때만 사용), 아니면 기본 단어 파일
+    kind, path = ("extended", extended_filename) if use_extended else ("base", filename)
+    try:
+        words += read_word_file(path)
+    except FileNotFoundError:
+        warn("파일 경고", MISSING_FILE_MESSAGES[kind].format(path=path))
+
+    # 사용자 추가 단어 파일
+    try:
+        words += read_word_file(user_filename)
+    except FileNotFoundError:
+        pass
+
+    if not words:
+        warn("파일 오류", "단어 파일을 찾을 수 없습니다.")
+    return words
+
+def _file_signature(path):
+    """
+    파일의 변경 여부를 판단하기 위한 (수정 시각, 크기) 값을 반환합니다.
+    파일이 없으면 None을 반환합니다.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+class WordStore:
+    """
+    단어 파일을 한 번만 읽어 메모리에 보관하는 저장소입니다.
+    - 파일마다 수정 시각(mtime)과 크기를 기억해 두고, 바뀐 파일만 다시 읽습니다.
+    - 기본 목록과 확장 목록을 모두 메모리에 두므로 확장 단어팩을 전환해도 다시 읽지 않습니다.
+    - 반환되는 리스트는 캐시된 객체이므로 호출하는 쪽에서 수정하면 안 됩니다.
+    - db_path를 주면 컴파일된 .wdb 파일(wordleDb 참고)이 원본 파일들과 일치할 때 텍스트 대신 그 파일을 읽습니다.
+      이때 단어 목록의 순서는 텍스트 파일을 읽을 때와 같고, 비트셋 인덱스도 파일에 저장된 것을 그대로 씁니다.
+    - cache_size를 주면 index()가 검색 결과 캐시(QueryCache)를 씌운 인덱스를 반환합니다.
+    - 목록은 중복 없이 기본(또는 확장) 목록 다음에 그 목록에 없는 사용자 단어를 붙입니다.
+      사용자 단어 파일만 바뀌었으면 추가/삭제된 단어만 목록과 인덱스에 반영합니다. (UserWordsWatcher 참고)
+      .wdb에서 읽은 목록과 인덱스도 사용자 단어 파일이 바뀌면 그대로 이어 받아 바뀐 단어만 반영합니다.
+    - anagram_index()는 글자 묶음 검색용 AnagramIndex를 반환합니다. load_all()에서 검색 인덱스와 함께 만듭니다.
+    """
+
+    # 사용자 단어가 전체 단어의 이 비율보다 많이 바뀌면 증분 반영 대신 목록과 인덱스를 새로 만듭니다.
+    DELTA_MAX_FRACTION = 0.05
+
+    def __init__(self, filename="words.txt", user_filename="user_words.txt", extended_filename="extended_words.txt",
+                 backend=None, db_path=None, cache_size=0):
+        self.paths = {"base": filename, "user": user_filename, "extended": extended_filename}
+        self.backend = backend  # 검색 엔진 ("bitset", "numpy", None=자동), build_index 참고
+        self.db_path = db_path
+        self.cache_size = cache_size  # 검색 결과 캐시 크기 (0이면 캐시 없음)
+        self._db = None            # 열어 둔 WordDatabase
+        self._db_signature = None  # 열어 둔 .wdb 파일의 서명
+        self._sources = {}  # 파일 종류 -> (파일 서명, 단어 리스트)
+        # 확장 여부 -> (원본 파일 서명들, 합쳐진 단어 리스트, 덧붙인 사용자 단어, 기본 목록 집합, 사용자 단어의 목록 번호)
+        self._views = {}
+        self._indexes = {}  # 확장 여부 -> 검색 인덱스 (WordIndex, NumpyWordIndex 또는 이를 감싼 QueryCache)
+        self._anagram_indexes = {}  # 확장 여부 -> (만들 때의 단어 리스트, AnagramIndex)
+        self._listings = {}  # 확장 여부 -> (만들 때의 단어 리스트, 알파벳순 리스트, 첫 글자별 시작 위치 표)
+        self.missing = []   # 마지막 조회에서 찾지 못한 파일 종류 ("base", "extended", "user")
+        self.last_delta = None  # 마지막으로 증분 반영한 사용자 단어 변경 ([추가된 단어], [삭제된 단어])
+
+    def source(self, kind):
+        """
+        한 종류의 단어 파일을 반환합니다. 파일이 바뀌지 않았다면 캐시를 그대로 사용합니다.
+        """
+        path = self.paths[kind]
+        signature = _file_signature(path)
+        cached = self._sources.get(kind)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        words = []
+        if signature is not None:
+            try:
+                words = read_word_file(path)
+            except FileNotFoundError:
+                signature = None
+        self._sources[kind] = (signature, words)
+        return words
+
+    def database(self):
+        """
+        원본 파일들과 일치하는 .wdb 파일이 있으면 WordDatabase를, 없거나 오래되었으면 None을 반환합니다.
+        """
+        if not self.db_path:
+            return None
+        signature = _file_signature(self.db_path)
+        if signature != self._db_signature:
+            from wordleDb import WordDatabase
+            try:
+                self._db = WordDatabase(self.db_path) if signature is not None else None
+            except (OSError, ValueError):
+                self._db = None
+            self._db_signature = signature
+        if self._db is None or not self._db.is_fresh(self.paths):
+            return None
+        return self._db
+
+    def words(self, use_extended=False):
+        """
+        현재 설정(기본/확장)에 해당하는 단어 리스트를 반환합니다.
+        확장 단어팩을 쓰면 확장 목록 + 사용자 목록, 아니면 기본 목록 + 사용자 목록입니다.
+        """
+        db = self.database()
+        if db is not None:
+            view = "extended" if use_extended else "base"
+            self.missing = db.missing(view)
+            self._views.pop(use_extended, None)  # .wdb가 오래되면 그 보기에서 이어 갑니다. (_seed_from_database)
+            return db.views[view]
+        if use_extended not in self._views and self._db is not None:
+            self._seed_from_database(use_extended)
+        kinds = ("extended" if use_extended else "base", "user")
+        parts = [self.source(kind) for kind in kinds]
+        signatures = tuple(self._sources[kind][0] for kind in kinds)
+        self.missing = [kind for kind in kinds if self._sources[kind][0] is None]
+        cached = self._views.get(use_extended)
+        if cached is not None and cached[0] == signatures:
+            return cached[1]
+        if cached is not None and cached[0][0] == signatures[0]:
+            words = self._apply_user_delta(use_extended, cached, signatures, parts[1])
+            if words is not None:
+                return words
+        base = list(dict.fromkeys(parts[0]))
+        base_set = set(base)
+        extra = [word for word in dict.fromkeys(parts[1]) if word not in base_set]
+        words = base + extra
+        self._views[use_extended] = (signatures, words, extra, base_set, list(range(len(base), len(words))))
+        return words
+
+    def _seed_from_database(self, use_extended):
+        """
+        .wdb에서 읽어 쓰던 보기를 텍스트 파일용 캐시(_sources, _views)로 옮깁니다.
+        원본이 바뀌어 .wdb가 오래된 뒤의 첫 조회에서도, 사용자 단어 파일만 바뀌었으면 바뀐 단어만 반영할 수 있습니다.
+        .wdb의 보기는 텍스트 파일로 만든 목록과 순서가 같아 (기본 목록 다음에 사용자 단어) 그대로 이어 받습니다.
+        사용자 단어 파일은 기본 목록에 이미 있는 단어까지 알아야 하므로 옮기지 않고 다음 조회에서 읽습니다.
+        """
+        db = self._db
+        view = "extended" if use_extended else "base"
+        words = db.views[view]
+        count = db.main_counts[view]
+        if view not in self._sources:
+            self._sources[view] = (db.sources.get(view), words[:count])
+        self._views[use_extended] = (tuple(db.sources.get(kind) for kind in (view, "user")), words, words[count:],
+                                     set(words[:count]), list(range(count, len(words))))
+
+    def _apply_user_delta(self, use_extended, cached, signatures, user_words):
+        """
+        사용자 단어 파일만 바뀌었을 때 추가/삭제된 단어만 목록과 (만들어 둔) 인덱스에 반영합니다.
+        추가된 단어는 목록 끝에 붙습니다. 바뀐 단어가 너무 많으면 None을 반환해 새로 만들게 합니다.
+        """
+        _, old_words, old_extra, base_set, old_ids = cached
+        extra = [word for word in dict.fromkeys(user_words) if word not in base_set]
+        extra_set = set(extra)
+        old_set = set(old_extra)
+        removed = [word for word in old_extra if word not in extra_set]
+        added = [word for word in extra if word not in old_set]
+        if len(removed) + len(added) > len(old_words) * self.DELTA_MAX_FRACTION:
+            return None
+        removed_ids = [i for i, word in zip(old_ids, old_extra) if word not in extra_set]
+        index = self._indexes.get(use_extended)
+        if index is not None and index.words is old_words:
+            engine = getattr(index, "index", index)  # QueryCache는 안쪽 인덱스를 고친 뒤 새로 씌웁니다.
+            engine = engine.updated(removed_ids, added)
+            self._indexes[use_extended] = QueryCache(engine, self.cache_size) if self.cache_size else engine
+            words = engine.words
+        else:
+            words = _remaining_words(old_words, removed_ids, added)
+        anagram = self._anagram_indexes.get(use_extended)
+        if anagram is not None and anagram[0] is old_words:
+            self._anagram_indexes[use_extended] = (words, anagram[1].updated(removed_ids, added))
+        kept = [(i - bisect_left(removed_ids, i), word) for i, word in zip(old_ids, old_extra) if word in extra_set]
+        start = len(words) - len(added)
+        self._views[use_extended] = (signatures, words, [word for _, word in kept] + added, base_set,
+                                     [i for i, _ in kept] + list(range(start, len(words))))
+        self.last_delta = (added, removed)
+        return words
+
+    def index(self, use_extended=False):
+        """
+        현재 설정의 단어 리스트에 대한 검색 인덱스를 반환합니다.
+        단어 리스트가 다시 만들어졌을 때만 인덱스도 새로 만듭니다. (검색 결과 캐시도 함께 비워집니다.)
+        """
+        words = self.words(use_extended)
+        cached = self._indexes.get(use_extended)
+        if cached is None or cached.words is not words:
+            db = self.database()
+            if db is not None and self.backend != "numpy":
+                # .wdb에 저장된 글자 수별 비트셋 묶음(LengthBucketIndex)을 그대로 사용합니다.
+                # (NumPy를 불러오지 않아 시작이 빠릅니다.)
+                cached = db.indexes["extended" if use_extended else "base"]
+            else:
+                cached = build_index(words, self.backend)
+            if self.cache_size:
+                cached = QueryCache(cached, self.cache_size)
+            self._indexes[use_extended] = cached
+        return cached
+
+    def anagram_index(self, use_extended=False):
+        """
+        현재 설정의 단어 리스트에 대한 글자 묶음 검색 인덱스(AnagramIndex)를 반환합니다.
+        단어 리스트가 다시 만들어졌을 때만 새로 만듭니다.
+        """
+        words = self.words(use_extended)
+        cached = self._anagram_indexes.get(use_extended)
+        if cached is None or cached[0] is not words:
+            cached = self._anagram_indexes[use_extended] = (words, AnagramIndex(words))
+        return cached[1]
+
+    def alphabetical(self, use_extended=False):
+        """
+        현재 설정의 단어를 알파벳순으로 정렬한 리스트와 첫 글자별 시작 위치 표(letter_offsets)를 반환합니다.
+        (조건 없는 전체 목록용) .wdb에서 읽은 목록이면 파일에 저장해 둔 알파벳순 순서와 표를 그대로 쓰고,
+        아니면 단어 리스트가 바뀌었을 때만 다시 정렬합니다.
+        """
+        words = self.words(use_extended)
+        view = "extended" if use_extended else "base"
+        if self._db is not None and words is self._db.views[view]:
+            return self._db.alphabetical(view)
+        cached = self._listings.get(use_extended)
+        if cached is None or cached[0] is not words:
+            ordered = sorted(words)
+            cached = self._listings[use_extended] = (words, ordered, letter_offsets(ordered))
+        return cached[1], cached[2]
+
+    def word_stats(self, use_extended=False):
+        """
+        현재 설정의 단어 리스트에 대한 글자 빈도 통계(WordStats)를 반환합니다.
+        검색 인덱스를 만들 때 함께 계산되고, 사용자 단어가 바뀌면 인덱스와 함께 바뀐 단어만큼만 고쳐집니다.
+        """
+        index = self.index(use_extended)
+        return getattr(index, "index", index).stats  # QueryCache는 안쪽 인덱스의 통계를 씁니다.
+
+    def refresh(self):
+        """
+        원본 파일의 변경을 이미 읽어 둔 목록과 인덱스에 바로 반영합니다.
+        (반영하지 않아도 다음 조회 때 반영되지만, 미리 해 두면 다음 검색이 기다리지 않습니다.)
+        """
+        for use_extended in set(self._views) | set(self._indexes) | set(self._anagram_indexes):
+            if use_extended in self._indexes:
+                self.index(use_extended)
+            else:
+                self.words(use_extended)
+            if use_extended in self._anagram_indexes:
+                self.anagram_index(use_extended)
+
+    def load_all(self):
+        """
+        기본 목록과 확장 목록을 미리 모두 읽고 검색 인덱스와 글자 묶음 인덱스까지 만들어 둡니다.
+        db_path의 .wdb 파일이 없거나 원본보다 오래되었으면 새로 컴파일해 다음 실행부터 바로 읽을 수 있게 합니다.
+        """
+        if self.db_path and self.database() is None:
+            from wordleDb import compile_database
+            try:
+                compile_database(self.paths, self.db_path)
+            except OSError:
+                pass
+        self.index(False)
+        self.index(True)
+        self.anagram_index(False)
+        self.anagram_index(True)
+
+class UserWordsWatcher:
+    """
+    사용자 단어 파일을 주기적으로 확인(polling)해 바뀌면 WordStore에 반영하는 감시자입니다.
+    - poll(): 파일의 수정 시각과 크기가 마지막 확인 때와 다른지만 봅니다. (stat 한 번)
+    - start(): 데몬 스레드에서 interval초마다 poll()하고, 바뀌었으면 lock을 잡은 채 store.refresh()를 부른 뒤
+      on_change(store)를 호출합니다.
+    GUI처럼 단어 저장소를 한 작업 스레드에서만 쓰는 경우에는 poll()만 쓰고 refresh는 그 스레드에서 부릅니다.
+    """
+
+    def __init__(self, store, interval=1.0, on_change=None, lock=None):
+        self.store = store
+        self.interval = interval
+        self.on_change = on_change
+        self.lock = lock or threading.Lock()
+        self._signature = _file_signature(store.paths["user"])
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """
+        사용자 단어 파일이 마지막 확인 이후 바뀌었으면 True를 반환합니다.
+        """
+        signature = _file_signature(self.store.paths["user"])
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="wordle-user-words", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not self.poll():
+                continue
+            with self.lock:
+                self.store.refresh()
+            if self.on_change is not None:
+                self.on_change(self.store)
+
+# =========================
+# 명령줄 도구 공통 인자
+# =========================
+
+# 단어 파일 종류 -> 기본 경로 (WordStore의 기본값과 같습니다)
+DEFAULT_WORD_FILES = {"base": "words.txt", "user": "user_words.txt", "extended": "extended_words.txt"}
+
+def add_word_file_arguments(parser, db=True):
+    """
+    명령줄 도구의 argparse 파서에 단어 파일 인자(--words, --user-words, --extended-words)를 추가합니다.
+    db가 참이면 컴파일된 사전 파일 인자(--db)도 추가합니다. (word_file_paths 참고)
+    """
+    if db:
+        parser.add_argument("--db", default=None, help="컴파일된 .wdb 사전 파일 (원본이 바뀌었으면 텍스트 파일을 읽습니다)")
+    parser.add_argument("--words", default=DEFAULT_WORD_FILES["base"], help="기본 단어 파일")
+    parser.add_argument("--user-words", default=DEFAULT_WORD_FILES["user"], help="사용자 추가 단어 파일")
+    parser.add_argument("--extended-words", default=DEFAULT_WORD_FILES["extended"], help="확장 단어 파일")
+
+def word_file_paths(parser, args, use_extended=None):
+    """
+    add_word_file_arguments로 받은 인자를 {종류: 경로}로 반환합니다.
+    use_extended를 주면 그 설정(기본/확장)의 단어 파일이 없을 때 parser.error로 끝냅니다.
+    """
+    paths = {"base": args.words, "user": args.user_words, "extended": args.extended_words}
+    if use_extended is not None:
+        kind = "extended" if use_extended else "base"
+        if not os.path.exists(paths[kind]):
+            parser.error(MISSING_FILE_MESSAGES[kind].format(path=paths[kind]))
+    return paths
+
+def pattern_to_regex(pattern: str):
+    """
+    워들 스타일 패턴(예: _ a _ b _)을 정규식으로 변환합니다.
+    '_'는 임의의 한 글자를 의미하며, 나머지 글자는 그대로 사용됩니다.
+    """
+    cleaned = pattern.replace(" ", "").lower()
+    return "^" + "".join("." if ch == "_" else ch for ch in cleaned) + "$"
+
+def parse_loose_letters(input_str):
+    """
+    유동 글자와 해당 글자가 오면 안 되는 위치를 파싱합니다.
+    예시 입력: a(1,4) b(3,4)
+    결과: {'a': [0, 3], 'b': [2, 3]}  # 인덱스는 0부터 시작
+    """
+    if not input_str.strip():
+        return {}
+    pattern = r"([a-zA-Z])\(([\d,]+)\)"
+    result = {}
+    for match in re.finditer(pattern, input_str):
+        letter = match.group(1).lower()
+        positions = [int(p)-1 for p in match.group(2).split(",")]
+        result[letter] = positions
+    return result
+
+def filter_words(words, fixed_pattern, loose_letters, exclude_letters, timer=None, stats=None):
+    """
+    단어 리스트에서 아래 조건을 모두 만족하는 단어만 필터링합니다.
+    1. fixed_pattern에 맞는 단어
+    2. exclude_letters에 포함된 글자가 없는 단어
+    3. loose_letters에 명시된 글자가 반드시 포함되어 있고, 지정된 위치에는 없어야 함
+    timer(wordleTrace.StageTimer)를 주면 regex, parse, filter 단계의 시간을 기록합니다.
+    stats(WordStats)를 주면 조건을 선택도 순서로 하나씩 적용합니다 (plan_query 참고).
+    결과는 같고, 드문 글자 조건이 있으면 처음부터 후보가 크게 줄어 빨라집니다.
+    """
+    timer = timer or NULL_TIMER
+    if stats is not None:
+        with timer.stage("parse"):
+            query = parse_query(fixed_pattern, loose_letters, exclude_letters)
+            plan = plan_query(query, stats) if query is not None else None
+        if plan is not None:
+            with timer.stage("filter"):
+                return _planned_scan(words, plan)
+    with timer.stage("regex"):
+        regex = re.compile(pattern_to_regex(fixed_pattern))
+    with timer.stage("parse"):
+        exclude_set = set(exclude_letters.lower().replace(",", ""))
+        loose_map = parse_loose_letters(loose_letters)
+        pattern_length = len(fixed_pattern.replace(" ", ""))
+    with timer.stage("filter"):
+        results = []
+        for word in words:
+            if len(word) != pattern_length:
+                continue
+            if not regex.match(word):
+                continue
+            if any(ch in word for ch in exclude_set):
+                continue
+            valid = True
+            for letter, bad_positions in loose_map.items():
+                if letter not in word:
+                    valid = False
+                    break
+                if any(word[pos] == letter for pos in bad_positions if 0 <= pos < len(word)):
+                    valid = False
+                    break
+            if valid:
+                results.append(word)
+    return results
+
+def parse_query(fixed_pattern, loose_letters, exclude_letters):
+    """
+    세 입력값을 인덱스 검색에 쓰는 조건으로 정리합니다. 해석 규칙은 filter_words와 같습니다.
+    반환값: (글자 수, [(위치, 글자), ...], 제외 글자 집합, 유동 글자 딕셔너리)
+    패턴에 '_'와 글자/숫자 이외의 문자가 있으면 정규식으로만 해석할 수 있으므로 None을 반환합니다.
+    """
+    pattern_length = len(fixed_pattern.replace(" ", ""))
+    cleaned = fixed_pattern.replace(" ", "").lower()
+    if len(cleaned) != pattern_length:
+        return None
+    fixed = []
+    for pos, ch in enumerate(cleaned):
+        if ch == "_":
+            continue
+        if not ch.isalnum():
+            return None
+        fixed.append((pos, ch))
+    exclude_set = set(exclude_letters.lower().replace(",", ""))
+    loose_map = parse_loose_letters(loose_letters)
+    return pattern_length, fixed, exclude_set, loose_map
+
+# =========================
+# 검색 계획 (선택도 순서)
+# =========================
+
+# 비트셋의 켜진 비트 수 (int.bit_count는 Python 3.10 이상)
+_popcount = getattr(int, "bit_count", None) or (lambda mask: bin(mask).count("1"))
+
+class _LogTable(dict):
+    """
+    자리 하나의 {글자: log2 확률} 표입니다. 표에 없는 글자는 floor 값을 돌려줍니다. (WordStats.log_likelihoods)
+    """
+    __slots__ = ("floor",)
+
+    def __init__(self, values, floor):
+        super().__init__(values)
+        self.floor = floor
+
+    def __missing__(self, ch):
+        return self.floor
+
+class WordStats:
+    """
+    단어 목록의 글자 빈도 통계입니다. 검색 조건마다 통과하는 단어 비율(선택도)을 추정하는 데 씁니다.
+    긴 단어일수록 많은 글자를 포함하므로 글자 통계는 단어 길이별로 따로 셉니다.
+    - lengths[글자 수]: 그 길이의 단어 수
+    - positional[(글자, 위치, 글자 수)]: 그 길이의 단어 중 그 위치에 그 글자가 있는 단어 수
+    - contains[(글자, 글자 수)]: 그 길이의 단어 중 그 글자를 포함하는 단어 수
+    검색 인덱스를 만들 때 한 번 계산해 두며, 통계는 조건의 순서만 정하므로 검색 결과에는 영향을 주지 않습니다.
+    자리별 글자 빈도표(position_table)와 그로부터 계산한 단어 가능성(likelihood, rank)도 제공합니다.
+    빈도표는 길이마다 처음 필요할 때 한 번 만들고, 사용자 단어가 바뀌면 updated로 만든 새 통계에서 다시 만듭니다.
+    """
+
+    def __init__(self, lengths, positional, contains):
+        self.lengths = lengths
+        self.positional = positional
+        self.contains = contains
+        self.total = sum(lengths.values())
+        self._position_tables = {}  # 글자 수 -> 자리별 {글자: 단어 수}
+        self._log_tables = {}       # 글자 수 -> (자리별 {글자: log2 확률}, 없는 글자의 log2 확률)
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        단어 리스트를 한 번 훑어 통계를 만듭니다.
+        """
+        lengths = {}
+        positional = {}
+        contains = {}
+        for word in words:
+            length = len(word)
+            lengths[length] = lengths.get(length, 0) + 1
+            for pos, ch in enumerate(word):
+                key = (ch, pos, length)
+                positional[key] = positional.get(key, 0) + 1
+            for ch in set(word):
+                key = (ch, length)
+                contains[key] = contains.get(key, 0) + 1
+        return cls(lengths, positional, contains)
+
+    @classmethod
+    def from_bitsets(cls, positional, contains, lengths):
+        """
+        WordIndex의 비트셋에서 켜진 비트 수를 세어 통계를 만듭니다.
+        길이가 여러 가지이면 길이 비트셋과 AND한 뒤 셉니다.
+        """
+        counts = {length: _popcount(bits) for length, bits in lengths.items()}
+        if len(lengths) == 1:
+            (length, _), = lengths.items()
+            return cls(counts, {(ch, pos, length): _popcount(bits) for (ch, pos), bits in positional.items()},
+                       {(ch, length): _popcount(bits) for ch, bits in contains.items()})
+        by_position = {}
+        by_letter = {}
+        for length, length_bits in lengths.items():
+            for (ch, pos), bits in positional.items():
+                if pos < length:
+                    count = _popcount(bits & length_bits)
+                    if count:
+                        by_position[(ch, pos, length)] = count
+            for ch, bits in contains.items():
+                count = _popcount(bits & length_bits)
+                if count:
+                    by_letter[(ch, length)] = count
+        return cls(counts, by_position, by_letter)
+
+    def updated(self, added=(), removed=()):
+        """
+        단어를 더하고(added) 뺀(removed) 새 통계를 반환합니다. 이 통계는 바꾸지 않습니다.
+        """
+        lengths = dict(self.lengths)
+        positional = dict(self.positional)
+        contains = dict(self.contains)
+        for words, delta in ((added, 1), (removed, -1)):
+            for word in words:
+                length = len(word)
+                lengths[length] = lengths.get(length, 0) + delta
+                for pos, ch in enumerate(word):
+                    key = (ch, pos, length)
+                    positional[key] = positional.get(key, 0) + delta
+                for ch in set(word):
+                    key = (ch, length)
+                    contains[key] = contains.get(key, 0) + delta
+        return WordStats({key: count for key, count in lengths.items() if count},
+                         {key: count for key, count in positional.items() if count},
+                         {key: count for key, count in contains.items() if count})
+
+    def position_table(self, length):
+        """
+        length 글자 단어의 자리별 글자 빈도표 [{글자: 단어 수}, ...](자리마다 하나)를 반환합니다.
+        한 번 만든 표는 기억해 두므로 순위, 히트맵 등 여러 기능이 단어를 다시 훑지 않고 함께 씁니다. 고치면 안 됩니다.
+        """
+        table = self._position_tables.get(length)
+        if table is None:
+            table = [{} for _ in range(length)]
+            for (ch, pos, size), count in self.positional.items():
+                if size == length:
+                    table[pos][ch] = count
+            self._position_tables[length] = table
+        return table
+
+    def log_likelihoods(self, length):
+        """
+        length 글자 단어의 자리별 글자 log2 확률표와, 표에 없는 글자의 log2 확률을 반환합니다.
+        확률은 (단어 수 + 1) / (그 길이의 단어 수 + 26)으로 보정해 한 번도 나오지 않은 글자도 0이 되지 않게 합니다.
+        """
+        cached = self._log_tables.get(length)
+        if cached is None:
+            denominator = self.lengths.get(length, 0) + 26
+            floor = math.log2(1 / denominator)
+            tables = [_LogTable({ch: math.log2((count + 1) / denominator) for ch, count in counts.items()}, floor)
+                      for counts in self.position_table(length)]
+            cached = self._log_tables[length] = (tables, floor)
+        return cached
+
+    def likelihood(self, word):
+        """
+        자리마다 글자가 독립이라고 보고 계산한 단어의 log2 가능성입니다. 클수록 사전에서 흔한 모양의 단어입니다.
+        """
+        return sum(map(getitem, self.log_likelihoods(len(word))[0], word))
+
+    def rank(self, words):
+        """
+        단어들을 가능성(likelihood)이 큰 순서로 정렬한 새 리스트를 반환합니다. 같으면 원래 순서를 지킵니다.
+        """
+        tables = {}
+
+        def key(word):
+            table = tables.get(len(word))
+            if table is None:
+                table = tables[len(word)] = self.log_likelihoods(len(word))[0]
+            return sum(map(getitem, table, word))
+
+        return sorted(words, key=key, reverse=True)
+
+    def selectivity(self, predicate, length):
+        """
+        plan_query의 조건 하나를 통과할 것으로 보이는 단어 비율(0~1)을 반환합니다. 작을수록 먼저 검사합니다.
+        길이 조건은 전체 단어 중 비율, 나머지 조건은 length 길이의 단어 중 비율입니다.
+        """
+        kind, pos, ch = predicate
+        if kind == "length":
+            return self.lengths.get(pos, 0) / (self.total or 1)
+        total = self.lengths.get(length, 0) or 1
+        if kind == "at":
+            return self.positional.get((ch, pos, length), 0) / total
+        if kind == "not_at":
+            return 1 - self.positional.get((ch, pos, length), 0) / total
+        if kind == "has":
+            return self.contains.get((ch, length), 0) / total
+        return 1 - self.contains.get((ch, length), 0) / total
+
+def position_counts(words, length):
+    """
+    words 중 length 글자 단어의 자리별 글자 빈도표를 WordStats.position_table과 같은 모양으로 셉니다.
+    (예: 검색 결과 후보들의 히트맵) 자리마다 Counter 한 번이므로 단어 수에 비례하는 C 수준 반복입니다.
+    """
+    words = [word for word in words if len(word) == length]
+    return [dict(Counter(map(itemgetter(pos), words))) for pos in range(length)]
+
+def plan_query(query, stats=None):
+    """
+    parse_query 결과를 하나씩 검사할 수 있는 조건 목록으로 풀어, 걸러내는 단어가 많은 조건부터 정렬합니다.
+    조건은 (종류, 위치, 글자) 튜플입니다.
+    - ("length", 글자 수, None): 단어 길이
+    - ("at", 위치, 글자) / ("not_at", 위치, 글자): 그 위치에 그 글자가 있음 / 없음
+    - ("has", None, 글자) / ("lacks", None, 글자): 그 글자를 포함함 / 포함하지 않음
+    길이 조건은 가장 싸고 나머지 조건의 통계가 길이별이므로, 길이가 여러 가지인 사전에서는 맨 앞에 둡니다.
+    (모든 단어의 길이가 같으면 걸러낼 단어가 없으므로 맨 뒤에 둡니다.)
+    예를 들어 후반 검색의 유동 글자 z, q는 통과하는 단어가 적으므로 그다음으로 먼저 검사됩니다.
+    stats가 없으면 위 순서대로 반환합니다.
+    """
+    pattern_length, fixed, exclude_set, loose_map = query
+    length = ("length", pattern_length, None)
+    predicates = [("at", pos, ch) for pos, ch in fixed]
+    for letter, bad_positions in loose_map.items():
+        predicates.append(("has", None, letter))
+        predicates += [("not_at", pos, letter) for pos in sorted(set(bad_positions)) if 0 <= pos < pattern_length]
+    predicates += [("lacks", None, ch) for ch in sorted(exclude_set)]
+    if stats is None:
+        return [length] + predicates
+    predicates.sort(key=lambda predicate: stats.selectivity(predicate, pattern_length))
+    if stats.selectivity(length, pattern_length) >= 1:
+        return predicates + [length]
+    return [length] + predicates
+
+# 검색 인덱스가 조건 순서를 계획하는 최소 단어 수 (작은 사전에서는 계획 비용이 더 큽니다.)
+PLAN_MIN_WORDS = 50_000
+
+def _planned_scan(words, plan):
+    """
+    plan_query의 조건을 순서대로 하나씩 적용해 후보를 줄여 나갑니다.
+    앞의 조건이 후보를 크게 줄이면 뒤의 조건은 남은 단어만 검사합니다.
+    """
+    candidates = words
+    length_checked = False
+    for kind, pos, ch in plan:
+        if kind == "length":
+            candidates = [word for word in candidates if len(word) == pos]
+            length_checked = True
+        elif kind == "has":
+            candidates = [word for word in candidates if ch in word]
+        elif kind == "lacks":
+            candidates = [word for word in candidates if ch not in word]
+        elif length_checked:
+            if kind == "at":
+                candidates = [word for word in candidates if word[pos] == ch]
+            else:
+                candidates = [word for word in candidates if word[pos] != ch]
+        else:
+            # 길이를 아직 확인하지 않았으면 짧은 단어도 있으므로 슬라이스로 비교합니다.
+            end = pos + 1
+            if kind == "at":
+                candidates = [word for word in candidates if word[pos:end] == ch]
+            else:
+                candidates = [word for word in candidates if word[pos:end] != ch]
+        if not candidates:
+            return []
+    return candidates if candidates is not words else list(words)
+
+# =========================
+# 제약 프로그램 (워들 피드백 보드)
+# =========================
+
+def letter_count_vector(word):
+    """
+    단어의 알파벳(a~z)별 글자 수를 26바이트 bytes로 반환합니다. 그 밖의 문자는 세지 않습니다.
+    """
+    counts = bytearray(26)
+    for ch in word:
+        code = ord(ch) - 97
+        if 0 <= code < 26 and counts[code] < 255:
+            counts[code] += 1
+    return bytes(counts)
+
+class ConstraintProgram:
+    """
+    워들 보드 전체의 조건을 한 번에 검사하도록 정리한 제약 프로그램입니다.
+    - length: 단어 길이
+    - greens: ((위치, 글자), ...) 그 위치에 와야 하는 글자
+    - forbidden: ((위치, 글자 frozenset), ...) 그 위치에 오면 안 되는 글자
+    - counts: ((글자, 최소 개수, 최대 개수 또는 None), ...) 글자별 개수 조건
+    세 입력값(패턴, 유동 글자, 제외 글자)과 달리 같은 글자가 여러 번 나올 때의 최소/정확한 개수를 나타낼 수 있습니다.
+    만들 때 겹치는 조건은 하나로 합치고 다른 조건으로 이미 걸러지는 검사는 빼 두며,
+    서로 모순되는 조건이 있으면 ValueError를 냅니다.
+    단어 하나는 matches로 한 번에 검사하고, 개수 조건은 글자 수 벡터(letter_count_vector)로 확인합니다.
+    보드를 만드는 방법은 wordleFeedback.compile_feedback을 참고하세요.
+    """
+
+    def __init__(self, length, greens=None, forbidden=None, counts=None):
+        greens = dict(greens or {})
+        forbidden = {pos: set(chars) for pos, chars in (forbidden or {}).items()}
+        bounds = {ch: [lo, hi] for ch, (lo, hi) in (counts or {}).items()}
+        for pos, ch in greens.items():
+            if not 0 <= pos < length:
+                raise ValueError(f"{length}글자 단어에 {pos + 1}번째 자리는 없습니다.")
+            if ch in forbidden.get(pos, ()):
+                raise ValueError(f"{pos + 1}번째 자리의 '{ch}' 조건이 서로 맞지 않습니다.")
+            bound = bounds.setdefault(ch, [0, None])
+            bound[0] = max(bound[0], sum(1 for other in greens.values() if other == ch))
+        for ch, (lo, hi) in bounds.items():
+            if hi is not None and lo > hi:
+                raise ValueError(f"'{ch}' 글자 수 조건이 서로 맞지 않습니다 (최소 {lo}개, 최대 {hi}개).")
+        if sum(lo for lo, _ in bounds.values()) > length:
+            raise ValueError(f"{length}글자 단어에 모두 들어갈 수 없을 만큼 많은 글자가 필요합니다.")
+        self.length = length
+        self.greens = tuple(sorted(greens.items()))
+        # 초록 자리는 글자가 이미 정해져 있고, 최대 0개인 글자는 개수 조건으로 걸러지므로 위치 검사에서 뺍니다.
+        absent = {ch for ch, (lo, hi) in bounds.items() if hi == 0}
+        self.forbidden = tuple((pos, frozenset(chars - absent)) for pos, chars in sorted(forbidden.items())
+                               if 0 <= pos < length and pos not in greens and chars - absent)
+        self.counts = tuple((ch, lo, hi) for ch, (lo, hi) in sorted(bounds.items()) if lo or hi is not None)
+        # 포함 여부만으로는 확인할 수 없는 개수 조건 (2개 이상 필요하거나, 1개 이상 허용되면서 상한이 있는 글자)
+        self.repeat_counts = tuple((ch, lo, hi) for ch, lo, hi in self.counts
+                                   if lo > 1 or (hi is not None and hi > 0))
+        self._checks = self._compile_checks(self.counts)
+        self._repeat_checks = self._compile_checks(self.repeat_counts)
+
+    @staticmethod
+    def _compile_checks(counts):
+        # a~z는 글자 수 벡터의 칸 번호로, 그 밖의 글자는 글자 그대로 둡니다.
+        return tuple((ord(ch) - 97 if "a" <= ch <= "z" else ch, lo, hi) for ch, lo, hi in counts)
+
+    @property
+    def key(self):
+        """
+        같은 조건이면 같은 값이 되는 캐시 키입니다.
+        """
+        forbidden = tuple((pos, "".join(sorted(chars))) for pos, chars in self.forbidden)
+        return (self.length, self.greens, forbidden, self.counts)
+
+    @staticmethod
+    def _counts_ok(word, vector, checks):
+        for key, lo, hi in checks:
+            count = vector[key] if key.__class__ is int else word.count(key)
+            if count < lo or (hi is not None and count > hi):
+                return False
+        return True
+
+    def matches(self, word, vector=None):
+        """
+        단어가 모든 조건을 만족하는지 확인합니다. vector는 그 단어의 letter_count_vector 값입니다. (없으면 계산)
+        """
+        if len(word) != self.length:
+            return False
+        for pos, ch in self.greens:
+            if word[pos] != ch:
+                return False
+        for pos, chars in self.forbidden:
+            if word[pos] in chars:
+                return False
+        if not self._checks:
+            return True
+        return self._counts_ok(word, vector or letter_count_vector(word), self._checks)
+
+    def filter(self, words, vectors=None):
+        """
+        단어 리스트에서 조건에 맞는 단어만 원래 순서대로 반환합니다. (순수 파이썬 기준 구현)
+        vectors를 주면 words와 같은 순서의 글자 수 벡터를 씁니다.
+        """
+        if vectors is None:
+            return [word for word in words if self.matches(word)]
+        return [word for word, vector in zip(words, vectors) if self.matches(word, vector)]
+
+# 0~255 바이트 값마다 켜져 있는 비트 위치 목록
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+def iter_bits(mask):
+    """
+    비트셋(큰 정수)에서 켜져 있는 비트 번호를 작은 순서대로 돌려줍니다.
+    """
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index << 3
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+def _drop_bits(mask, removed_desc):
+    """
+    비트셋에서 removed_desc(큰 순서) 번호의 비트를 빼고, 그 위의 비트를 한 칸씩 당깁니다.
+    """
+    for i in removed_desc:
+        mask = (mask & ((1 << i) - 1)) | ((mask >> (i + 1)) << i)
+    return mask
+
+def _remaining_words(words, removed_ids, added):
+    """
+    removed_ids 번호의 단어를 빼고 added를 끝에 붙인 새 단어 리스트를 반환합니다.
+    """
+    if not removed_ids:
+        return words + list(added)
+    drop = set(removed_ids)
+    return [word for i, word in enumerate(words) if i not in drop] + list(added)
+
+class WordIndex:
+    """
+    단어 리스트에 대한 비트셋 인덱스입니다.
+    단어 번호(리스트 위치)마다 한 비트를 쓰는 큰 정수를 아래 조건별로 미리 만들어 둡니다.
+    - (글자, 위치)마다: 그 위치에 그 글자가 있는 단어
+    - 글자마다: 그 글자를 포함하는 단어
+    - 길이마다: 그 길이의 단어
+    검색은 조건 개수만큼의 AND / AND-NOT 연산으로 끝나므로 사전 크기에 거의 영향을 받지 않습니다.
+    각 비트셋의 켜진 비트 수를 통계(stats)로 두고, 걸러내는 단어가 많은 조건부터 연산하다가
+    후보가 없어지면 바로 멈춥니다.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        size = (len(words) + 7) // 8
+        positional = {}
+        contains = {}
+        lengths = {}
+        for i, word in enumerate(words):
+            byte_index = i >> 3
+            bit = 1 << (i & 7)
+            for pos, ch in enumerate(word):
+                bits = positional.get((ch, pos))
+                if bits is None:
+                    bits = positional[(ch, pos)] = bytearray(size)
+                bits[byte_index] |= bit
+            for ch in set(word):
+                bits = contains.get(ch)
+                if bits is None:
+                    bits = contains[ch] = bytearray(size)
+                bits[byte_index] |= bit
+            bits = lengths.get(len(word))
+            if bits is None:
+                bits = lengths[len(word)] = bytearray(size)
+            bits[byte_index] |= bit
+        self.positional = {key: int.from_bytes(bits, "little") for key, bits in positional.items()}
+        self.contains = {key: int.from_bytes(bits, "little") for key, bits in contains.items()}
+        self.lengths = {key: int.from_bytes(bits, "little") for key, bits in lengths.items()}
+        self.stats = WordStats.from_bitsets(self.positional, self.contains, self.lengths)
+        self._letter_counts = None
+
+    @classmethod
+    def from_bitsets(cls, words, positional, contains, lengths):
+        """
+        미리 만들어 둔 비트셋(예: .wdb 파일에 저장된 인덱스)으로 WordIndex를 만듭니다.
+        """
+        index = cls.__new__(cls)
+        index.words = words
+        index.positional = positional
+        index.contains = contains
+        index.lengths = lengths
+        index.stats = WordStats.from_bitsets(positional, contains, lengths)
+        index._letter_counts = None
+        return index
+
+    def letter_counts(self):
+        """
+        단어마다의 글자 수 벡터(letter_count_vector) 리스트를 처음 필요할 때 만들어 반환합니다.
+        """
+        if self._letter_counts is None:
+            self._letter_counts = [letter_count_vector(word) for word in self.words]
+        return self._letter_counts
+
+    def updated(self, removed_ids=(), added=()):
+        """
+        removed_ids 번호의 단어를 지우고 added 단어를 끝에 붙인 새 인덱스를 반환합니다. 이 인덱스는 바꾸지 않으므로
+        다른 스레드에서 검색 중이어도 됩니다. 지운 단어 뒤의 번호는 그만큼 당겨집니다.
+        비트셋은 지운 비트를 빼고 추가한 비트만 켜며, 통계와 글자 수 벡터도 바뀐 단어만큼만 고칩니다.
+        """
+        removed_desc = sorted(set(removed_ids), reverse=True)
+        words = _remaining_words(self.words, removed_desc, added)
+        positional = self.positional
+        contains = self.contains
+        lengths = self.lengths
+        if removed_desc:
+            positional = {key: _drop_bits(bits, removed_desc) for key, bits in positional.items()}
+            contains = {key: _drop_bits(bits, removed_desc) for key, bits in contains.items()}
+            lengths = {key: _drop_bits(bits, removed_desc) for key, bits in lengths.items()}
+        else:
+            positional, contains, lengths = dict(positional), dict(contains), dict(lengths)
+        start = len(words) - len(added)
+        for i, word in enumerate(added, start):
+            bit = 1 << i
+            for pos, ch in enumerate(word):
+                positional[(ch, pos)] = positional.get((ch, pos), 0) | bit
+            for ch in set(word):
+                contains[ch] = contains.get(ch, 0) | bit
+            lengths[len(word)] = lengths.get(len(word), 0) | bit
+        index = self.__class__.__new__(self.__class__)
+        index.words = words
+        # 지운 단어만 켜져 있던 비트셋은 비었으므로 새로 만든 인덱스처럼 빼 둡니다.
+        index.positional = {key: bits for key, bits in positional.items() if bits} if removed_desc else positional
+        index.contains = {key: bits for key, bits in contains.items() if bits} if removed_desc else contains
+        index.lengths = {key: bits for key, bits in lengths.items() if bits}
+        index.stats = self.stats.updated(added, [self.words[i] for i in removed_desc])
+        index._letter_counts = None
+        if self._letter_counts is not None:
+            index._letter_counts = (_remaining_words(self._letter_counts, removed_desc, ())
+                                    + [letter_count_vector(word) for word in added])
+        return index
+
+    def words_for(self, mask):
+        """
+        비트셋에 해당하는 단어들을 원래 리스트 순서대로 반환합니다.
+        """
+        words = self.words
+        return [words[i] for i in iter_bits(mask)]
+
+    def filter(self, fixed_pattern, loose_letters, exclude_letters, timer=None):
+        """
+        filter_words와 같은 결과를 비트셋 연산으로 구합니다.
+        정규식으로만 해석할 수 있는 패턴이면 filter_words로 대신 검색합니다.
+        """
+        timer = timer or NULL_TIMER
+        with timer.stage("parse"):
+            query = parse_query(fixed_pattern, loose_letters, exclude_letters)
+            if query is not None:
+                plan = plan_query(query, self.stats if len(self.words) >= PLAN_MIN_WORDS else None)
+        if query is None:
+            return filter_words(self.words, fixed_pattern, loose_letters, exclude_letters, timer)
+        with timer.stage("filter"):
+            positional = self.positional
+            contains = self.contains
+            # 길이 비트셋에서 시작해 나머지 조건을 선택도 순서로 연산합니다.
+            mask = self.lengths.get(query[0], 0)
+            for kind, pos, ch in plan:
+                if not mask:
+                    return []
+                if kind == "at":
+                    mask &= positional.get((ch, pos), 0)
+                elif kind == "not_at":
+                    mask &= ~positional.get((ch, pos), 0)
+                elif kind == "has":
+                    mask &= contains.get(ch, 0)
+                elif kind == "lacks":
+                    mask &= ~contains.get(ch, 0)
+            return self.words_for(mask)
+
+    def filter_program(self, program, timer=None):
+        """
+        제약 프로그램(ConstraintProgram)에 맞는 단어를 반환합니다. 결과는 program.filter와 같습니다.
+        위치 조건과 포함/미포함 조건은 비트셋 연산으로 처리하고,
+        같은 글자 여러 개의 개수 조건만 남은 후보의 글자 수 벡터로 확인합니다.
+        """
+        timer = timer or NULL_TIMER
+        with timer.stage("filter"):
+            positional = self.positional
+            contains = self.contains
+            mask = self.lengths.get(program.length, 0)
+            for pos, ch in program.greens:
+                mask &= positional.get((ch, pos), 0)
+            for pos, chars in program.forbidden:
+                for ch in chars:
+                    mask &= ~positional.get((ch, pos), 0)
+            for ch, lo, hi in program.counts:
+                if lo:
+                    mask &= contains.get(ch, 0)
+                elif hi == 0:
+                    mask &= ~contains.get(ch, 0)
+            if not mask or not program.repeat_counts:
+                return self.words_for(mask)
+            words = self.words
+            vectors = self.letter_counts()
+            checks = program._repeat_checks
+            counts_ok = program._counts_ok
+            return [words[i] for i in iter_bits(mask) if counts_ok(words[i], vectors[i], checks)]
+
+class NumpyWordIndex:
+    """
+    NumPy로 검색하는 인덱스입니다. WordIndex와 같은 filter 메서드를 제공합니다.
+    - 단어를 길이별로 나누어 (단어 수, 글자 수) 크기의 uint8 행렬로 보관합니다.
+    - 단어마다 포함된 알파벳(a~z)을 26비트 마스크로 미리 계산해 둡니다.
+    - 큰 사전에서는 글자 빈도 통계(WordStats)로 걸러내는 단어가 많은 조건부터 검사해
+      후보가 충분히 줄면 남은 행만 골라 나머지 조건을 검사합니다.
+    - ASCII가 아닌 단어는 행렬에 넣지 않고 filter_words로 따로 검사합니다.
+    """
+
+    # 앞의 조건들의 추정 통과 비율이 이보다 작아지면 남은 후보 행만 골라냅니다.
+    COMPACT_FRACTION = 0.1
+
+    def __init__(self, words):
+        np = import_numpy()
+        if np is None:
+            raise ImportError("NumpyWordIndex를 사용하려면 numpy가 필요합니다.")
+        self.words = words
+        bucket_ids = {}
+        irregular_ids = []
+        for i, word in enumerate(words):
+            if word.isascii():
+                bucket_ids.setdefault(len(word), []).append(i)
+            else:
+                irregular_ids.append(i)
+        self.buckets = {}  # 글자 수 -> (단어 번호 배열, uint8 행렬, 알파벳 마스크 배열)
+        lengths = {}
+        positional = {}
+        contains = {}
+        for length, ids in bucket_ids.items():
+            matrix, letter_masks = self._encode_rows([words[i] for i in ids], length)
+            self.buckets[length] = (np.array(ids, dtype=np.int64), matrix, letter_masks)
+            lengths[length] = len(ids)
+            for pos in range(length):
+                counts = np.bincount(matrix[:, pos], minlength=128)
+                positional.update(((chr(code), pos, length), int(counts[code]))
+                                  for code in np.flatnonzero(counts).tolist())
+            for bit in range(26):
+                count = int(np.count_nonzero(letter_masks & np.uint32(1 << bit)))
+                if count:
+                    contains[(chr(97 + bit), length)] = count
+        self.irregular_ids = irregular_ids
+        self.stats = WordStats(lengths, positional, contains)  # ASCII 단어 기준
+        self._count_matrices = {}  # 글자 수 -> (단어 수, 26) uint8 글자 수 행렬, 처음 필요할 때 만듭니다.
+
+    @staticmethod
+    def _encode_rows(words, length):
+        """
+        같은 길이의 ASCII 단어들을 (uint8 글자 행렬, 알파벳 마스크 배열)로 바꿉니다.
+        """
+        np = import_numpy()
+        data = "".join(words).encode("ascii")
+        matrix = np.frombuffer(data, dtype=np.uint8).reshape(len(words), length)
+        is_alpha = (matrix >= 97) & (matrix <= 122)
+        shifts = np.where(is_alpha, matrix.astype(np.uint32) - 97, 0).astype(np.uint32)
+        bits = np.where(is_alpha, np.left_shift(np.uint32(1), shifts), np.uint32(0))
+        return matrix, np.bitwise_or.reduce(bits, axis=1)
+
+    def updated(self, removed_ids=(), added=()):
+        """
+        removed_ids 번호의 단어를 지우고 added 단어를 끝에 붙인 새 인덱스를 반환합니다. 이 인덱스는 바꾸지 않습니다.
+        바뀐 길이의 행렬만 행을 빼거나 덧붙이고, 나머지 길이는 배열을 그대로 함께 씁니다.
+        """
+        np = import_numpy()
+        removed = sorted(set(removed_ids))
+        words = _remaining_words(self.words, removed, added)
+        removed_array = np.array(removed, dtype=np.int64)
+        start = len(words) - len(added)
+        added_ids = {}
+        irregular_added = []
+        for i, word in enumerate(added, start):
+            if word.isascii():
+                added_ids.setdefault(len(word), []).append(i)
+            else:
+                irregular_added.append(i)
+        buckets = {}
+        count_matrices = {}
+        for length, (ids, matrix, letter_masks) in self.buckets.items():
+            changed = length in added_ids
+            if removed:
+                keep = ~np.isin(ids, removed_array)
+                if not keep.all():
+                    ids, matrix, letter_masks = ids[keep], matrix[keep], letter_masks[keep]
+                    changed = True
+                ids = ids - np.searchsorted(removed_array, ids)
+            if len(ids):
+                buckets[length] = (ids, matrix, letter_masks)
+            if not changed and length in self._count_matrices:
+                count_matrices[length] = self._count_matrices[length]
+        for length, new_ids in added_ids.items():
+            matrix, letter_masks = self._encode_rows([words[i] for i in new_ids], length)
+            new_ids = np.array(new_ids, dtype=np.int64)
+            if length in buckets:
+                ids, old_matrix, old_masks = buckets[length]
+                new_ids = np.concatenate((ids, new_ids))
+                matrix = np.concatenate((old_matrix, matrix))
+                letter_masks = np.concatenate((old_masks, letter_masks))
+            buckets[length] = (new_ids, matrix, letter_masks)
+        removed_set = set(removed)
+        irregular = [i - bisect_left(removed, i) for i in self.irregular_ids if i not in removed_set]
+        index = self.__class__.__new__(self.__class__)
+        index.words = words
+        index.buckets = buckets
+        index.irregular_ids = irregular + irregular_added
+        index.stats = self.stats.updated([word for word in added if word.isascii()],
+                                         [self.words[i] for i in removed if self.words[i].isascii()])
+        index._count_matrices = count_matrices
+        return index
+
+    def count_matrix(self, length):
+        """
+        length 글자 단어들의 알파벳(a~z)별 글자 수를 (단어 수, 26) uint8 행렬로 반환합니다.
+        행 순서는 buckets[length]의 행렬과 같습니다.
+        """
+        counts = self._count_matrices.get(length)
+        if counts is None:
+            np = import_numpy()
+            matrix = self.buckets[length][1]
+            counts = np.zeros((len(matrix), 26), dtype=np.uint8)
+            rows = np.arange(len(matrix))
+            for pos in range(length):
+                column = matrix[:, pos]
+                is_alpha = (column >= 97) & (column <= 122)
+                # 한 열에서는 행마다 한 칸만 더하므로 중복 없는 인덱스 덧셈으로 충분합니다.
+                counts[rows[is_alpha], column[is_alpha] - 97] += 1
+            self._count_matrices[length] = counts
+        return counts
+
+    def _lead_rows(self, query, matrix, letter_masks):
+        """
+        plan_query 순서대로 조건을 검사하다가 통과 비율이 COMPACT_FRACTION 밑으로 추정되면
+        그때까지 통과한 행 번호를 반환합니다. 그만큼 줄일 조건이 없으면 None을 반환합니다.
+        """
+        np = import_numpy()
+        pattern_length = query[0]
+        mask = None
+        estimate = 1.0
+        for predicate in plan_query(query, self.stats):
+            kind, pos, ch = predicate
+            if kind == "length" or not ch.isascii():
+                continue
+            if kind in ("has", "lacks") and "a" <= ch <= "z":
+                bit = np.uint32(1 << (ord(ch) - 97))
+                keep = (letter_masks & bit) != 0 if kind == "has" else (letter_masks & bit) == 0
+            elif kind == "lacks":
+                keep = (matrix != ord(ch)).all(axis=1)
+            else:
+                keep = matrix[:, pos] == ord(ch) if kind == "at" else matrix[:, pos] != ord(ch)
+            mask = keep if mask is None else mask & keep
+            estimate *= self.stats.selectivity(predicate, pattern_length)
+            if estimate < self.COMPACT_FRACTION:
+                return np.flatnonzero(mask)
+        return None
+
+    def filter(self, fixed_pattern, loose_letters, exclude_letters, timer=None):
+        """
+        filter_words와 같은 결과를 벡터 연산으로 구합니다.
+        정규식으로만 해석할 수 있는 패턴이면 filter_words로 대신 검색합니다.
+        """
+        np = import_numpy()
+        timer = timer or NULL_TIMER
+        with timer.stage("parse"):
+            query = parse_query(fixed_pattern, loose_letters, exclude_letters)
+        if query is None:
+            return filter_words(self.words, fixed_pattern, loose_letters, exclude_letters, timer)
+        pattern_length, fixed, exclude_set, loose_map = query
+        with timer.stage("filter"):
+            ids = []
+            bucket = self.buckets.get(pattern_length)
+            if bucket is not None:
+                bucket_ids, matrix, letter_masks = bucket
+                if len(bucket_ids) >= PLAN_MIN_WORDS:
+                    # 큰 사전에서는 선택도가 높은 조건으로 먼저 후보 행을 줄이고, 남은 행에서 모든 조건을 검사합니다.
+                    rows = self._lead_rows(query, matrix, letter_masks)
+                    if rows is not None:
+                        bucket_ids, matrix, letter_masks = bucket_ids[rows], matrix[rows], letter_masks[rows]
+                mask = np.ones(len(bucket_ids), dtype=bool)
+                for pos, ch in fixed:
+                    if not ch.isascii():
+                        mask[:] = False
+                        break
+                    mask &= matrix[:, pos] == ord(ch)
+                # a~z는 알파벳 마스크로 한 번에, 그 밖의 ASCII 문자는 열마다 비교합니다.
+                exclude_bits = 0
+                for ch in exclude_set:
+                    if "a" <= ch <= "z":
+                        exclude_bits |= 1 << (ord(ch) - 97)
+                    elif ch.isascii():
+                        for pos in range(pattern_length):
+                            mask &= matrix[:, pos] != ord(ch)
+                loose_bits = 0
+                for letter, bad_positions in loose_map.items():
+                    loose_bits |= 1 << (ord(letter) - 97)
+                    for pos in bad_positions:
+                        if 0 <= pos < pattern_length:
+                            mask &= matrix[:, pos] != ord(letter)
+                if exclude_bits:
+                    mask &= (letter_masks & exclude_bits) == 0
+                if loose_bits:
+                    mask &= (letter_masks & loose_bits) == loose_bits
+                ids = bucket_ids[mask].tolist()
+            if self.irregular_ids:
+                words = self.words
+                matched = set(filter_words([words[i] for i in self.irregular_ids],
+                                           fixed_pattern, loose_letters, exclude_letters))
+                if matched:
+                    ids = sorted(ids + [i for i in self.irregular_ids if words[i] in matched])
+            words = self.words
+            return [words[i] for i in ids]
+
+    def filter_program(self, program, timer=None):
+        """
+        제약 프로그램(ConstraintProgram)에 맞는 단어를 벡터 연산으로 구합니다. 결과는 program.filter와 같습니다.
+        포함/미포함 조건은 알파벳 마스크로, 같은 글자 여러 개의 개수 조건은 글자 수 행렬(count_matrix)로 확인합니다.
+        """
+        np = import_numpy()
+        timer = timer or NULL_TIMER
+        with timer.stage("filter"):
+            ids = []
+            length = program.length
+            bucket = self.buckets.get(length)
+            if bucket is not None:
+                bucket_ids, matrix, letter_masks = bucket
+                mask = np.ones(len(bucket_ids), dtype=bool)
+                for pos, ch in program.greens:
+                    if not ch.isascii():
+                        mask[:] = False
+                        break
+                    mask &= matrix[:, pos] == ord(ch)
+                for pos, chars in program.forbidden:
+                    for ch in chars:
+                        if ch.isascii():
+                            mask &= matrix[:, pos] != ord(ch)
+                present_bits = absent_bits = 0
+                repeat = []
+                for ch, lo, hi in program.counts:
+                    if not ch.isascii():
+                        if lo:
+                            mask[:] = False
+                        continue
+                    if (lo, hi) in ((1, None), (0, 0)) and "a" <= ch <= "z":
+                        bit = 1 << (ord(ch) - 97)
+                        if lo:
+                            present_bits |= bit
+                        else:
+                            absent_bits |= bit
+                    else:
+                        repeat.append((ch, lo, hi))
+                if present_bits:
+                    mask &= (letter_masks & present_bits) == present_bits
+                if absent_bits:
+                    mask &= (letter_masks & absent_bits) == 0
+                if repeat and mask.any():
+                    counts = None
+                    for ch, lo, hi in repeat:
+                        if "a" <= ch <= "z":
+                            if counts is None:
+                                counts = self.count_matrix(length)
+                            column = counts[:, ord(ch) - 97]
+                        else:
+                            column = (matrix == ord(ch)).sum(axis=1)
+                        if lo:
+                            mask &= column >= lo
+                        if hi is not None:
+                            mask &= column <= hi
+                ids = bucket_ids[mask].tolist()
+            if self.irregular_ids:
+                words = self.words
+                extra = [i for i in self.irregular_ids if program.matches(words[i])]
+                if extra:
+                    ids = sorted(ids + extra)
+            words = self.words
+            return [words[i] for i in ids]
+
+def _merge_stats(stats_list):
+    """
+    길이가 서로 다른 묶음들의 통계를 하나로 합칩니다. (통계의 키에 글자 수가 들어 있어 겹치지 않습니다.)
+    """
+    lengths = {}
+    positional = {}
+    contains = {}
+    for stats in stats_list:
+        lengths.update(stats.lengths)
+        positional.update(stats.positional)
+        contains.update(stats.contains)
+    return WordStats(lengths, positional, contains)
+
+class LengthBucketIndex:
+    """
+    단어를 글자 수별 묶음(bucket)으로 나누고, 묶음마다 따로 만든 인덱스(기본값: WordIndex)로 검색합니다.
+    WordIndex와 같은 filter / filter_program / updated 메서드를 제공합니다.
+    - 검색 조건의 글자 수에 해당하는 묶음 하나만 검사하므로, 길이가 섞인 큰 사전(예: dwyl 전체 목록)에서
+      다른 길이의 단어는 아예 보지 않습니다. 비트셋도 그 묶음의 단어 수만큼만 길어집니다.
+    - 묶음 안에서는 원래 목록 순서를 유지하므로 결과 순서는 filter_words와 같습니다.
+    """
+
+    def __init__(self, words, factory=WordIndex):
+        self.words = words
+        self.factory = factory
+        self.bucket_ids = {}  # 글자 수 -> 그 길이 단어들의 원래 목록 번호 (오름차순)
+        for i, word in enumerate(words):
+            self.bucket_ids.setdefault(len(word), []).append(i)
+        self.buckets = {length: factory([words[i] for i in ids]) for length, ids in self.bucket_ids.items()}
+        self.stats = _merge_stats(bucket.stats for bucket in self.buckets.values())
+
+    @classmethod
+    def from_buckets(cls, words, bucket_ids, buckets, factory=WordIndex):
+        """
+        미리 만들어 둔 묶음(예: .wdb 파일에 저장된 글자 수별 WordIndex)으로 LengthBucketIndex를 만듭니다.
+        bucket_ids는 글자 수 -> 그 길이 단어들의 원래 목록 번호(오름차순), buckets는 글자 수 -> 묶음 인덱스입니다.
+        """
+        index = cls.__new__(cls)
+        index.words = words
+        index.factory = factory
+        index.bucket_ids = bucket_ids
+        index.buckets = buckets
+        index.stats = _merge_stats(bucket.stats for bucket in buckets.values())
+        return index
+
+    def filter(self, fixed_pattern, loose_letters, exclude_letters, timer=None):
+        """
+        filter_words와 같은 결과를 패턴 글자 수의 묶음 하나에서만 구합니다.
+        """
+        bucket = self.buckets.get(len(fixed_pattern.replace(" ", "")))
+        if bucket is None:
+            return []
+        return bucket.filter(fixed_pattern, loose_letters, exclude_letters, timer)
+
+    def filter_program(self, program, timer=None):
+        """
+        제약 프로그램(ConstraintProgram)에 맞는 단어를 그 글자 수의 묶음 하나에서만 구합니다.
+        """
+        bucket = self.buckets.get(program.length)
+        if bucket is None:
+            return []
+        return bucket.filter_program(program, timer)
+
+    def updated(self, removed_ids=(), added=()):
+        """
+        removed_ids 번호의 단어를 지우고 added 단어를 끝에 붙인 새 인덱스를 반환합니다. 이 인덱스는 바꾸지 않습니다.
+        바뀐 길이의 묶음만 그 묶음의 updated로 고치고, 나머지 묶음은 그대로 함께 씁니다.
+        """
+        removed = sorted(set(removed_ids))
+        words = _remaining_words(self.words, removed, added)
+        removed_local = {}
+        for i in removed:
+            length = len(self.words[i])
+            removed_local.setdefault(length, []).append(bisect_left(self.bucket_ids[length], i))
+        added_by_length = {}
+        for i, word in enumerate(added, len(words) - len(added)):
+            added_by_length.setdefault(len(word), []).append(i)
+        removed_set = set(removed)
+        bucket_ids = {}
+        buckets = {}
+        for length in set(self.bucket_ids) | set(added_by_length):
+            ids = self.bucket_ids.get(length, [])
+            if removed:
+                ids = [i - bisect_left(removed, i) for i in ids if i not in removed_set]
+            new_ids = added_by_length.get(length, [])
+            ids = ids + new_ids
+            if not ids:
+                continue
+            bucket_ids[length] = ids
+            bucket = self.buckets.get(length)
+            if bucket is None:
+                bucket = self.factory([words[i] for i in ids])
+            elif length in removed_local or new_ids:
+                bucket = bucket.updated(removed_local.get(length, ()), [words[i] for i in new_ids])
+            buckets[length] = bucket
+        index = self.__class__.__new__(self.__class__)
+        index.words = words
+        index.factory = self.factory
+        index.bucket_ids = bucket_ids
+        index.buckets = buckets
+        index.stats = _merge_stats(bucket.stats for bucket in buckets.values())
+        return index
+
+def build_index(words, backend=None):
+    """
+    단어 리스트에 대한 검색 인덱스를 만듭니다.
+    backend는 "bitset"(글자 수별 WordIndex 묶음, LengthBucketIndex), "numpy"(NumpyWordIndex) 또는 None(자동 선택)입니다.
+    NumPy가 설치되어 있지 않으면 어느 경우든 순수 파이썬 엔진인 LengthBucketIndex를 사용합니다.
+    """
+    if backend is None:
+        backend = "numpy"
+    if backend == "numpy":
+        if import_numpy() is None:
+            return LengthBucketIndex(words)
+        return NumpyWordIndex(words)
+    if backend == "bitset":
+        return LengthBucketIndex(words)
+    raise ValueError(f"알 수 없는 검색 엔진입니다: {backend}")
+
+def canonical_query(fixed_pattern, loose_letters, exclude_letters):
+    """
+    같은 결과를 내는 검색 조건이 같은 값이 되도록 정리한 캐시 키를 반환합니다.
+    글자는 정렬하고 중복은 합치며, 위치는 parse_loose_letters 기준(0부터)으로 단어 길이 밖의 값은 버립니다.
+    반환값: (글자 수, ((위치, 글자), ...), (제외 글자, ...), ((유동 글자, (금지 위치, ...)), ...))
+    정규식으로만 해석할 수 있는 패턴이면 None을 반환합니다.
+    """
+    query = parse_query(fixed_pattern, loose_letters, exclude_letters)
+    if query is None:
+        return None
+    pattern_length, fixed, exclude_set, loose_map = query
+    loose = tuple(sorted((letter, tuple(sorted({pos for pos in positions if 0 <= pos < pattern_length})))
+                         for letter, positions in loose_map.items()))
+    return pattern_length, tuple(fixed), tuple(sorted(exclude_set)), loose
+
+def _query_conditions(key):
+    """
+    canonical_query 키를 포함 관계를 빠르게 비교할 수 있는 (글자 수, 고정 글자 집합, 제외 글자 집합, 유동 글자 딕셔너리)로 바꿉니다.
+    """
+    return key[0], frozenset(key[1]), frozenset(key[2]), {letter: frozenset(positions) for letter, positions in key[3]}
+
+def is_narrower(narrow, wide):
+    """
+    canonical_query 키 narrow의 조건이 wide의 조건을 모두 포함하는지 확인합니다.
+    참이면 narrow의 검색 결과는 항상 wide의 검색 결과 안에 있습니다.
+    """
+    return _conditions_narrower(_query_conditions(narrow), _query_conditions(wide))
+
+def _conditions_narrower(narrow, wide):
+    if narrow[0] != wide[0] or not wide[1] <= narrow[1] or not wide[2] <= narrow[2]:
+        return False
+    narrow_loose = narrow[3]
+    for letter, positions in wide[3].items():
+        if letter not in narrow_loose or not positions <= narrow_loose[letter]:
+            return False
+    return True
+
+class QueryCache:
+    """
+    검색 인덱스 앞에 두는 검색 결과 캐시입니다. 인덱스와 같은 filter 메서드를 제공합니다.
+    - 검색 조건을 canonical_query로 정리한 값을 키로 쓰므로, 글자 순서나 중복만 다른 조건은 같은 결과를 씁니다.
+    - 최대 maxsize개의 결과를 기억하고, 가장 오래 쓰이지 않은 결과부터 버립니다(LRU).
+    - 캐시에 없는 조건이라도 최근 NARROW_SCAN개의 결과 중 그보다 넓은(조건이 적은) 검색이 있으면
+      전체 사전 대신 그 결과 중 가장 작은 것만 filter_words로 다시 거릅니다.
+      (한 턴마다 조건이 늘어나므로 보통 바로 전 검색의 결과를 좁히게 됩니다.)
+      다시 거를 단어가 사전의 NARROW_FRACTION 비율보다 많으면 인덱스로 검색하는 편이 빠르므로 좁히지 않습니다.
+    - hits(같은 조건), narrowed(좁혀서 검색), misses(전체 검색) 횟수를 셉니다. stats() 참고
+    - 반환되는 리스트는 캐시된 객체이므로 호출하는 쪽에서 수정하면 안 됩니다.
+    여러 스레드에서 같이 사용해도 됩니다.
+    """
+
+    NARROW_SCAN = 32
+    NARROW_FRACTION = 0.01
+
+    def __init__(self, index, maxsize=256):
+        self.index = index
+        self.words = index.words
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # 캐시 키 -> (검색 결과, _query_conditions 값 또는 None)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+
+    def filter(self, fixed_pattern, loose_letters, exclude_letters, timer=None):
+        """
+        filter_words와 같은 결과를 캐시를 거쳐 반환합니다.
+        """
+        timer = timer or NULL_TIMER
+        with timer.stage("parse"):
+            key = canonical_query(fixed_pattern, loose_letters, exclude_letters)
+            if key is None:
+                # 정규식 패턴은 입력 그대로를 키로 쓰고, 좁혀서 검색하지 않습니다.
+                key = ("regex", fixed_pattern.replace(" ", "").lower(), loose_letters.strip(), exclude_letters.strip())
+            conditions = None if key[0] == "regex" else _query_conditions(key)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+            base = None
+            narrow_limit = len(self.words) * self.NARROW_FRACTION
+            if conditions is not None:
+                for scanned, other in enumerate(reversed(self._entries)):
+                    if scanned >= self.NARROW_SCAN:
+                        break
+                    result, other_conditions = self._entries[other]
+                    if (other_conditions is not None and len(result) <= narrow_limit
+                            and (base is None or len(result) < len(base))
+                            and _conditions_narrower(conditions, other_conditions)):
+                        base = result
+        if base is not None:
+            result = filter_words(base, fixed_pattern, loose_letters, exclude_letters, timer,
+                                  getattr(self.index, "stats", None))
+        else:
+            result = self.index.filter(fixed_pattern, loose_letters, exclude_letters, timer)
+        with self._lock:
+            if base is not None:
+                self.narrowed += 1
+            else:
+                self.misses += 1
+            self._entries[key] = (result, conditions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def filter_program(self, program, timer=None):
+        """
+        제약 프로그램(ConstraintProgram)에 맞는 단어를 캐시를 거쳐 반환합니다. (좁혀서 검색하지는 않습니다)
+        """
+        key = ("program",) + program.key
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+        result = self.index.filter_program(program, timer)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (result, None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """
+        기억해 둔 검색 결과와 횟수를 모두 지웁니다.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.narrowed = self.misses = 0
+
+    def stats(self):
+        """
+        모니터링용 캐시 상태를 딕셔너리로 반환합니다.
+        """
+        with self._lock:
+            lookups = self.hits + self.narrowed + self.misses
+            return {"hits": self.hits, "narrowed": self.narrowed, "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+def letter_offsets(sorted_words):
+    """
+    알파벳순 단어 리스트에서 첫 글자가 바뀌는 위치를 [(첫 글자, 시작 위치), ...]로 반환합니다.
+    (.wdb 파일에 보기마다 저장해 두는 표와 같은 모양입니다.)
+    """
+    offsets = []
+    for i, word in enumerate(sorted_words):
+        if not offsets or offsets[-1][0] != word[0]:
+            offsets.append((word[0], i))
+    return offsets
+
+def is_empty_query(fixed_pattern, loose_letters, exclude_letters):
+    """
+    세 조건이 모두 비어 있는지 확인합니다. 비어 있으면 전체 단어 목록을 보여줍니다.
+    """
+    return not fixed_pattern.strip() and not loose_letters.strip() and not exclude_letters.strip()
+
+def search(index, fixed_pattern, loose_letters, exclude_letters, timer=None):
+    """
+    GUI의 검색 버튼과 같은 규칙으로 검색합니다.
+    조건이 모두 비어 있으면 전체 단어를 알파벳순으로, 아니면 조건에 맞는 단어를 반환합니다.
+    timer(wordleTrace.StageTimer)를 주면 단계별 시간을 기록합니다.
+    """
+    fixed_pattern = fixed_pattern.strip()
+    loose_letters = loose_letters.strip()
+    exclude_letters = exclude_letters.strip()
+    if is_empty_query(fixed_pattern, loose_letters, exclude_letters):
+        with (timer or NULL_TIMER).stage("sort"):
+            return sorted(index.words)
+    return index.filter(fixed_pattern, loose_letters, exclude_letters, timer)
+
+# =========================
+# 글자 묶음 검색 (애너그램)
+# =========================
+
+# 단어의 글자 마스크에서 a~z 밖의 글자(예: é)를 모두 나타내는 비트 번호
+OTHER_LETTER_BIT = 26
+
+def letter_signature(word):
+    """
+    단어의 글자를 정렬한 문자열(서명)을 반환합니다. 서로 애너그램인 단어는 서명이 같습니다.
+    """
+    return "".join(sorted(word))
+
+def letter_mask(letters):
+    """
+    글자들의 26비트 마스크를 반환합니다. (a가 0번 비트, a~z 밖의 글자는 OTHER_LETTER_BIT)
+    """
+    mask = 0
+    for ch in letters:
+        code = ord(ch) - 97
+        mask |= 1 << (code if 0 <= code < 26 else OTHER_LETTER_BIT)
+    return mask
+
+def parse_letter_rack(text):
+    """
+    글자 묶음 입력을 (방식, 글자들)로 읽습니다. 글자가 아닌 문자(쉼표, 공백 등)는 무시합니다.
+    - "aerst": 이 글자들로(각 글자는 적힌 개수까지) 만들 수 있는 단어 ("formable")
+    - "+qz":  이 글자들을 적힌 개수 이상 모두 포함하는 단어 ("containing")
+    - "=least": 이 글자들의 애너그램 ("anagram")
+    """
+    text = text.strip().lower()
+    mode = {"+": "containing", "=": "anagram"}.get(text[:1], "formable")
+    if mode != "formable":
+        text = text[1:]
+    return mode, "".join(ch for ch in text if ch.isalpha())
+
+def _signature_repeats(signature):
+    """
+    서명에서 글자 마스크만으로는 확인할 수 없는 ((글자, 개수), ...)를 반환합니다.
+    두 번 이상 나오는 글자와, 마스크에서 한 비트로 합쳐지는 a~z 밖의 글자입니다.
+    """
+    # 서명은 정렬되어 있으므로 첫 글자와 마지막 글자만 보면 모두 a~z인지 알 수 있습니다.
+    if not signature or (len(set(signature)) == len(signature) and "a" <= signature[0] and signature[-1] <= "z"):
+        return ()
+    counts = {}
+    for ch in signature:
+        counts[ch] = counts.get(ch, 0) + 1
+    return tuple((ch, n) for ch, n in counts.items() if n > 1 or not "a" <= ch <= "z")
+
+class AnagramIndex:
+    """
+    글자 묶음(멀티셋)으로 단어를 찾는 인덱스입니다.
+    - 서명(letter_signature)이 같은 단어를 한 묶음으로 모으므로, 애너그램은 사전 조회 한 번입니다.
+    - 26비트 글자 마스크(letter_mask)의 비트마다 "그 글자가 있는 서명" 비트셋을 만들어 둡니다.
+      만들 수 있는 단어는 묶음에 없는 글자의 비트셋을 빼는 AND-NOT 연산으로,
+      포함하는 단어는 필요한 글자의 비트셋 AND 연산으로 후보를 구합니다.
+    - 같은 글자가 두 번 이상 나오는 경우의 개수만 남은 후보에서 확인합니다. (repeats)
+    단어마다 Counter를 만들어 비교하는 방식보다 확장 목록에서 수백 배 빠릅니다.
+    결과는 원래 단어 리스트 순서입니다.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self.by_signature = {}   # 서명 -> 서명 번호
+        self.signatures = []     # 서명 번호 -> 서명
+        self.groups = []         # 서명 번호 -> 그 서명을 가진 단어들의 목록 번호 (오름차순)
+        self.word_signatures = []  # 단어 목록 번호 -> 서명 번호
+        by_signature = self.by_signature
+        for i, word in enumerate(words):
+            signature = letter_signature(word)
+            number = by_signature.get(signature)
+            if number is None:
+                number = by_signature[signature] = len(self.signatures)
+                self.signatures.append(signature)
+                self.groups.append([])
+            self.groups[number].append(i)
+            self.word_signatures.append(number)
+        # 서명 번호 -> 개수를 따로 확인해야 하는 ((글자, 개수), ...)
+        self.repeats = [_signature_repeats(signature) for signature in self.signatures]
+        size = (len(self.signatures) + 7) // 8
+        letter_bits = [bytearray(size) for _ in range(OTHER_LETTER_BIT + 1)]
+        length_bits = {}
+        for number, signature in enumerate(self.signatures):
+            byte_index = number >> 3
+            bit = 1 << (number & 7)
+            for ch in set(signature):
+                code = ord(ch) - 97
+                letter_bits[code if 0 <= code < 26 else OTHER_LETTER_BIT][byte_index] |= bit
+            bits = length_bits.get(len(signature))
+            if bits is None:
+                bits = length_bits[len(signature)] = bytearray(size)
+            bits[byte_index] |= bit
+        # 글자 비트 -> 그 글자가 있는 서명 비트셋, 글자 수 -> 그 길이의 서명 비트셋
+        self.letter_bits = [int.from_bytes(bits, "little") for bits in letter_bits]
+        self.length_bits = {key: int.from_bytes(bits, "little") for key, bits in length_bits.items()}
+
+    def _add_signature(self, signature):
+        """
+        새 서명을 추가하고 서명 번호를 반환합니다. (updated에서 새 단어의 서명이 처음 나올 때 사용)
+        """
+        number = self.by_signature[signature] = len(self.signatures)
+        self.signatures.append(signature)
+        self.groups.append([])
+        self.repeats.append(_signature_repeats(signature))
+        bit = 1 << number
+        for letter in iter_bits(letter_mask(signature)):
+            self.letter_bits[letter] |= bit
+        self.length_bits[len(signature)] = self.length_bits.get(len(signature), 0) | bit
+        return number
+
+    def updated(self, removed_ids=(), added=()):
+        """
+        removed_ids 번호의 단어를 지우고 added 단어를 끝에 붙인 새 인덱스를 반환합니다. 이 인덱스는 바꾸지 않습니다.
+        서명 번호는 그대로 두고(비게 된 묶음도 남겨 둡니다), 지운 번호 뒤의 단어가 든 묶음만 번호를 고칩니다.
+        텍스트 파일에서 만든 목록은 사용자 단어가 끝에 있으므로 대부분의 묶음은 그대로 함께 씁니다.
+        """
+        removed = sorted(set(removed_ids))
+        words = _remaining_words(self.words, removed, added)
+        index = self.__class__.__new__(self.__class__)
+        index.words = words
+        index.by_signature = dict(self.by_signature)
+        index.signatures = list(self.signatures)
+        index.groups = list(self.groups)
+        index.repeats = list(self.repeats)
+        index.letter_bits = list(self.letter_bits)
+        index.length_bits = dict(self.length_bits)
+        word_signatures = self.word_signatures
+        if removed:
+            removed_set = set(removed)
+            first = removed[0]
+            for number in set(word_signatures[first:]):
+                index.groups[number] = [i - bisect_left(removed, i) for i in self.groups[number]
+                                        if i not in removed_set]
+            word_signatures = word_signatures[:first] + [
+                number for i, number in enumerate(word_signatures[first:], first) if i not in removed_set]
+        index.word_signatures = list(word_signatures)
+        start = len(words) - len(added)
+        for i, word in enumerate(added, start):
+            signature = letter_signature(word)
+            number = index.by_signature.get(signature)
+            if number is None:
+                number = index._add_signature(signature)
+            # 다른 인덱스와 나눠 쓰는 묶음 리스트는 고치지 않고 새로 만듭니다.
+            index.groups[number] = index.groups[number] + [i]
+            index.word_signatures.append(number)
+        return index
+
+    def _collect(self, numbers):
+        """
+        서명 번호들의 단어를 원래 리스트 순서대로 반환합니다.
+        """
+        groups = self.groups
+        ids = [i for number in numbers for i in groups[number]]
+        ids.sort()
+        words = self.words
+        return [words[i] for i in ids]
+
+    def anagrams(self, letters):
+        """
+        letters의 글자를 모두 정확히 한 번씩 쓰는 단어(애너그램)를 반환합니다.
+        """
+        number = self.by_signature.get(letter_signature(letters.lower()))
+        return [] if number is None else self._collect([number])
+
+    def formable(self, rack, length=None):
+        """
+        rack의 글자만으로(같은 글자는 rack에 있는 개수까지) 만들 수 있는 단어를 반환합니다.
+        length를 주면 그 길이의 단어만 찾습니다.
+        """
+        rack = rack.lower()
+        rack_mask = letter_mask(rack)
+        mask = (1 << len(self.signatures)) - 1 if length is None else self.length_bits.get(length, 0)
+        for letter, bits in enumerate(self.letter_bits):
+            if not rack_mask >> letter & 1:
+                mask &= ~bits
+        if not mask:
+            return []
+        rack_counts = {}
+        for ch in rack:
+            rack_counts[ch] = rack_counts.get(ch, 0) + 1
+        signatures = self.signatures
+        repeats = self.repeats
+        size = len(rack)
+        numbers = [number for number in iter_bits(mask) if len(signatures[number]) <= size
+                   and all(rack_counts.get(ch, 0) >= n for ch, n in repeats[number])]
+        return self._collect(numbers)
+
+    def containing(self, letters, length=None):
+        """
+        letters의 글자를 모두(같은 글자는 적힌 개수 이상) 포함하는 단어를 반환합니다.
+        length를 주면 그 길이의 단어만 찾습니다.
+        """
+        letters = letters.lower()
+        mask = (1 << len(self.signatures)) - 1 if length is None else self.length_bits.get(length, 0)
+        needed = {}
+        for ch in letters:
+            needed[ch] = needed.get(ch, 0) + 1
+        for ch in needed:
+            code = ord(ch) - 97
+            mask &= self.letter_bits[code if 0 <= code < 26 else OTHER_LETTER_BIT]
+        if not mask:
+            return []
+        checks = [(ch, n) for ch, n in needed.items() if n > 1 or not "a" <= ch <= "z"]
+        signatures = self.signatures
+        numbers = iter_bits(mask)
+        if checks:
+            numbers = [number for number in numbers if all(signatures[number].count(ch) >= n for ch, n in checks)]
+        return self._collect(numbers)
+
+    def search(self, mode, letters, length=None):
+        """
+        parse_letter_rack의 방식("formable", "containing", "anagram")으로 검색합니다.
+        """
+        if mode == "anagram":
+            return self.anagrams(letters)
+        if mode == "containing":
+            return self.containing(letters, length)
+        return self.formable(letters, length)
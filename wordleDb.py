@@ -0,0 +1,243 @@
+"""
+단어 파일들을 하나의 이진 사전 파일(.wdb)로 컴파일하고 읽는 모듈입니다.
+
+.wdb 파일은 words.txt, extended_words.txt, user_words.txt를 한 번에 담으며,
+텍스트를 줄마다 strip()/lower()/주석 검사할 필요 없이 mmap 한 번으로 읽습니다.
+
+파일 구조:
+    b"WDB1" + uint32 메타데이터 길이 + 메타데이터(JSON) + 0으로 채운 정렬 여백 + 데이터 영역
+    매직 바이트는 그대로 두고 형식이 바뀔 때마다 메타데이터의 "version"(_VERSION, 현재 3)을 올립니다.
+    버전이 다른 .wdb는 읽지 않으므로 (WordStore는 텍스트 파일을 읽고) 다시 컴파일하면 됩니다.
+데이터 영역:
+    - 단어 레코드: 중복을 제거한 전체 단어를 (UTF-8) 바이트 길이별 묶음으로 나누어
+      묶음마다 알파벳순 고정 폭 레코드로 저장합니다. 전체 단어 번호는 묶음 순서를 따릅니다.
+    - 보기(base = 기본 + 사용자, extended = 확장 + 사용자)마다:
+      보기 순서대로의 단어 번호 배열(uint32), 알파벳순 목록용 보기 안 순번 배열(uint32)과
+      첫 글자별 시작 위치 표(메타데이터), 글자 수별 묶음마다 그 길이 단어의 보기 안 순번 배열(uint32)과
+      WordIndex 비트셋(묶음 안 순번 기준) (불러오면 LengthBucketIndex가 됩니다.)
+보기의 단어 순서는 WordStore가 텍스트 파일을 읽을 때와 같습니다. (중복을 뺀 기본/확장 파일 순서 다음에
+그 목록에 없는 사용자 단어를 사용자 파일 순서대로) 그래서 .wdb가 있든 없든 검색 결과 순서, 빈도순 정렬의
+동점 순서, 시뮬레이션의 first 정책이 같습니다. 알파벳순 정렬은 조건 없는 전체 목록(alphabetical)에만 씁니다.
+메타데이터에는 컴파일할 때 원본 파일들의 (수정 시각, 크기)를 기록해 두어,
+원본이 바뀐 .wdb는 사용하지 않고 텍스트 파일을 대신 읽습니다.
+
+사용 예:
+    python wordleDb.py               # words.wdb를 만듭니다.
+    python wordleDb.py -o my.wdb
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from wordleCore import (LengthBucketIndex, WordIndex, _file_signature, add_word_file_arguments, letter_offsets,
+                        read_word_file, word_file_paths)
+
+_MAGIC = b"WDB1"
+_VERSION = 3
+_ALIGN = 8
+
+DEFAULT_DB_PATH = "words.wdb"
+
+# 단어가 어느 원본 파일에 있는지 나타내는 비트
+SOURCE_FLAGS = {"base": 1, "extended": 2, "user": 4}
+# 보기 이름 -> 그 보기에 들어가는 원본 파일 종류
+VIEWS = {"base": ("base", "user"), "extended": ("extended", "user")}
+
+def view_name(use_extended):
+    return "extended" if use_extended else "base"
+
+def compile_database(paths, out_path=DEFAULT_DB_PATH):
+    """
+    원본 단어 파일들(paths: 종류 -> 경로)을 .wdb 파일로 컴파일합니다.
+    임시 파일에 쓴 뒤 바꿔치기하므로 중간에 실패해도 기존 파일은 그대로입니다.
+    """
+    sources = {}
+    signatures = {}
+    for kind, path in paths.items():
+        signatures[kind] = _file_signature(path)
+        try:
+            sources[kind] = read_word_file(path)
+        except FileNotFoundError:
+            sources[kind] = []
+            signatures[kind] = None
+
+    flags = {}
+    for kind, words in sources.items():
+        for word in words:
+            flags[word] = flags.get(word, 0) | SOURCE_FLAGS[kind]
+
+    # 바이트 길이별 묶음, 묶음 안은 알파벳순. 전체 단어 번호는 이 순서를 따릅니다.
+    buckets = {}
+    for word in sorted(flags):
+        buckets.setdefault(len(word.encode("utf-8")), []).append(word)
+    chunks = []
+    offset = 0
+
+    def add_chunk(data):
+        nonlocal offset
+        start = offset
+        chunks.append(data)
+        offset += len(data)
+        padding = -offset % _ALIGN
+        if padding:
+            chunks.append(b"\0" * padding)
+            offset += padding
+        return start
+
+    bucket_meta = []
+    word_ids = {}
+    for width in sorted(buckets):
+        words = buckets[width]
+        start = add_chunk(b"".join(word.encode("utf-8") for word in words))
+        bucket_meta.append([width, start, len(words)])
+        for word in words:
+            word_ids[word] = len(word_ids)
+    flag_offset = add_chunk(bytes(flags[word] for word in sorted(word_ids, key=word_ids.get)))
+
+    view_meta = {}
+    for name, kinds in VIEWS.items():
+        # WordStore.words와 같은 순서: 중복을 뺀 기본(확장) 목록 다음에 그 목록에 없는 사용자 단어
+        main_words = list(dict.fromkeys(sources[kinds[0]]))
+        main_set = set(main_words)
+        words = main_words + [word for word in dict.fromkeys(sources["user"]) if word not in main_set]
+        ids_offset = add_chunk(array("I", (word_ids[word] for word in words)).tobytes())
+        order = sorted(range(len(words)), key=words.__getitem__)
+        order_offset = add_chunk(array("I", order).tobytes())
+        letters = letter_offsets([words[i] for i in order])
+        index = LengthBucketIndex(words)
+        length_meta = []
+        for length, positions in sorted(index.bucket_ids.items()):
+            bucket = index.buckets[length]
+            positions_offset = add_chunk(array("I", positions).tobytes())
+            nbytes = (len(positions) + 7) // 8
+            bitset_keys = ([["p", ch, pos] for ch, pos in bucket.positional]
+                           + [["c", ch] for ch in bucket.contains]
+                           + [["l", key] for key in bucket.lengths])
+            blob = b"".join(bits.to_bytes(nbytes, "little")
+                            for bits in (list(bucket.positional.values()) + list(bucket.contains.values())
+                                         + list(bucket.lengths.values())))
+            length_meta.append({"length": length, "count": len(positions), "positions": positions_offset,
+                                "bitsets": add_chunk(blob), "bitset_bytes": nbytes, "keys": bitset_keys})
+        view_meta[name] = {"count": len(words), "main_count": len(main_words), "ids": ids_offset,
+                           "order": order_offset, "letters": letters, "lengths": length_meta}
+
+    meta = {"version": _VERSION, "sources": {kind: list(sig) if sig else None for kind, sig in signatures.items()},
+            "count": len(word_ids), "buckets": bucket_meta, "flags": flag_offset, "views": view_meta}
+    meta_bytes = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = _MAGIC + struct.pack("<I", len(meta_bytes)) + meta_bytes
+    header += b"\0" * (-len(header) % _ALIGN)
+
+    tmp_path = f"{out_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.writelines(chunks)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+class WordDatabase:
+    """
+    컴파일된 .wdb 파일입니다. mmap으로 한 번에 읽어 보기별 단어 리스트와 LengthBucketIndex를 만든 뒤 파일을 닫습니다.
+    (열어 둔 파일이 없으므로 다른 프로세스가 .wdb를 다시 컴파일해도 문제가 없습니다.)
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:4] != _MAGIC:
+                raise ValueError(f"'{path}'은 .wdb 파일이 아닙니다.")
+            (meta_length,) = struct.unpack_from("<I", mm, 4)
+            meta = json.loads(mm[8:8 + meta_length].decode("utf-8"))
+            if meta.get("version") != _VERSION:
+                raise ValueError(f"'{path}'의 .wdb 버전이 맞지 않습니다.")
+            base = 8 + meta_length
+            base += -base % _ALIGN
+            self.sources = {kind: tuple(sig) if sig else None for kind, sig in meta["sources"].items()}
+
+            # 고정 폭 레코드 -> 전체 단어 목록 (전체 단어 번호 순)
+            all_words = []
+            for width, start, count in meta["buckets"]:
+                data = mm[base + start:base + start + width * count]
+                if data.isascii():
+                    text = data.decode("ascii")
+                    all_words += [text[i:i + width] for i in range(0, len(text), width)]
+                else:
+                    all_words += [data[i:i + width].decode("utf-8") for i in range(0, len(data), width)]
+
+            self.views = {}        # 보기 이름 -> 단어 리스트 (WordStore가 텍스트 파일을 읽을 때와 같은 순서)
+            self.main_counts = {}  # 보기 이름 -> 보기 앞쪽의 기본(확장) 파일 단어 수 (나머지는 사용자 단어)
+            self.letters = {}      # 보기 이름 -> 알파벳순 목록의 [(첫 글자, 시작 위치), ...]
+            self.indexes = {}      # 보기 이름 -> LengthBucketIndex (글자 수별 WordIndex 묶음)
+            self._orders = {}      # 보기 이름 -> 알파벳순으로 놓은 보기 안 순번 (array)
+            self._alphabetical = {}  # 보기 이름 -> 알파벳순 단어 리스트 (처음 요청할 때 만듭니다)
+            for name, view in meta["views"].items():
+                ids = array("I")
+                ids.frombytes(mm[base + view["ids"]:base + view["ids"] + 4 * view["count"]])
+                words = [all_words[i] for i in ids]
+                bucket_ids = {}
+                buckets = {}
+                for bucket in view["lengths"]:
+                    positions = array("I")
+                    start = base + bucket["positions"]
+                    positions.frombytes(mm[start:start + 4 * bucket["count"]])
+                    nbytes = bucket["bitset_bytes"]
+                    offset = base + bucket["bitsets"]
+                    positional, contains, lengths = {}, {}, {}
+                    for key in bucket["keys"]:
+                        bits = int.from_bytes(mm[offset:offset + nbytes], "little")
+                        offset += nbytes
+                        if key[0] == "p":
+                            positional[(key[1], key[2])] = bits
+                        elif key[0] == "c":
+                            contains[key[1]] = bits
+                        else:
+                            lengths[key[1]] = bits
+                    bucket_ids[bucket["length"]] = positions = positions.tolist()
+                    buckets[bucket["length"]] = WordIndex.from_bitsets([words[i] for i in positions],
+                                                                       positional, contains, lengths)
+                order = array("I")
+                order.frombytes(mm[base + view["order"]:base + view["order"] + 4 * view["count"]])
+                self._orders[name] = order
+                self.views[name] = words
+                self.main_counts[name] = view["main_count"]
+                self.letters[name] = [tuple(item) for item in view["letters"]]
+                self.indexes[name] = LengthBucketIndex.from_buckets(words, bucket_ids, buckets)
+
+    def is_fresh(self, paths):
+        """
+        원본 파일들이 컴파일한 뒤로 바뀌지 않았는지 (수정 시각과 크기로) 확인합니다.
+        """
+        return all(self.sources.get(kind) == _file_signature(path) for kind, path in paths.items())
+
+    def alphabetical(self, view):
+        """
+        보기의 단어를 알파벳순으로 놓은 리스트와 첫 글자별 시작 위치 표를 반환합니다. (파일에 저장해 둔 순서)
+        """
+        words = self._alphabetical.get(view)
+        if words is None:
+            views = self.views[view]
+            words = self._alphabetical[view] = [views[i] for i in self._orders[view]]
+        return words, self.letters[view]
+
+    def missing(self, view):
+        """
+        컴파일할 때 없었던 원본 파일 종류 목록 (WordStore.missing과 같은 형식)
+        """
+        return [kind for kind in VIEWS[view] if self.sources.get(kind) is None]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="단어 파일들을 .wdb 이진 사전 파일로 컴파일합니다.")
+    parser.add_argument("-o", "--output", default=DEFAULT_DB_PATH, help=f".wdb 파일 경로 (기본값: {DEFAULT_DB_PATH})")
+    add_word_file_arguments(parser, db=False)
+    args = parser.parse_args(argv)
+    paths = word_file_paths(parser, args)
+    compile_database(paths, args.output)
+    db = WordDatabase(args.output)
+    print(f"{args.output}: 기본 {len(db.views['base'])}개, 확장 {len(db.views['extended'])}개 단어 "
+          f"({os.path.getsize(args.output) / 1e6:.1f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,23 @@
-import re
-import tkinter as tk
-from tkinter import messagebox, scrolledtext, ttk
-from tkinter import BooleanVar
+"""
+워들 단어 사전 GUI 실행 파일입니다.
+단어 처리 기능은 wordleCore 모듈에 있으며, tkinter는 창을 띄울 때(main)에만 불러옵니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from wordleCore import (MISSING_FILE_MESSAGES, UserWordsWatcher, WordStore, letter_offsets, parse_letter_rack,
+                        position_counts)
+from wordleDb import DEFAULT_DB_PATH
+from wordleFeedback import (MAX_WORD_LENGTH, MIN_WORD_LENGTH, FeedbackMatrix, compile_feedback, feedback_words,
+                            parse_feedback_rows)
+from wordleMulti import MAX_BOARDS, MIN_BOARDS, parse_boards, solve_boards
+from wordleTrace import StageTimer, append_trace, profile_call
+
+# tkinter 모듈들은 main()에서 _import_tkinter()로 채워집니다.
+tk = messagebox = scrolledtext = ttk = None
 
 # =========================
 # 디자인 설정
@@ -20,265 +36,798 @@ LETTER_TAG    = "#9597ff"  # 알파벳 구분자 색상 (고급스러운 색상)
 LABEL_FONT    = ("맑은 고딕", 12, "bold")
 TITLE_FONT    = ("맑은 고딕", 20, "bold")
 RESULT_FONT   = ("맑은 고딕", 12)
+HEAT_FONT     = ("Consolas", 11)   # 히트맵은 칸이 맞도록 고정폭 글꼴을 씁니다.
+HEAT_COLORS   = ("#22223b", "#34365a", "#4a4d85", "#6a6dc4", "#9597ff")  # 히트맵 칸 배경 (낮은 비율 -> 높은 비율)
+
+USE_EXTENDED_WORDS = False  # 확장 단어팩 사용 여부 기본값
+TOP_GUESSES = 10            # 결과창에 보여줄 추천 다음 단어 수
+RENDER_CHUNK_LINES = 400    # 결과창에 한 번에 넣는 최대 줄 수
+SEARCH_POLL_MS = 15         # 검색 결과 큐를 확인하는 간격 (밀리초)
+LIVE_SEARCH = False         # 입력하는 동안 자동으로 검색하는 실시간 검색 기본값
+LIVE_SEARCH_DELAY_MS = 250  # 실시간 검색: 입력이 멈춘 뒤 검색을 시작하기까지 기다리는 시간 (밀리초)
+QUERY_CACHE_SIZE = 256      # 기억해 둘 검색 결과 수 (같은 조건이나 더 좁은 조건을 다시 검색할 때 사용)
+TRACE_LOG = None            # 검색마다 단계별 시간을 JSON Lines로 덧붙일 파일 경로 (None이면 기록하지 않음)
+PROFILE_REPORT = "search_profile.txt"  # F12를 누른 뒤 다음 검색 한 번의 cProfile/tracemalloc 보고서 파일
+USER_WORDS_POLL_MS = 1000   # 사용자 단어 파일이 바뀌었는지 확인하는 간격 (밀리초)
+MULTI_BOARDS = 4            # 멀티 보드 창의 기본 보드 수 (쿼들 4, 옥토들 8)
+MULTI_SHOW_WORDS = 30       # 멀티 보드 창에서 보드마다 보여줄 최대 후보 단어 수
+RANK_BY_LIKELIHOOD = True   # 검색 결과를 자리별 글자 빈도로 본 가능성이 큰 단어부터 보여줄지 여부 (False면 목록 순서)
+SHOW_HEATMAP = False        # 후보 단어들의 자리별 글자 빈도 히트맵 표시 기본값 (F11로 전환)
+HEATMAP_LETTERS = 12        # 히트맵에 보여줄 글자 수 (후보에 많이 나오는 글자부터)
+
+def _import_tkinter():
+    """
+    tkinter 모듈을 불러옵니다. 이 모듈을 import만 하는 경우에는 tkinter를 불러오지 않습니다.
+    """
+    global tk, messagebox, scrolledtext, ttk
+    import tkinter as tk
+    from tkinter import messagebox, scrolledtext, ttk
 
 # =========================
-# 데이터 처리 함수
+# 결과 내용 구성
 # =========================
 
-USE_EXTENDED_WORDS = False  # 확장 단어팩 사용 여부 설정
-
-def load_words(filename="words.txt", user_filename="user_words.txt", extended_filename="extended_words.txt"):
+def listing_segments(sorted_words, letters=None):
     """
-    기본 단어 파일, 확장 단어 파일, 사용자가 추가한 단어 파일을 모두 읽어서 리스트로 반환합니다.
-    '#'로 시작하는 줄(주석)은 무시합니다.
-    두 파일 모두 없으면 안내 메시지를 출력하고 빈 리스트를 반환합니다.
+    조건이 없을 때 보여줄 전체 단어 목록을 (텍스트, 태그) 조각으로 만듭니다.
+    알파벳이 바뀔 때마다 구분자를 넣습니다. letters(첫 글자별 시작 위치 표, WordStore.alphabetical 참고)를 주면
+    단어마다 첫 글자를 비교하지 않고 표의 위치에서 구분자를 넣습니다.
     """
-    words = []
-    
-    # 확장 단어 파일 (USE_EXTENDED_WORDS가 True일 때만 사용)
-    if USE_EXTENDED_WORDS:
-        try:
-            with open(extended_filename, "r") as f:
-                words += [word.strip().lower() for word in f if word.strip() and not word.strip().startswith("#")]
-        except FileNotFoundError:
-            messagebox.showwarning("파일 경고", f"확장 단어 파일 '{extended_filename}'이 존재하지 않습니다.")
-    
-    else:
-                # 기본 단어 파일
-        try:
-            with open(filename, "r") as f:
-                words += [word.strip().lower() for word in f if word.strip() and not word.strip().startswith("#")]
-        except FileNotFoundError:
-            messagebox.showwarning("파일 경고", f"기본 단어 파일 '{filename}'이 존재하지 않습니다.")
-    
-    # 사용자 추가 단어 파일
-    try:
-        with open(user_filename, "r") as f:
-            words += [word.strip().lower() for word in f if word.strip() and not word.strip().startswith("#")]
-    except FileNotFoundError:
-        pass
-
-    if not words:
-        messagebox.showerror("파일 오류", "단어 파일을 찾을 수 없습니다.")
-    return words
-
-def pattern_to_regex(pattern: str):
-    """
-    워들 스타일 패턴(예: _ a _ b _)을 정규식으로 변환합니다.
-    '_'는 임의의 한 글자를 의미하며, 나머지 글자는 그대로 사용됩니다.
+    yield "조건이 입력되지 않았으므로 모든 단어를 알파벳별로 보여드립니다.\n", None
+    yield f"총 단어 수: {len(sorted_words)}\n\n", None
+    if letters is None:
+        letters = letter_offsets(sorted_words)
+    ends = [start for _, start in letters[1:]] + [len(sorted_words)]
+    current_letter = ""
+    for (letter, start), end in zip(letters, ends):
+        first = letter.upper()
+        if first != current_letter:
+            current_letter = first
+            # 알파벳 구분자에 태그 적용
+            yield f"\n[{current_letter}]\n", "letter_tag"
+        for word in sorted_words[start:end]:
+            yield f"{word}\n", None
+
+def heatmap_segments(table, count):
     """
-    cleaned = pattern.replace(" ", "").lower()
-    return "^" + "".join("." if ch == "_" else ch for ch in cleaned) + "$"
-
-def parse_loose_letters(input_str):
+    후보 단어들의 자리별 글자 빈도표(WordStats.position_table 모양)를 글자 × 자리 히트맵 (텍스트, 태그) 조각으로 만듭니다.
+    후보에 많이 나오는 글자부터 HEATMAP_LETTERS개를 보여주며, 칸의 숫자는 그 자리에 그 글자가 있는 후보의 비율(%)입니다.
     """
-    유동 글자와 해당 글자가 오면 안 되는 위치를 파싱합니다.
-    예시 입력: a(1,4) b(3,4)
-    결과: {'a': [0, 3], 'b': [2, 3]}  # 인덱스는 0부터 시작
+    totals = {}
+    for counts in table:
+        for ch, n in counts.items():
+            totals[ch] = totals.get(ch, 0) + n
+    letters = sorted(totals, key=lambda ch: (-totals[ch], ch))[:HEATMAP_LETTERS]
+    yield "📊 자리별 글자 빈도 (후보 중 비율 %)\n", "letter_tag"
+    yield "   " + "".join(f"{pos:>4} " for pos in range(1, len(table) + 1)) + "\n", "heat_label"
+    for ch in letters:
+        yield f" {ch} ", "heat_label"
+        for counts in table:
+            share = counts.get(ch, 0) / count
+            level = min(len(HEAT_COLORS) - 1, int(share * len(HEAT_COLORS)))
+            yield f"{round(share * 100):>4} ", f"heat{level}"
+        yield "\n", None
+    yield "\n", None
+
+def match_segments(total, matches, suggestions, heatmap=None):
     """
-    if not input_str.strip():
-        return {}
-    pattern = r"([a-zA-Z])\(([\d,]+)\)"
-    result = {}
-    for match in re.finditer(pattern, input_str):
-        letter = match.group(1).lower()
-        positions = [int(p)-1 for p in match.group(2).split(",")]
-        result[letter] = positions
-    return result
-
-def filter_words(words, fixed_pattern, loose_letters, exclude_letters):
+    조건 검색 결과(단어 목록과 추천 다음 단어)를 (텍스트, 태그) 조각으로 만듭니다.
+    heatmap(자리별 글자 빈도표)을 주면 단어 목록 앞에 히트맵을 넣습니다.
     """
-    단어 리스트에서 아래 조건을 모두 만족하는 단어만 필터링합니다.
-    1. fixed_pattern에 맞는 단어
-    2. exclude_letters에 포함된 글자가 없는 단어
-    3. loose_letters에 명시된 글자가 반드시 포함되어 있고, 지정된 위치에는 없어야 함
-    """
-    regex = re.compile(pattern_to_regex(fixed_pattern))
-    exclude_set = set(exclude_letters.lower().replace(",", ""))
-    loose_map = parse_loose_letters(loose_letters)
-    pattern_length = len(fixed_pattern.replace(" ", ""))
-    results = []
-    for word in words:
-        if len(word) != pattern_length:
-            continue
-        if not regex.match(word):
-            continue
-        if any(ch in word for ch in exclude_set):
-            continue
-        valid = True
-        for letter, bad_positions in loose_map.items():
-            if letter not in word:
-                valid = False
-                break
-            if any(word[pos] == letter for pos in bad_positions if 0 <= pos < len(word)):
-                valid = False
-                break
-        if valid:
-            results.append(word)
-    return results
+    yield f"총 단어 수: {total}\n", None
+    if not matches:
+        yield "😥 조건에 맞는 단어가 없습니다.\n", None
+        yield "오늘의 워들 정답을 알게 되면 user_words.txt 파일에 추가해 주세요!\n", None
+        yield "다음에 같은 단어가 나왔을 때 더 쉽게 찾을 수 있어요. 😉", None
+        return
+    yield f"조건에 맞는 단어는 총 {len(matches)}개입니다!\n\n", None
+    if heatmap:
+        yield from heatmap_segments(heatmap, len(matches))
+    for word in matches:
+        yield f"• {word}\n", None
+    if suggestions:
+        yield "\n🎯 추천 다음 단어 (기대 정보량 순, ✓는 정답 후보)\n", "letter_tag"
+        for rank, (word, bits, is_candidate) in enumerate(suggestions, 1):
+            mark = " ✓" if is_candidate else ""
+            yield f"{rank:2d}. {word}  {bits:.2f}비트{mark}\n", None
+    yield "\n검색이 완료되었습니다. 즐거운 워들 플레이 되세요! 🎉", None
 
 # =========================
 # UI 및 이벤트 함수
 # =========================
 
-def toggle_extended_words():
+class WordleDictApp:
     """
-    확장 단어팩 사용 여부를 토글합니다.
+    워들 단어 사전 메인 윈도우입니다.
+    단어 파일은 word_store가 한 번만 읽고, 파일이 바뀌었을 때만 다시 읽습니다.
     """
-    global USE_EXTENDED_WORDS
-    USE_EXTENDED_WORDS = not USE_EXTENDED_WORDS
-    status_label.config(text=f"확장 단어팩 사용: {'활성화' if USE_EXTENDED_WORDS else '비활성화'}")
-
-def on_extended_switch():
-    global USE_EXTENDED_WORDS
-    USE_EXTENDED_WORDS = USE_EXTENDED_WORDS_VAR.get()
-    status_label.config(text=f"확장 단어팩 사용: {'활성화' if USE_EXTENDED_WORDS else '비활성화'}")
 
-def run_filter():
-    """
-    검색 버튼 클릭 시 실행되는 함수.
-    입력값을 받아 단어를 필터링하고 결과를 출력합니다.
-    조건이 모두 비어있으면 알파벳별로 구분자를 넣어 전체 단어 목록을 보여줍니다.
-    """
-    fixed_pattern = entry_pattern.get().strip()
-    loose_letters = entry_loose.get().strip()
-    exclude_letters = entry_exclude.get().strip()
-    words = load_words("words.txt", "user_words.txt", "extended_words.txt")
-    if not words:
-        status_label.config(text="단어 파일을 찾을 수 없습니다.")
-        return
-
-    result_text.config(state='normal')
-    result_text.delete(1.0, tk.END)
-
-    # 조건이 모두 비어있을 때: 전체 단어 알파벳별로 구분하여 출력
-    if not fixed_pattern and not loose_letters and not exclude_letters:
-        sorted_words = sorted(words)
-        result_text.insert(tk.END, f"조건이 입력되지 않았으므로 모든 단어를 알파벳별로 보여드립니다.\n")
-        result_text.insert(tk.END, f"총 단어 수: {len(sorted_words)}\n\n")
-        current_letter = ""
-        for word in sorted_words:
-            first = word[0].upper()
-            if first != current_letter:
-                current_letter = first
-                # 알파벳 구분자에 태그 적용
-                result_text.insert(tk.END, f"\n[{current_letter}]\n", "letter_tag")
-            result_text.insert(tk.END, f"{word}\n")
+    def __init__(self, root, word_store):
+        self.root = root
+        self.word_store = word_store
+        self.use_extended = USE_EXTENDED_WORDS
+        self.show_heatmap = SHOW_HEATMAP
+        self.feedback_tables = {}  # (확장 여부, 단어 길이) -> (단어 리스트, FeedbackMatrix), 검색 스레드에서만 사용
+        self._render_job = None       # 다음 결과 묶음을 넣을 after() 작업
+        self._render_segments = None  # 아직 넣지 않은 결과 조각
+        self._render_done_message = ""
+        # 단어 읽기와 검색은 작업 스레드 하나에서 순서대로 처리하고, 결과는 큐로 받아 메인 스레드에서 출력합니다.
+        self._search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wordle-search")
+        self._search_results = queue.Queue()
+        self._search_id = 0           # 가장 최근에 요청한 검색 번호
+        self._shown_search_id = 0     # 결과를 출력한 마지막 검색 번호
+        self._search_cancel = None    # 가장 최근 검색의 취소 신호
+        self._poll_job = None
+        self._live_search_job = None
+        self._last_query = None
+        self._live = False            # 가장 최근 검색이 실시간 검색인지 여부
+        self._profile_next = False    # 다음 검색 한 번을 프로파일링할지 여부 (F12)
+        self._render_timer = None     # 출력 중인 검색의 StageTimer
+        self._render_query = None     # 출력 중인 검색의 (조건, 확장 여부), 추적 기록에 사용
+        self._render_profile = None   # 출력 중인 검색의 프로파일 보고서 파일
+        self.multi_window = None      # 열려 있는 멀티 보드 창
+        self.user_words_watcher = UserWordsWatcher(word_store)
+        self._watch_job = None
+        self.build_window()
+
+    def toggle_extended_words(self):
+        """
+        확장 단어팩 사용 여부를 토글합니다.
+        """
+        self.use_extended = not self.use_extended
+        self.status_label.config(text=f"확장 단어팩 사용: {'활성화' if self.use_extended else '비활성화'}")
+
+    def on_extended_switch(self):
+        self.use_extended = self.use_extended_var.get()
+        self.status_label.config(text=f"확장 단어팩 사용: {'활성화' if self.use_extended else '비활성화'}")
+        if self.live_search_var.get():
+            self.run_filter(live=True)
+
+    def preload(self):
+        """
+        작업 스레드에서 기본/확장 단어 목록과 인덱스를 미리 만들어 둡니다.
+        """
+        self._search_executor.submit(self.word_store.load_all)
+
+    def watch_user_words(self):
+        """
+        USER_WORDS_POLL_MS마다 사용자 단어 파일을 확인해, 바뀌었으면 작업 스레드에서 추가/삭제된 단어만
+        단어 목록과 인덱스에 반영합니다. 단어 저장소는 작업 스레드에서만 다룹니다.
+        """
+        if self.user_words_watcher.poll():
+            self._search_executor.submit(self.word_store.refresh)
+            self.status_label.config(text=f"{self.word_store.paths['user']} 파일의 변경을 단어 목록에 반영합니다.")
+        self._watch_job = self.root.after(USER_WORDS_POLL_MS, self.watch_user_words)
+
+    def shutdown(self):
+        """
+        창을 닫을 때 대기 중인 검색을 취소하고 작업 스레드를 정리합니다.
+        """
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        self._search_executor.shutdown(wait=False, cancel_futures=True)
+
+    def feedback_table(self, use_extended, length):
+        """
+        length 글자 피드백 표를 처음 필요할 때 열고(없으면 만들고), 단어 목록이 바뀌면 다시 엽니다.
+        지원하지 않는 길이이거나 그 길이의 정답 후보가 없으면(표를 만들지 않음),
+        NumPy가 없거나 표 파일을 만들 수 없으면 None을 반환합니다.
+        """
+        if not MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH:
+            return None
+        words = self.word_store.words(use_extended)
+        key = (use_extended, length)
+        cached = self.feedback_tables.get(key)
+        if cached is None or cached[0] is not words:
+            table = None
+            if feedback_words(self.word_store.words(False), length):
+                try:
+                    table = FeedbackMatrix.load_or_build(self.word_store, use_extended, length=length)
+                except (ImportError, OSError):
+                    return None
+            cached = self.feedback_tables[key] = (words, table)
+        return cached[1]
+
+    def best_guesses(self, matches, use_extended, length):
+        """
+        남은 length 글자 후보 단어들을 기준으로 기대 정보량이 큰 다음 추측 단어를 구합니다.
+        피드백 표를 쓸 수 없으면 빈 리스트를 반환합니다.
+        """
+        table = self.feedback_table(use_extended, length)
+        if table is None:
+            return []
+        return table.best_guesses(matches, TOP_GUESSES)
+
+    def solve_boards(self, boards, use_extended):
+        """
+        작업 스레드에서 멀티 보드(보드마다 피드백 줄)를 풉니다. 모든 보드가 같은 인덱스와 피드백 표를 씁니다.
+        """
+        index = self.word_store.index(use_extended)
+        boards, length = parse_boards(boards)
+        return solve_boards(index, boards, self.feedback_table(use_extended, length), TOP_GUESSES)
+
+    def open_multi_board(self):
+        """
+        멀티 보드 창을 엽니다. 이미 열려 있으면 앞으로 가져옵니다.
+        """
+        if self.multi_window is not None and self.multi_window.window.winfo_exists():
+            self.multi_window.window.lift()
+            return
+        self.multi_window = MultiBoardWindow(self)
+
+    # =========================
+    # 검색 (작업 스레드)
+    # =========================
+
+    def search(self, query, use_extended, cancel, timer=None):
+        """
+        작업 스레드에서 단어를 읽고 필터링합니다. tkinter는 사용하지 않습니다.
+        더 새로운 검색이 들어와 cancel이 설정되면 단계 사이에서 멈추고 None을 반환합니다.
+        timer(StageTimer)를 주면 단계별 시간을 기록합니다.
+        """
+        timer = timer or StageTimer()
+        fixed_pattern, loose_letters, exclude_letters, feedback, rack = query
+        with timer.stage("load"):
+            words = self.word_store.words(use_extended)
+            result = {"missing": list(self.word_store.missing), "total": len(words)}
+            if not words:
+                return result
+            index = self.word_store.index(use_extended)
+        if cancel.is_set():
+            return None
+
+        # 조건이 모두 비어있을 때: 전체 단어 알파벳별로 구분하여 출력
+        if not fixed_pattern and not loose_letters and not exclude_letters and not feedback and not rack:
+            with timer.stage("sort"):
+                result["listing"], result["letters"] = self.word_store.alphabetical(use_extended)
+            return result
+
+        if rack:
+            return self.search_rack(result, query, use_extended, cancel, timer)
+        if feedback:
+            # 피드백 줄이 있으면 세 입력값과 함께 제약 프로그램 하나로 컴파일해 검색합니다.
+            with timer.stage("parse"):
+                program = compile_feedback(parse_feedback_rows(feedback), fixed_pattern, loose_letters, exclude_letters)
+            matches = index.filter_program(program, timer)
+            length = program.length
+        else:
+            # 기존 조건 검색
+            matches = index.filter(fixed_pattern, loose_letters, exclude_letters, timer)
+            length = len(fixed_pattern.replace(" ", ""))
+        if cancel.is_set():
+            return None
+        if matches and RANK_BY_LIKELIHOOD:
+            with timer.stage("rank"):
+                matches = self.word_store.word_stats(use_extended).rank(matches)
+        if matches and length and self.show_heatmap:
+            result["heatmap"] = self.heatmap_table(matches, use_extended, length)
+        suggestions = []
+        if matches and length:
+            with timer.stage("suggest"):
+                suggestions = self.best_guesses(matches, use_extended, length)
+        result["matches"] = matches
+        result["suggestions"] = suggestions
+        return result
+
+    def heatmap_table(self, matches, use_extended, length):
+        """
+        검색 결과(length 글자 후보)의 자리별 글자 빈도표를 구합니다.
+        후보가 그 길이의 단어 전체이면 단어 저장소의 통계에 미리 만들어 둔 표를 그대로 씁니다.
+        """
+        stats = self.word_store.word_stats(use_extended)
+        if len(matches) == stats.lengths.get(length):
+            return stats.position_table(length)
+        return position_counts(matches, length)
+
+    def search_rack(self, result, query, use_extended, cancel, timer):
+        """
+        글자 묶음 검색입니다. (parse_letter_rack 참고: 만들 수 있는 단어, +포함하는 단어, =애너그램)
+        패턴이나 피드백 줄을 함께 입력하면 그 길이의 단어 중 그 조건에도 맞는 단어만 남깁니다.
+        만들 수 있는 단어는 글자를 많이 쓰는 긴 단어부터 보여주며, 추천 다음 단어는 계산하지 않습니다.
+        """
+        fixed_pattern, loose_letters, exclude_letters, feedback, rack = query
+        with timer.stage("parse"):
+            mode, letters = parse_letter_rack(rack)
+            program = None
+            if feedback:
+                program = compile_feedback(parse_feedback_rows(feedback), fixed_pattern, loose_letters, exclude_letters)
+            length = program.length if program else len(fixed_pattern.replace(" ", "")) or None
+        with timer.stage("filter"):
+            matches = self.word_store.anagram_index(use_extended).search(mode, letters, length)
+        if cancel.is_set():
+            return None
+        if matches and (program or fixed_pattern):
+            index = self.word_store.index(use_extended)
+            if program:
+                allowed = set(index.filter_program(program, timer))
+            else:
+                allowed = set(index.filter(fixed_pattern, loose_letters, exclude_letters, timer))
+            matches = [word for word in matches if word in allowed]
+        if mode == "formable":
+            matches.sort(key=len, reverse=True)
+        result["matches"] = matches
+        result["suggestions"] = []
+        return result
+
+    def _search_worker(self, search_id, query, use_extended, cancel, timer, profile=False):
+        if cancel.is_set():
+            return
+        try:
+            if profile:
+                result, report = profile_call(self.search, query, use_extended, cancel, timer)
+                with open(PROFILE_REPORT, "w", encoding="utf-8") as f:
+                    f.write(report)
+                if result is not None:
+                    result["profile"] = PROFILE_REPORT
+            else:
+                result = self.search(query, use_extended, cancel, timer)
+        except Exception as e:  # 작업 스레드의 오류는 메인 스레드에서 알려줍니다.
+            result = {"error": e}
+        if result is not None:
+            result["timer"] = timer
+            self._search_results.put((search_id, result))
+
+    # =========================
+    # 검색 요청과 결과 출력 (메인 스레드)
+    # =========================
+
+    def run_filter(self, live=False):
+        """
+        검색 버튼 클릭 시 실행되는 함수.
+        입력값을 작업 스레드로 넘겨 단어를 필터링하고, 결과가 오면 결과창에 출력합니다.
+        조건이 모두 비어있으면 알파벳별로 구분자를 넣어 전체 단어 목록을 보여줍니다.
+        이전 검색이 아직 끝나지 않았다면 취소합니다.
+        """
+        query = self.read_query()
+        self._last_query = (query, self.use_extended)
+        if self._live_search_job is not None:
+            self.root.after_cancel(self._live_search_job)
+            self._live_search_job = None
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        self._search_cancel = threading.Event()
+        self._search_id += 1
+        self._live = live
+        profile, self._profile_next = self._profile_next, False
+        self.status_label.config(text="검색 중입니다..." + (" (프로파일링)" if profile else ""))
+        self._search_executor.submit(self._search_worker, self._search_id, query, self.use_extended,
+                                     self._search_cancel, StageTimer(), profile)
+        if self._poll_job is None:
+            self._poll_job = self.root.after(SEARCH_POLL_MS, self._poll_search_results)
+
+    def read_query(self):
+        """
+        입력창 다섯 칸의 값을 (패턴, 유동 글자, 제외 글자, 피드백 줄, 글자 묶음)으로 읽습니다.
+        """
+        return (self.entry_pattern.get().strip(), self.entry_loose.get().strip(), self.entry_exclude.get().strip(),
+                self.entry_feedback.get().strip(), self.entry_rack.get().strip())
+
+    def _poll_search_results(self):
+        """
+        검색 결과 큐를 확인해 가장 최근 검색의 결과만 출력합니다. 지난 검색의 결과는 버립니다.
+        """
+        self._poll_job = None
+        while True:
+            try:
+                search_id, result = self._search_results.get_nowait()
+            except queue.Empty:
+                break
+            if search_id == self._search_id:
+                self._shown_search_id = search_id
+                self.show_search_result(result)
+        if self._shown_search_id != self._search_id:
+            self._poll_job = self.root.after(SEARCH_POLL_MS, self._poll_search_results)
+
+    def show_search_result(self, result):
+        """
+        작업 스레드에서 받은 검색 결과를 결과창에 출력합니다.
+        실시간 검색 중에는 파일 경고 창을 띄우지 않고 상태 표시줄에만 알립니다.
+        """
+        if "error" in result:
+            self.status_label.config(text=f"입력을 해석할 수 없습니다: {result['error']}")
+            return
+        self._render_query = self._last_query
+        self._render_profile = result.get("profile")
+        if not self._live:
+            for kind in result["missing"]:
+                if kind in MISSING_FILE_MESSAGES:
+                    messagebox.showwarning("파일 경고", MISSING_FILE_MESSAGES[kind].format(path=self.word_store.paths[kind]))
+        if not result["total"]:
+            if not self._live:
+                messagebox.showerror("파일 오류", "단어 파일을 찾을 수 없습니다.")
+            self.status_label.config(text="단어 파일을 찾을 수 없습니다.")
+            return
+        if "listing" in result:
+            self.render_results(listing_segments(result["listing"], result["letters"]), "전체 단어 목록을 알파벳별로 표시합니다.",
+                                result["timer"])
+            return
+        matches = result["matches"]
+        done_message = "검색이 완료되었습니다." if matches else "조건에 맞는 단어가 없습니다."
+        self.render_results(match_segments(result["total"], matches, result["suggestions"], result.get("heatmap")),
+                            done_message, result["timer"])
+
+    def on_entry_changed(self, event=None):
+        """
+        실시간 검색이 켜져 있으면 입력이 멈춘 뒤 LIVE_SEARCH_DELAY_MS가 지나 검색합니다.
+        입력값이 마지막 검색과 같으면(방향키 등) 다시 검색하지 않습니다.
+        """
+        if not self.live_search_var.get():
+            return
+        query = self.read_query()
+        if (query, self.use_extended) == self._last_query:
+            return
+        if self._live_search_job is not None:
+            self.root.after_cancel(self._live_search_job)
+        self._live_search_job = self.root.after(LIVE_SEARCH_DELAY_MS, lambda: self.run_filter(live=True))
+
+    # =========================
+    # 결과창 출력
+    # =========================
+
+    def render_results(self, segments, done_message, timer=None):
+        """
+        (텍스트, 태그) 조각들을 결과창에 나누어 출력합니다.
+        첫 RENDER_CHUNK_LINES줄은 바로 넣어 첫 화면이 즉시 보이게 하고,
+        나머지는 after()로 한 묶음씩 이어서 넣어 큰 목록에서도 창이 멈추지 않습니다.
+        이전 출력이 아직 진행 중이면 취소하고 새로 시작합니다.
+        timer(StageTimer)를 주면 출력 시간을 render 단계로 기록하고, 끝나면 단계별 시간을 상태 표시줄에 보여줍니다.
+        """
+        self.cancel_render()
+        self._render_timer = timer
+        started = time.perf_counter()
+        self.result_text.config(state='normal')
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.config(state='disabled')
+        self._render_segments = iter(segments)
+        self._render_done_message = done_message
+        if timer is not None:
+            timer.add("render", time.perf_counter() - started)
+        self._render_next_chunk()
+
+    def cancel_render(self):
+        """
+        진행 중인 결과창 출력을 멈춥니다.
+        """
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+        self._render_segments = None
+
+    def _render_next_chunk(self):
+        """
+        조각을 최대 RENDER_CHUNK_LINES개까지 모아 insert 한 번으로 결과창에 넣습니다.
+        """
+        self._render_job = None
+        segments = self._render_segments
+        if segments is None:
+            return
+        started = time.perf_counter()
+        args = []
+        finished = True
+        for count, (text, tag) in enumerate(segments, 1):
+            # 태그가 같은 연속 조각은 하나로 합칩니다.
+            if args and args[-1] == (tag or ()):
+                args[-2] += text
+            else:
+                args += [text, tag or ()]
+            if count >= RENDER_CHUNK_LINES:
+                finished = False
+                break
+        if args:
+            self.result_text.config(state='normal')
+            self.result_text.insert(tk.END, *args)
+            self.result_text.config(state='disabled')
+        if self._render_timer is not None:
+            self._render_timer.add("render", time.perf_counter() - started)
+        if finished:
+            self._render_segments = None
+            self.finish_render()
+        else:
+            self._render_job = self.root.after(1, self._render_next_chunk)
+
+    def finish_render(self):
+        """
+        출력이 끝나면 완료 문구와 단계별 시간을 상태 표시줄에 보여주고, TRACE_LOG가 있으면 추적 기록을 남깁니다.
+        """
+        timer, self._render_timer = self._render_timer, None
+        if timer is None:
+            self.status_label.config(text=self._render_done_message)
+            return
+        text = f"{self._render_done_message}  ({timer.summary()})"
+        if self._render_profile:
+            text += f"  프로파일: {self._render_profile}"
+        self.status_label.config(text=text)
+        if TRACE_LOG:
+            (fixed_pattern, loose_letters, exclude_letters, feedback, rack), use_extended = self._render_query
+            record = timer.record(pattern=fixed_pattern, loose=loose_letters, exclude=exclude_letters,
+                                  feedback=feedback, rack=rack, extended=use_extended, live=self._live,
+                                  profile=self._render_profile)
+            try:
+                append_trace(TRACE_LOG, record)
+            except OSError:
+                pass
+
+    def request_profile(self, event=None):
+        """
+        다음 검색 한 번을 cProfile과 tracemalloc으로 프로파일링해 PROFILE_REPORT 파일에 저장합니다. (F12)
+        """
+        self._profile_next = True
+        self.status_label.config(text=f"다음 검색을 프로파일링해 {PROFILE_REPORT}에 저장합니다.")
+
+    def toggle_heatmap(self, event=None):
+        """
+        검색 결과의 자리별 글자 빈도 히트맵 표시를 켜고 끕니다. (F11) 검색한 적이 있으면 다시 검색합니다.
+        """
+        self.show_heatmap = not self.show_heatmap
+        self.status_label.config(text=f"자리별 글자 빈도 히트맵: {'표시' if self.show_heatmap else '숨김'}")
+        if self._last_query is not None:
+            self.run_filter()
+
+    def create_labeled_entry(self, master, label_text, example_text, row):
+        """
+        라벨과 예시, 입력창을 한 줄에 배치하는 고급 입력창 생성 함수
+        """
+        label = tk.Label(master, text=label_text, font=LABEL_FONT, bg=PANEL_COLOR, fg=LABEL_TEXT, anchor="w")
+        label.grid(row=row, column=0, sticky="w", padx=(18,8), pady=10)
+        entry_style = ttk.Style()
+        entry_style.configure("Custom.TEntry",
+                              fieldbackground=ENTRY_BG,
+                              borderwidth=0,
+                              relief="flat",
+                              font=("맑은 고딕", 12),
+                              foreground="#222")
+        entry_frame = tk.Frame(master, bg=PANEL_COLOR)
+        entry_frame.grid(row=row, column=1, sticky="ew", padx=(0,0), pady=10)
+        entry = ttk.Entry(entry_frame, width=22, style="Custom.TEntry", font=("맑은 고딕", 12))
+        entry.pack(fill="x", ipady=7, padx=(0,0))
+        entry_frame.grid_columnconfigure(0, weight=1)
+        example = tk.Label(master, text=example_text, fg=EXAMPLE_TEXT, bg=PANEL_COLOR, font=("맑은 고딕", 10))
+        example.grid(row=row, column=2, sticky="w", padx=(8,8))
+        return entry
+
+    def create_extended_toggle(self, master):
+        """
+        확장 단어팩 토글 스위치를 만듭니다.
+        """
+        self.use_extended_var = tk.BooleanVar(value=self.use_extended)
+
+        toggle_switch = ttk.Checkbutton(
+            master,
+            text="확장 단어팩 사용",
+            variable=self.use_extended_var,
+            command=self.on_extended_switch,
+            style="Switch.TCheckbutton"
+        )
+        toggle_switch.pack(side="left")
+
+    # =========================
+    # 메인 윈도우 구성
+    # =========================
+
+    def build_window(self):
+        root = self.root
+        root.title("워들 단어 사전")
+        root.geometry("560x840")
+        root.configure(bg=BG_COLOR)
+        root.resizable(False, False)
+
+        # 타이틀 및 안내
+        tk.Label(root, text="🎯 워들 단어 사전", font=TITLE_FONT, bg=BG_COLOR, fg=LABEL_TEXT).pack(pady=(28, 5))
+        tk.Label(root, text="아래 조건을 입력하고 원하는 단어를 찾아보세요!", font=("맑은 고딕", 13), bg=BG_COLOR, fg=EXAMPLE_TEXT).pack()
+
+        # 입력 패널
+        frame = tk.Frame(root, bg=PANEL_COLOR, bd=0, relief="flat")
+        frame.pack(pady=24, padx=18, fill="x")
+        frame.grid_columnconfigure(1, weight=1)
+
+        # 고급 입력창 생성
+        self.entry_pattern = self.create_labeled_entry(frame, "[1] 확정된 글자 패턴", "예시: _ a _ b _", 0)
+        self.entry_loose   = self.create_labeled_entry(frame, "[2] 특정 위치에는 오면 안 되는 글자", "예시: a(1,4) b(3,4)", 1)
+        self.entry_exclude = self.create_labeled_entry(frame, "[3] 제외할 글자들", "예시: a,b,c,d,e", 2)
+        # 피드백 줄: 추측 단어와 색(B 회색, Y 노랑, G 초록)을 그대로 붙여 넣으면 보드 전체를 한 번에 검색합니다.
+        self.entry_feedback = self.create_labeled_entry(frame, "[4] 워들 피드백 줄", "예시: crane BYGBB, slate GBBYB", 3)
+        # 글자 묶음: 이 글자들로 만들 수 있는 단어(aerst), 모두 포함하는 단어(+qz), 애너그램(=least)을 찾습니다.
+        self.entry_rack = self.create_labeled_entry(frame, "[5] 글자 묶음 (애너그램)", "예시: aerst, +qz, =least", 4)
+
+        # 검색 버튼
+        btn_frame = tk.Frame(root, bg=BG_COLOR)
+        btn_frame.pack(pady=16)
+
+        self.search_btn = tk.Button(btn_frame, text="🔍 검색하기", command=self.run_filter, font=("맑은 고딕", 14, "bold"),
+                  bg=BTN_COLOR, fg=BTN_TEXT, activebackground=RESULT_BG, activeforeground=BTN_TEXT,
+                  relief="flat", bd=0, cursor="hand2", padx=24, pady=8)
+        self.search_btn.pack(side="left", padx=(0, 12))
+
+        # 스위치 스타일(파란색 강조)
+        style = ttk.Style()
+        style.configure("Switch.TCheckbutton",
+                        font=("맑은 고딕", 12),
+                        foreground=BTN_TEXT,
+                        background=BG_COLOR)
+
+        # 확장 단어팩 토글 스위치
+        self.create_extended_toggle(btn_frame)
+
+        # 실시간 검색 스위치: 입력하는 동안 자동으로 검색합니다.
+        self.live_search_var = tk.BooleanVar(value=LIVE_SEARCH)
+        live_switch = ttk.Checkbutton(btn_frame, text="실시간 검색", variable=self.live_search_var,
+                                      command=self.on_entry_changed, style="Switch.TCheckbutton")
+        live_switch.pack(side="left", padx=(12, 0))
+        # 멀티 보드(쿼들/옥토들) 창
+        tk.Button(btn_frame, text="🧩 멀티 보드", command=self.open_multi_board, font=("맑은 고딕", 11),
+                  bg=BTN_COLOR, fg=BTN_TEXT, activebackground=RESULT_BG, activeforeground=BTN_TEXT,
+                  relief="flat", bd=0, cursor="hand2", padx=10, pady=6).pack(side="left", padx=(12, 0))
+        for entry in (self.entry_pattern, self.entry_loose, self.entry_exclude, self.entry_feedback, self.entry_rack):
+            entry.bind("<KeyRelease>", self.on_entry_changed)
+        # F12: 다음 검색 한 번을 프로파일링합니다.
+        root.bind("<F12>", self.request_profile)
+        # F11: 자리별 글자 빈도 히트맵을 켜고 끕니다.
+        root.bind("<F11>", self.toggle_heatmap)
+
+        # 결과 출력 영역
+        result_frame = tk.Frame(root, bg=RESULT_BG, bd=2, relief="groove")
+        result_frame.pack(padx=18, pady=(0, 18), fill="both", expand=True)
+
+        self.result_text = scrolledtext.ScrolledText(result_frame, width=62, height=22, font=RESULT_FONT,
+                                                     bg=RESULT_BG, fg=RESULT_TEXT, bd=0, relief="flat", wrap="word")
+        self.result_text.pack(padx=10, pady=10, fill="both", expand=True)
         # 구분자 태그 스타일(디자인 설정에서 색상 적용)
-        result_text.tag_config("letter_tag", foreground=LETTER_TAG, font=("맑은 고딕", 13, "bold"))
-        status_label.config(text="전체 단어 목록을 알파벳별로 표시합니다.")
-        result_text.config(state='disabled')
-        return
-
-    # 기존 조건 검색
-    matches = filter_words(words, fixed_pattern, loose_letters, exclude_letters)
-    result_text.insert(tk.END, f"총 단어 수: {len(words)}\n")
-    if matches:
-        result_text.insert(tk.END, f"조건에 맞는 단어는 총 {len(matches)}개입니다!\n\n")
-        for word in matches:
-            result_text.insert(tk.END, f"• {word}\n")
-        result_text.insert(tk.END, "\n검색이 완료되었습니다. 즐거운 워들 플레이 되세요! 🎉")
-        status_label.config(text="검색이 완료되었습니다.")
-    else:
-        result_text.insert(tk.END, "😥 조건에 맞는 단어가 없습니다.\n")
-        result_text.insert(tk.END, "오늘의 워들 정답을 알게 되면 user_words.txt 파일에 추가해 주세요!\n")
-        result_text.insert(tk.END, "다음에 같은 단어가 나왔을 때 더 쉽게 찾을 수 있어요. 😉")
-        status_label.config(text="조건에 맞는 단어가 없습니다.")
-    result_text.config(state='disabled')
-
-def create_labeled_entry(master, label_text, example_text, row):
+        self.result_text.tag_config("letter_tag", foreground=LETTER_TAG, font=("맑은 고딕", 13, "bold"))
+        # 히트맵 칸 스타일 (비율이 높을수록 밝은 배경)
+        self.result_text.tag_config("heat_label", font=HEAT_FONT)
+        for level, color in enumerate(HEAT_COLORS):
+            self.result_text.tag_config(f"heat{level}", background=color, font=HEAT_FONT)
+        self.result_text.config(state='disabled')
+
+        # 상태 표시줄
+        status_frame = tk.Frame(root, bg=BG_COLOR)
+        status_frame.pack(side="bottom", fill="x")
+
+        self.status_label = tk.Label(status_frame, text="워들 단어 사전입니다. 단어 검색을 시작해보세요!", font=("맑은 고딕", 10),
+                                     bg=BG_COLOR, fg=EXAMPLE_TEXT)
+        self.status_label.pack(pady=8)
+
+class MultiBoardWindow:
     """
-    라벨과 예시, 입력창을 한 줄에 배치하는 고급 입력창 생성 함수
+    쿼들/옥토들처럼 여러 보드를 함께 푸는 창입니다. 메인 창의 단어 저장소와 작업 스레드를 함께 씁니다.
+    보드마다 피드백 줄을 입력하고 풀기를 누르면 보드별 후보와,
+    끝나지 않은 모든 보드를 함께 기준으로 고른 추천 다음 단어를 보여줍니다.
     """
-    label = tk.Label(master, text=label_text, font=LABEL_FONT, bg=PANEL_COLOR, fg=LABEL_TEXT, anchor="w")
-    label.grid(row=row, column=0, sticky="w", padx=(18,8), pady=10)
-    entry_style = ttk.Style()
-    entry_style.configure("Custom.TEntry",
-                          fieldbackground=ENTRY_BG,
-                          borderwidth=0,
-                          relief="flat",
-                          font=("맑은 고딕", 12),
-                          foreground="#222")
-    entry_frame = tk.Frame(master, bg=PANEL_COLOR)
-    entry_frame.grid(row=row, column=1, sticky="ew", padx=(0,0), pady=10)
-    entry = ttk.Entry(entry_frame, width=22, style="Custom.TEntry", font=("맑은 고딕", 12))
-    entry.pack(fill="x", ipady=7, padx=(0,0))
-    entry_frame.grid_columnconfigure(0, weight=1)
-    example = tk.Label(master, text=example_text, fg=EXAMPLE_TEXT, bg=PANEL_COLOR, font=("맑은 고딕", 10))
-    example.grid(row=row, column=2, sticky="w", padx=(8,8))
-    return entry
-
-# =========================
-# 메인 윈도우 구성
-# =========================
 
-root = tk.Tk()
-root.title("워들 단어 사전")
-root.geometry("560x740")
-root.configure(bg=BG_COLOR)
-root.resizable(False, False)
-
-# 타이틀 및 안내
-tk.Label(root, text="🎯 워들 단어 사전", font=TITLE_FONT, bg=BG_COLOR, fg=LABEL_TEXT).pack(pady=(28, 5))
-tk.Label(root, text="아래 조건을 입력하고 원하는 단어를 찾아보세요!", font=("맑은 고딕", 13), bg=BG_COLOR, fg=EXAMPLE_TEXT).pack()
-
-# 입력 패널
-frame = tk.Frame(root, bg=PANEL_COLOR, bd=0, relief="flat")
-frame.pack(pady=24, padx=18, fill="x")
-frame.grid_columnconfigure(1, weight=1)
-
-# 고급 입력창 생성
-entry_pattern = create_labeled_entry(frame, "[1] 확정된 글자 패턴", "예시: _ a _ b _", 0)
-entry_loose   = create_labeled_entry(frame, "[2] 특정 위치에는 오면 안 되는 글자", "예시: a(1,4) b(3,4)", 1)
-entry_exclude = create_labeled_entry(frame, "[3] 제외할 글자들", "예시: a,b,c,d,e", 2)
-
-# 검색 버튼
-btn_frame = tk.Frame(root, bg=BG_COLOR)
-btn_frame.pack(pady=16)
-
-search_btn = tk.Button(btn_frame, text="🔍 검색하기", command=run_filter, font=("맑은 고딕", 14, "bold"),
-          bg=BTN_COLOR, fg=BTN_TEXT, activebackground=RESULT_BG, activeforeground=BTN_TEXT,
-          relief="flat", bd=0, cursor="hand2", padx=24, pady=8)
-search_btn.pack(side="left", padx=(0, 12))
-
-# 확장 단어팩 토글 스위치
-USE_EXTENDED_WORDS_VAR = BooleanVar(value=USE_EXTENDED_WORDS)
-
-toggle_switch = ttk.Checkbutton(
-    btn_frame,
-    text="확장 단어팩 사용",
-    variable=USE_EXTENDED_WORDS_VAR,
-    command=on_extended_switch,
-    style="Switch.TCheckbutton"
-)
-toggle_switch.pack(side="left")
-
-# 스위치 스타일(파란색 강조)
-style = ttk.Style()
-style.configure("Switch.TCheckbutton",
-                font=("맑은 고딕", 12),
-                foreground=BTN_TEXT,
-                background=BG_COLOR)
-
-# 결과 출력 영역
-result_frame = tk.Frame(root, bg=RESULT_BG, bd=2, relief="groove")
-result_frame.pack(padx=18, pady=(0, 18), fill="both", expand=True)
-
-result_text = scrolledtext.ScrolledText(result_frame, width=62, height=22, font=RESULT_FONT,
-                                        bg=RESULT_BG, fg=RESULT_TEXT, bd=0, relief="flat", wrap="word")
-result_text.pack(padx=10, pady=10, fill="both", expand=True)
-result_text.config(state='disabled')
-
-# 상태 표시줄
-status_frame = tk.Frame(root, bg=BG_COLOR)
-status_frame.pack(side="bottom", fill="x")
-
-status_label = tk.Label(status_frame, text="워들 단어 사전입니다. 단어 검색을 시작해보세요!", font=("맑은 고딕", 10),
-                        bg=BG_COLOR, fg=EXAMPLE_TEXT)
-status_label.pack(pady=8)
+    def __init__(self, app):
+        self.app = app
+        self.board_labels = []
+        self.board_entries = []
+        self._future = None   # 작업 스레드에서 진행 중인 풀이
+        self._poll_job = None
+        self._started = 0.0
+        window = self.window = tk.Toplevel(app.root)
+        window.title("워들 멀티 보드")
+        window.geometry("560x720")
+        window.configure(bg=BG_COLOR)
+        window.protocol("WM_DELETE_WINDOW", self.close)
+
+        tk.Label(window, text="🧩 멀티 보드 (쿼들/옥토들)", font=TITLE_FONT, bg=BG_COLOR, fg=LABEL_TEXT).pack(pady=(20, 5))
+        tk.Label(window, text="보드마다 피드백 줄을 입력하세요. 예시: crane BYGBB, slate GBBYB",
+                 font=("맑은 고딕", 11), bg=BG_COLOR, fg=EXAMPLE_TEXT).pack()
+
+        top = tk.Frame(window, bg=BG_COLOR)
+        top.pack(pady=10)
+        tk.Label(top, text="보드 수", font=LABEL_FONT, bg=BG_COLOR, fg=LABEL_TEXT).pack(side="left")
+        self.board_count_var = tk.IntVar(value=MULTI_BOARDS)
+        ttk.Spinbox(top, from_=MIN_BOARDS, to=MAX_BOARDS, width=3, textvariable=self.board_count_var,
+                    command=self.build_boards, state="readonly").pack(side="left", padx=(8, 16))
+        tk.Button(top, text="🔍 풀기", command=self.solve, font=("맑은 고딕", 12, "bold"),
+                  bg=BTN_COLOR, fg=BTN_TEXT, activebackground=RESULT_BG, activeforeground=BTN_TEXT,
+                  relief="flat", bd=0, cursor="hand2", padx=18, pady=6).pack(side="left")
+
+        self.board_frame = tk.Frame(window, bg=PANEL_COLOR)
+        self.board_frame.pack(padx=18, fill="x")
+        self.board_frame.grid_columnconfigure(1, weight=1)
+        self.build_boards()
+
+        self.result_text = scrolledtext.ScrolledText(window, width=62, height=16, font=RESULT_FONT,
+                                                     bg=RESULT_BG, fg=RESULT_TEXT, bd=0, relief="flat", wrap="word")
+        self.result_text.pack(padx=18, pady=12, fill="both", expand=True)
+        self.result_text.tag_config("letter_tag", foreground=LETTER_TAG, font=("맑은 고딕", 13, "bold"))
+        self.result_text.config(state='disabled')
+        self.status_label = tk.Label(window, text="", font=("맑은 고딕", 10), bg=BG_COLOR, fg=EXAMPLE_TEXT)
+        self.status_label.pack(pady=(0, 8))
+
+    def build_boards(self):
+        """
+        보드 수에 맞게 입력창을 늘리거나 줄입니다. 남는 입력창의 내용은 그대로 둡니다.
+        """
+        count = self.board_count_var.get()
+        while len(self.board_entries) < count:
+            row = len(self.board_entries)
+            label = tk.Label(self.board_frame, text=f"[{row + 1}]", font=LABEL_FONT, bg=PANEL_COLOR, fg=LABEL_TEXT)
+            label.grid(row=row, column=0, sticky="w", padx=(12, 8), pady=4)
+            entry = ttk.Entry(self.board_frame, style="Custom.TEntry", font=("맑은 고딕", 12))
+            entry.grid(row=row, column=1, sticky="ew", padx=(0, 12), pady=4, ipady=4)
+            entry.bind("<Return>", lambda event: self.solve())
+            self.board_labels.append(label)
+            self.board_entries.append(entry)
+        for row, widgets in enumerate(zip(self.board_labels, self.board_entries)):
+            for widget in widgets:
+                if row < count:
+                    widget.grid()
+                else:
+                    widget.grid_remove()
+
+    def solve(self):
+        """
+        보드 입력을 작업 스레드로 넘겨 풀고, 끝나면 결과를 보여줍니다.
+        """
+        boards = [entry.get().strip() for entry in self.board_entries[:self.board_count_var.get()]]
+        self.status_label.config(text="푸는 중입니다...")
+        self._started = time.perf_counter()
+        self._future = self.app._search_executor.submit(self.app.solve_boards, boards, self.app.use_extended)
+        if self._poll_job is None:
+            self._poll_job = self.window.after(SEARCH_POLL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_job = None
+        future = self._future
+        if future is None:
+            return
+        if not future.done():
+            self._poll_job = self.window.after(SEARCH_POLL_MS, self._poll)
+            return
+        self._future = None
+        try:
+            results, suggestions = future.result()
+        except Exception as e:  # 작업 스레드의 오류는 상태 표시줄에 알려줍니다.
+            self.status_label.config(text=f"입력을 해석할 수 없습니다: {e}")
+            return
+        args = []
+        for number, result in enumerate(results, 1):
+            candidates = result["candidates"]
+            if result["solved"]:
+                args += [f"[{number}] 완료: {candidates[0]}\n", ()]
+                continue
+            args += [f"[{number}] 후보 {len(candidates)}개\n", "letter_tag"]
+            shown = ", ".join(candidates[:MULTI_SHOW_WORDS])
+            more = f" 외 {len(candidates) - MULTI_SHOW_WORDS}개" if len(candidates) > MULTI_SHOW_WORDS else ""
+            args += [f"{shown or '😥 조건에 맞는 단어가 없습니다.'}{more}\n\n", ()]
+        if suggestions:
+            args += ["🎯 추천 다음 단어 (모든 보드의 기대 정보량 합, 후보인 보드 수)\n", "letter_tag"]
+            lines = [f"{rank:2d}. {word}  {bits:.2f}비트  보드 {boards}개\n"
+                     for rank, (word, bits, boards) in enumerate(suggestions, 1)]
+            args += ["".join(lines), ()]
+        self.result_text.config(state='normal')
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, *args)
+        self.result_text.config(state='disabled')
+        elapsed = (time.perf_counter() - self._started) * 1000
+        self.status_label.config(text=f"풀이가 완료되었습니다. ({elapsed:.0f} ms)")
+
+    def close(self):
+        if self._poll_job is not None:
+            self.window.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._future = None
+        self.window.destroy()
 
 # =========================
 # 프로그램 실행
 # =========================
 
-root.mainloop()
+def main(app_class=WordleDictApp):
+    _import_tkinter()
+    # 단어 파일은 한 번만 읽고, 파일이 바뀌었을 때만 다시 읽습니다.
+    # 컴파일된 words.wdb가 최신이면 텍스트 대신 그 파일을 읽고, 아니면 미리 읽기 단계에서 새로 컴파일합니다.
+    word_store = WordStore("words.txt", "user_words.txt", "extended_words.txt", db_path=DEFAULT_DB_PATH,
+                           cache_size=QUERY_CACHE_SIZE)
+    root = tk.Tk()
+    app = app_class(root, word_store)
+    # 기본/확장 단어 목록과 인덱스를 미리 만들어 두어 첫 검색과 확장 단어팩 전환이 바로 처리되도록 합니다.
+    app.preload()
+    # 사용자 단어 파일(자동화 도구가 자주 덧붙이는 파일)이 바뀌면 바뀐 단어만 반영합니다.
+    app.watch_user_words()
+    root.mainloop()
+    app.shutdown()
+    return app
+
+if __name__ == "__main__":
+    main()
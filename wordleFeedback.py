@@ -0,0 +1,546 @@
+"""
+워들 피드백(회색/노랑/초록) 계산과 피드백 표를 다루는 모듈입니다.
+
+피드백 코드는 글자마다 0(회색), 1(노랑), 2(초록)를 3진수로 묶은 값이며,
+i번째 글자의 자리값은 3**i 입니다. 다섯 글자 단어는 3**5 = 243가지 코드를 가지므로 1바이트에 들어갑니다.
+워들 변형 게임의 다른 길이(4~11글자)도 같은 방식이며, 6~10글자는 2바이트, 11글자는 4바이트 코드를 씁니다.
+
+parse_feedback_rows와 compile_feedback은 'crane BYGBB' 같은 피드백 줄을 읽어
+보드 전체의 조건을 제약 프로그램(wordleCore.ConstraintProgram) 하나로 컴파일합니다.
+
+FeedbackMatrix는 (추측 단어 × 정답 후보) 피드백 코드 표를 파일로 저장해 두고
+다음 실행부터는 메모리 맵으로 엽니다. 여러 프로세스가 같은 파일을 열면 페이지를 그대로 공유합니다.
+단어 목록이 바뀌면 표를 다시 만듭니다. 표를 만들고 읽으려면 NumPy가 필요합니다.
+
+사용 예:
+    python wordleFeedback.py --extended   # 확장 단어팩 기준 피드백 표를 미리 만들어 둡니다.
+    python wordleFeedback.py --length 6   # 여섯 글자 게임용 피드백 표
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import struct
+
+from wordleCore import (ConstraintProgram, WordStore, add_word_file_arguments, import_numpy, parse_query,
+                        word_file_paths)
+
+WORD_LENGTH = 5                          # 기본 단어 길이 (워들)
+MIN_WORD_LENGTH = 4                      # 피드백 표와 추천을 지원하는 단어 길이 범위 (워들 변형 게임)
+MAX_WORD_LENGTH = 11
+FEEDBACK_STATES = 3 ** WORD_LENGTH       # 다섯 글자 단어의 피드백 코드 수 (243)
+ALL_GREEN = FEEDBACK_STATES - 1          # 정답을 맞혔을 때의 피드백 코드
+
+GRAY, YELLOW, GREEN = 0, 1, 2
+COLOR_LETTERS = "BYG"                    # 피드백 코드를 글자로 나타낼 때 쓰는 문자 (회색, 노랑, 초록)
+# 피드백 줄에서 B/Y/G 대신 쓸 수 있는 색 표기 (숫자, 워들 결과 공유 이모지)
+COLOR_ALIASES = {"0": "B", "1": "Y", "2": "G", "⬛": "B", "⬜": "B", "🟨": "Y", "🟩": "G"}
+
+# 피드백 표 파일 형식: 헤더(64바이트) + code_dtype(단어 길이) 행렬 (추측 단어 수 × 정답 후보 수, 행 우선)
+_MAGIC = b"WDFB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHII32s")
+_HEADER_SIZE = 64
+
+def code_dtype(length):
+    """
+    length 글자 단어의 피드백 코드를 담는 가장 작은 NumPy 정수형을 반환합니다.
+    """
+    np = _require_numpy()
+    states = 3 ** length
+    if states <= 1 << 8:
+        return np.uint8
+    if states <= 1 << 16:
+        return np.uint16
+    return np.uint32
+
+def feedback_code(guess, answer):
+    """
+    guess를 입력했을 때 answer에 대해 받는 피드백 코드를 계산합니다. (순수 파이썬 기준 구현)
+    같은 글자가 여러 번 나오면 초록을 먼저 정하고, 남은 글자 수만큼 왼쪽부터 노랑을 줍니다.
+    """
+    colors = [GRAY] * len(guess)
+    remaining = {}
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            colors[i] = GREEN
+        else:
+            remaining[a] = remaining.get(a, 0) + 1
+    for i, g in enumerate(guess):
+        if colors[i] == GRAY and remaining.get(g, 0) > 0:
+            colors[i] = YELLOW
+            remaining[g] -= 1
+    return sum(color * 3 ** i for i, color in enumerate(colors))
+
+def colors_from_code(code, length=WORD_LENGTH):
+    """
+    피드백 코드를 'BYGBB' 같은 색 문자열로 바꿉니다.
+    """
+    letters = []
+    for _ in range(length):
+        code, color = divmod(code, 3)
+        letters.append(COLOR_LETTERS[color])
+    return "".join(letters)
+
+def code_from_colors(colors):
+    """
+    'BYGBB' 같은 색 문자열을 피드백 코드로 바꿉니다.
+    """
+    code = 0
+    for i, letter in enumerate(colors.upper()):
+        if letter not in COLOR_LETTERS:
+            raise ValueError(f"알 수 없는 피드백 색입니다: {letter} (B, Y, G 중 하나)")
+        code += COLOR_LETTERS.index(letter) * 3 ** i
+    return code
+
+def feedback_to_fields(rows):
+    """
+    (추측 단어, 색 문자열) 행들을 GUI 입력창과 같은 세 값(패턴, 유동 글자, 제외 글자)으로 바꿉니다.
+    - 초록: 패턴의 그 자리에 글자를 넣습니다.
+    - 노랑: 유동 글자로, 노랑이 나온 자리들을 금지 위치로 넣습니다.
+    - 회색: 보드 어디에서도 초록/노랑이 아닌 글자만 제외 글자로 넣습니다.
+      다른 자리에서 초록/노랑인 글자라면 그 자리를 유동 글자의 금지 위치로 넣습니다.
+      (같은 글자가 여러 번 나오는 경우의 개수 정보는 세 값으로 나타낼 수 없어 버립니다.)
+    """
+    length = len(rows[0][0]) if rows else 0
+    pattern = ["_"] * length
+    loose = {}
+    grays = []
+    present = set()
+    for guess, colors in rows:
+        for pos, (letter, color) in enumerate(zip(guess, colors.upper())):
+            if color == "G":
+                pattern[pos] = letter
+                present.add(letter)
+            elif color == "Y":
+                loose.setdefault(letter, [])
+                if pos + 1 not in loose[letter]:
+                    loose[letter].append(pos + 1)
+                present.add(letter)
+            else:
+                grays.append((pos, letter))
+    for pos, letter in grays:
+        if letter in present:
+            loose.setdefault(letter, [])
+            if pos + 1 not in loose[letter]:
+                loose[letter].append(pos + 1)
+    exclude = [letter for letter in dict.fromkeys(letter for _, letter in grays) if letter not in present]
+    loose_text = " ".join(f"{letter}({','.join(map(str, positions))})" for letter, positions in loose.items())
+    return " ".join(pattern), loose_text, ",".join(exclude)
+
+def parse_feedback_rows(text):
+    """
+    'crane BYGBB, slate BBGYB' 같은 피드백 줄 입력을 [(추측 단어, 색 문자열), ...]로 읽습니다.
+    줄은 줄바꿈, 쉼표, 세미콜론으로 구분하고, 한 줄은 추측 단어와 색을 공백으로 구분합니다.
+    색은 B(회색), Y(노랑), G(초록) 외에 0/1/2나 ⬛🟨🟩 이모지로도 쓸 수 있습니다.
+    """
+    rows = []
+    for chunk in re.split(r"[\n,;]+", text):
+        parts = chunk.replace("\ufe0f", "").split()
+        if not parts:
+            continue
+        if len(parts) != 2:
+            raise ValueError(f"피드백 줄은 '단어 색' 형식이어야 합니다: {chunk.strip()}")
+        guess, colors = parts[0].lower(), parts[1].upper()
+        colors = "".join(COLOR_ALIASES.get(color, color) for color in colors)
+        for color in colors:
+            if color not in COLOR_LETTERS:
+                raise ValueError(f"알 수 없는 피드백 색입니다: {color} (B, Y, G 중 하나)")
+        if not guess.isalpha():
+            raise ValueError(f"추측 단어에는 글자만 쓸 수 있습니다: {parts[0]}")
+        if len(colors) != len(guess):
+            raise ValueError(f"단어와 색의 글자 수가 다릅니다: {chunk.strip()}")
+        rows.append((guess, colors))
+    return rows
+
+def compile_feedback(rows, fixed_pattern="", loose_letters="", exclude_letters=""):
+    """
+    (추측 단어, 색 문자열) 행들을 보드 전체의 제약 프로그램(ConstraintProgram) 하나로 컴파일합니다.
+    - 초록: 그 자리에 그 글자가 옵니다.
+    - 노랑/회색: 그 자리에는 그 글자가 오지 않습니다.
+    - 한 줄에서 같은 글자의 초록/노랑 수가 그 글자의 최소 개수이고,
+      같은 줄에서 그 글자가 회색으로도 나왔으면 그 수가 정확한 개수입니다. (회색으로만 나온 글자는 0개)
+    여러 줄의 조건은 하나로 합치므로 줄이 많아도 단어마다 한 번씩만 검사합니다.
+    세 입력값을 함께 주면 filter_words와 같은 규칙으로 해석해 조건에 더합니다.
+    이때 패턴에는 '_'와 글자만 쓸 수 있습니다. 조건이 서로 맞지 않으면 ValueError를 냅니다.
+    """
+    query = parse_query(fixed_pattern, loose_letters, exclude_letters)
+    if query is None:
+        raise ValueError("피드백 줄과 함께 쓰는 패턴에는 '_'와 글자만 쓸 수 있습니다.")
+    pattern_length, fixed, exclude_set, loose_map = query
+    lengths = {len(guess) for guess, _ in rows}
+    if pattern_length:
+        lengths.add(pattern_length)
+    if not lengths:
+        raise ValueError("피드백 줄이 없습니다.")
+    if len(lengths) > 1:
+        raise ValueError(f"피드백 줄과 패턴의 글자 수가 서로 다릅니다: {sorted(lengths)}")
+    length = lengths.pop()
+    greens = {}
+    forbidden = {}
+    counts = {}  # 글자 -> [최소 개수, 최대 개수 또는 None]
+
+    def add_green(pos, letter):
+        if greens.setdefault(pos, letter) != letter:
+            raise ValueError(f"{pos + 1}번째 자리에 서로 다른 글자가 확정되어 있습니다 ({greens[pos]}, {letter}).")
+
+    def bound(letter):
+        return counts.setdefault(letter, [0, None])
+
+    for guess, colors in rows:
+        found = {}
+        grays = set()
+        for pos, (letter, color) in enumerate(zip(guess, colors.upper())):
+            if color == "G":
+                add_green(pos, letter)
+                found[letter] = found.get(letter, 0) + 1
+            else:
+                forbidden.setdefault(pos, set()).add(letter)
+                if color == "Y":
+                    found[letter] = found.get(letter, 0) + 1
+                else:
+                    grays.add(letter)
+        for letter, count in found.items():
+            limits = bound(letter)
+            limits[0] = max(limits[0], count)
+        for letter in grays:
+            limits = bound(letter)
+            count = found.get(letter, 0)
+            limits[1] = count if limits[1] is None else min(limits[1], count)
+
+    for pos, letter in fixed:
+        add_green(pos, letter)
+    for letter in exclude_set:
+        if not letter.isspace():
+            bound(letter)[1] = 0
+    for letter, bad_positions in loose_map.items():
+        limits = bound(letter)
+        limits[0] = max(limits[0], 1)
+        for pos in bad_positions:
+            forbidden.setdefault(pos, set()).add(letter)
+    return ConstraintProgram(length, greens, forbidden, {letter: tuple(limits) for letter, limits in counts.items()})
+
+def feedback_words(words, length=WORD_LENGTH):
+    """
+    피드백 표에 넣을 수 있는 단어(알파벳 소문자 length글자)만 중복 없이 원래 순서대로 골라냅니다.
+    """
+    return list(dict.fromkeys(word for word in words
+                              if len(word) == length and word.isascii() and word.isalpha()))
+
+def _require_numpy():
+    np = import_numpy()
+    if np is None:
+        raise ImportError("피드백 표를 사용하려면 numpy가 필요합니다.")
+    return np
+
+def _letter_matrix(words):
+    """
+    같은 길이의 단어들을 (단어 수, 글자 수) 크기의 uint8 글자 행렬로 바꿉니다.
+    """
+    np = _require_numpy()
+    length = len(words[0]) if words else 0
+    data = "".join(words).encode("ascii")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(words), length)
+
+def compute_feedback_matrix(guesses, answers, chunk_size=256, out=None):
+    """
+    모든 (추측 단어, 정답 후보) 쌍의 피드백 코드를 벡터 연산으로 계산해 행렬로 반환합니다. (정수형은 code_dtype)
+    추측 단어를 chunk_size개씩 나누어 계산하므로 메모리 사용량이 일정합니다.
+    out을 주면 그 배열(예: 파일에 대한 memmap)에 바로 씁니다.
+
+    i번째 글자가 초록이 아니면, 정답에서 초록이 아닌 자리에 남은 같은 글자 수(available)와
+    추측 단어에서 i번째까지 초록이 아닌 같은 글자의 순번(rank)을 비교해 rank <= available일 때 노랑입니다.
+    feedback_code와 같은 규칙을 글자 위치 쌍 비교만으로 계산합니다.
+    """
+    np = _require_numpy()
+    guess_letters = _letter_matrix(guesses)
+    answer_letters = _letter_matrix(answers)
+    length = answer_letters.shape[1]
+    num_answers = len(answers)
+    dtype = code_dtype(length)
+    if out is None:
+        out = np.empty((len(guesses), num_answers), dtype=dtype)
+    answer_cols = [answer_letters[:, pos][None, :] for pos in range(length)]
+    for start in range(0, len(guesses), chunk_size):
+        chunk = guess_letters[start:start + chunk_size]
+        guess_cols = [chunk[:, pos][:, None] for pos in range(length)]
+        # not_green[pos]: (추측 단어, 정답) 쌍마다 pos번째 글자가 초록이 아닌지 여부
+        not_green = [guess_cols[pos] != answer_cols[pos] for pos in range(length)]
+        codes = np.zeros((len(chunk), num_answers), dtype=dtype)
+        for i in range(length):
+            codes += (~not_green[i]).view(np.uint8) * dtype(2 * 3 ** i)
+            available = np.zeros((len(chunk), num_answers), dtype=np.uint8)
+            for k in range(length):
+                available += ((answer_cols[k] == guess_cols[i]) & not_green[k]).view(np.uint8)
+            rank = not_green[i].view(np.uint8).copy()
+            for j in range(i):
+                same_letter = (chunk[:, j] == chunk[:, i])[:, None]
+                rank += (same_letter & not_green[j]).view(np.uint8)
+            yellow = not_green[i] & (rank <= available)
+            codes += yellow.view(np.uint8) * dtype(3 ** i)
+        out[start:start + len(chunk)] = codes
+    return out
+
+def _digest(guesses, answers):
+    """
+    단어 목록이 바뀌었는지 확인하기 위한 해시를 계산합니다.
+    """
+    h = hashlib.sha256()
+    h.update("\n".join(guesses).encode("utf-8"))
+    h.update(b"\0")
+    h.update("\n".join(answers).encode("utf-8"))
+    return h.digest()
+
+def _read_header(path):
+    """
+    피드백 표 파일의 헤더를 (글자 수, 추측 단어 수, 정답 후보 수, 해시)로 읽습니다.
+    파일이 없거나 형식이 다르면 None을 반환합니다.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(_HEADER.size)
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+    except FileNotFoundError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, length, num_guesses, num_answers, digest = _HEADER.unpack(data)
+    if magic != _MAGIC or version != _VERSION:
+        return None
+    if size != _HEADER_SIZE + num_guesses * num_answers * code_dtype(length)().itemsize:
+        return None
+    return length, num_guesses, num_answers, digest
+
+def write_feedback_file(path, guesses, answers, length=WORD_LENGTH):
+    """
+    피드백 표를 계산해 파일로 저장합니다. 임시 파일에 쓴 뒤 바꿔치기하므로 중간에 실패해도 기존 파일은 그대로입니다.
+    """
+    np = _require_numpy()
+    dtype = code_dtype(length)
+    header = _HEADER.pack(_MAGIC, _VERSION, length, len(guesses), len(answers), _digest(guesses, answers))
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        f.truncate(_HEADER_SIZE + len(guesses) * len(answers) * dtype().itemsize)
+    if guesses and answers:
+        matrix = np.memmap(tmp_path, dtype=dtype, mode="r+", offset=_HEADER_SIZE,
+                           shape=(len(guesses), len(answers)))
+        compute_feedback_matrix(guesses, answers, out=matrix)
+        matrix.flush()
+        del matrix
+    os.replace(tmp_path, path)
+
+def default_feedback_path(use_extended=False, length=WORD_LENGTH):
+    name = "feedback_extended" if use_extended else "feedback_base"
+    return f"{name}.bin" if length == WORD_LENGTH else f"{name}_{length}.bin"
+
+class FeedbackMatrix:
+    """
+    (추측 단어 × 정답 후보) 피드백 코드 표입니다.
+    - guesses: 현재 사전(기본 또는 확장 + 사용자 단어)의 length 글자 단어
+    - answers: 정답 후보 (words.txt + user_words.txt의 length 글자 단어)
+    - matrix: 파일을 읽기 전용으로 연 memmap (정수형은 code_dtype), matrix[추측 번호, 정답 번호] = 피드백 코드
+    """
+
+    # entropies 결과를 기억해 두는 후보 집합 수 (첫 수처럼 같은 후보 집합이 반복될 때 재사용)
+    ENTROPY_CACHE_SIZE = 8
+    # 엔트로피 계산에서 한 번에 세는 (추측 단어 × 피드백 코드) 칸 수의 상한 (긴 단어에서 메모리 사용량 제한)
+    MAX_COUNT_CELLS = 1 << 22
+
+    def __init__(self, path, guesses, answers, length=WORD_LENGTH):
+        np = _require_numpy()
+        self.path = path
+        self.length = length
+        self.states = 3 ** length
+        self._entropy_cache = {}  # 후보 열 번호 바이트열 -> 엔트로피 배열
+        self.guesses = guesses
+        self.answers = answers
+        self.guess_rows = {word: i for i, word in enumerate(guesses)}
+        self.answer_cols = {word: i for i, word in enumerate(answers)}
+        dtype = code_dtype(length)
+        if guesses and answers:
+            self.matrix = np.memmap(path, dtype=dtype, mode="r", offset=_HEADER_SIZE,
+                                    shape=(len(guesses), len(answers)))
+        else:
+            self.matrix = np.zeros((len(guesses), len(answers)), dtype=dtype)
+
+    @classmethod
+    def load_or_build(cls, store, use_extended=False, path=None, length=WORD_LENGTH):
+        """
+        단어 저장소 기준의 length 글자 피드백 표를 엽니다. 파일이 없거나 단어 목록이 바뀌었으면 새로 만듭니다.
+        """
+        guesses = feedback_words(store.words(use_extended), length)
+        answers = feedback_words(store.words(False), length)
+        path = path or default_feedback_path(use_extended, length)
+        expected = (length, len(guesses), len(answers), _digest(guesses, answers))
+        if _read_header(path) != expected:
+            write_feedback_file(path, guesses, answers, length)
+        return cls(path, guesses, answers, length)
+
+    def code(self, guess, answer):
+        """
+        표에서 guess와 answer 사이의 피드백 코드를 찾습니다.
+        """
+        return int(self.matrix[self.guess_rows[guess], self.answer_cols[answer]])
+
+    def answer_ids(self, words):
+        """
+        단어 목록 중 정답 후보에 있는 단어들의 열 번호 배열을 반환합니다.
+        """
+        np = _require_numpy()
+        cols = self.answer_cols
+        return np.array([cols[word] for word in words if word in cols], dtype=np.intp)
+
+    def narrow(self, guess, code, answer_ids=None):
+        """
+        guess에 대해 code 피드백을 받았을 때 남는 정답 후보의 열 번호 배열을 반환합니다.
+        answer_ids를 주면 그 후보들 안에서만 찾습니다.
+        """
+        np = _require_numpy()
+        row = self.matrix[self.guess_rows[guess]]
+        if answer_ids is None:
+            return np.flatnonzero(row == code)
+        return answer_ids[row[answer_ids] == code]
+
+    def entropies(self, answer_ids, chunk_size=256):
+        """
+        남은 정답 후보(answer_ids)에 대해 각 추측 단어가 주는 피드백 분포의 엔트로피(비트)를 계산합니다.
+        추측 단어 행을 chunk_size개씩 나누어 피드백 코드를 bincount로 세므로,
+        계산량은 (추측 단어 수 × 남은 후보 수)에 비례하고 후보가 줄어들수록 빨라집니다.
+        긴 단어는 피드백 코드 종류(3^length)가 많으므로 묶음 크기를 MAX_COUNT_CELLS에 맞춰 줄입니다.
+        """
+        np = _require_numpy()
+        answer_ids = np.asarray(answer_ids, dtype=np.intp)
+        key = answer_ids.tobytes()
+        cached = self._entropy_cache.get(key)
+        if cached is not None:
+            return cached
+        num_guesses = len(self.guesses)
+        total = len(answer_ids)
+        all_answers = total == len(self.answers) and bool((answer_ids == np.arange(total)).all())
+        result = np.zeros(num_guesses, dtype=np.float64)
+        if total > 1:
+            # H = log2(n) - sum(c * log2(c)) / n, c * log2(c)는 미리 표로 만들어 둡니다.
+            counts_range = np.arange(total + 1, dtype=np.float64)
+            c_log_c = counts_range * np.log2(np.maximum(counts_range, 1))
+            states = self.states
+            chunk_size = self._chunk_rows(chunk_size, states)
+            for start in range(0, num_guesses, chunk_size):
+                block = self.matrix[start:start + chunk_size]
+                if not all_answers:
+                    block = np.take(block, answer_ids, axis=1)
+                rows = len(block)
+                codes = block.astype(np.uint32)
+                codes += (np.arange(rows, dtype=np.uint32) * np.uint32(states))[:, None]
+                counts = np.bincount(codes.ravel(), minlength=rows * states)
+                counts = counts.reshape(rows, states)
+                result[start:start + rows] = np.log2(total) - c_log_c[counts].sum(axis=1) / total
+        if len(self._entropy_cache) >= self.ENTROPY_CACHE_SIZE:
+            self._entropy_cache.pop(next(iter(self._entropy_cache)))
+        self._entropy_cache[key] = result
+        return result
+
+    def _chunk_rows(self, chunk_size, states):
+        """
+        한 묶음의 bincount 칸 수(행 수 × states)가 MAX_COUNT_CELLS를 넘지 않도록 행 수를 줄입니다.
+        """
+        return max(1, min(chunk_size, self.MAX_COUNT_CELLS // states))
+
+    def best_guesses(self, candidates, top=10):
+        """
+        후보 단어 목록을 기준으로 기대 정보량(엔트로피)이 큰 추측 단어 top개를 [(단어, 비트, 후보 여부)]로 반환합니다.
+        엔트로피가 같으면 정답일 수도 있는 후보 단어를 먼저 둡니다.
+        정답 후보 목록에 없는 단어는 계산에서 빠지며, 남는 후보가 없으면 빈 리스트를 반환합니다.
+        """
+        np = _require_numpy()
+        answer_ids = self.answer_ids(candidates)
+        if len(answer_ids) == 0 or not self.guesses:
+            return []
+        scores = self.entropies(answer_ids)
+        is_candidate = np.zeros(len(self.guesses), dtype=bool)
+        rows = self.guess_rows
+        candidate_rows = [rows[self.answers[col]] for col in answer_ids.tolist() if self.answers[col] in rows]
+        is_candidate[candidate_rows] = True
+        # 점수를 반올림해 부동소수점 오차로 순서가 흔들리지 않게 합니다.
+        order = np.lexsort((~is_candidate, -np.round(scores, 9)))[:top]
+        return [(self.guesses[i], float(scores[i]), bool(is_candidate[i])) for i in order.tolist()]
+
+    def joint_entropies(self, answer_id_sets, chunk_size=256):
+        """
+        여러 보드(쿼들, 옥토들)의 남은 정답 후보(answer_id_sets)에 대해 각 추측 단어의 엔트로피 합(비트)을 계산합니다.
+        모든 보드의 후보 열을 한 번에 모으고, 피드백 코드에 보드 번호만큼 3^length씩 더해
+        추측 단어 묶음마다 bincount 한 번으로 모든 보드의 피드백 분포를 셉니다.
+        보드 수만큼 entropies를 따로 부르는 것보다 표를 읽는 횟수가 적습니다.
+        """
+        np = _require_numpy()
+        sets = [np.asarray(ids, dtype=np.intp) for ids in answer_id_sets]
+        sets = [ids for ids in sets if len(ids) > 0]
+        num_guesses = len(self.guesses)
+        result = np.zeros(num_guesses, dtype=np.float64)
+        if not sets:
+            return result
+        if len(sets) == 1:
+            return self.entropies(sets[0], chunk_size)
+        boards = len(sets)
+        totals = np.array([len(ids) for ids in sets], dtype=np.float64)
+        all_ids = np.concatenate(sets)
+        board_offsets = (np.repeat(np.arange(boards, dtype=np.uint32), [len(ids) for ids in sets])
+                         * np.uint32(self.states))
+        counts_range = np.arange(int(totals.max()) + 1, dtype=np.float64)
+        c_log_c = counts_range * np.log2(np.maximum(counts_range, 1))
+        states = boards * self.states
+        chunk_size = self._chunk_rows(chunk_size, states)
+        for start in range(0, num_guesses, chunk_size):
+            block = np.take(self.matrix[start:start + chunk_size], all_ids, axis=1)
+            rows = len(block)
+            codes = block.astype(np.uint32)
+            codes += board_offsets[None, :]
+            codes += (np.arange(rows, dtype=np.uint32) * np.uint32(states))[:, None]
+            counts = np.bincount(codes.ravel(), minlength=rows * states).reshape(rows, boards, self.states)
+            board_entropies = np.log2(totals)[None, :] - c_log_c[counts].sum(axis=2) / totals[None, :]
+            result[start:start + rows] = board_entropies.sum(axis=1)
+        return result
+
+    def best_joint_guesses(self, candidate_lists, top=10):
+        """
+        보드마다의 후보 단어 목록을 함께 기준으로 다음 추측 단어 top개를 [(단어, 비트 합, 후보인 보드 수)]로 반환합니다.
+        어떤 보드의 유일한 후보라서 그 보드를 바로 끝낼 수 있는 단어를 먼저 두고,
+        그다음은 엔트로피 합이 큰 순서, 같으면 후보로 들어 있는 보드가 많은 순서입니다.
+        """
+        np = _require_numpy()
+        id_sets = [self.answer_ids(candidates) for candidates in candidate_lists]
+        id_sets = [ids for ids in id_sets if len(ids) > 0]
+        if not id_sets or not self.guesses:
+            return []
+        scores = self.joint_entropies(id_sets)
+        candidate_boards = np.zeros(len(self.guesses), dtype=np.int64)
+        finishes = np.zeros(len(self.guesses), dtype=np.int64)
+        rows = self.guess_rows
+        for ids in id_sets:
+            board_rows = [rows[self.answers[col]] for col in ids.tolist() if self.answers[col] in rows]
+            candidate_boards[board_rows] += 1
+            if len(ids) == 1:
+                finishes[board_rows] += 1
+        order = np.lexsort((-candidate_boards, -np.round(scores, 9), -finishes))[:top]
+        return [(self.guesses[i], float(scores[i]), int(candidate_boards[i])) for i in order.tolist()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워들 피드백 표를 미리 만들어 둡니다.")
+    parser.add_argument("--extended", action="store_true", help="확장 단어팩 기준으로 만듭니다.")
+    parser.add_argument("-o", "--output", default=None, help="피드백 표 파일 경로")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH,
+                        help=f"단어 길이 ({MIN_WORD_LENGTH}~{MAX_WORD_LENGTH}, 기본 {WORD_LENGTH})")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+    paths = word_file_paths(parser, args, args.extended)
+    if not MIN_WORD_LENGTH <= args.length <= MAX_WORD_LENGTH:
+        parser.error(f"단어 길이는 {MIN_WORD_LENGTH}~{MAX_WORD_LENGTH}여야 합니다: {args.length}")
+    store = WordStore(paths["base"], paths["user"], paths["extended"], db_path=args.db)
+    table = FeedbackMatrix.load_or_build(store, args.extended, args.output, args.length)
+    size = len(table.guesses) * len(table.answers) * table.matrix.itemsize
+    print(f"{table.path}: 추측 단어 {len(table.guesses)}개 × 정답 후보 {len(table.answers)}개 ({size / 1e6:.1f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+여러 보드를 동시에 푸는 쿼들(4개)/옥토들(8개) 모드입니다.
+
+보드마다 피드백 줄('crane BYGBB, slate GBBYB')을 따로 받아 제약 프로그램으로 컴파일하고,
+모든 보드가 한 번 읽은 단어 목록과 검색 인덱스, 피드백 표를 함께 씁니다.
+다음 추측 단어는 끝나지 않은 모든 보드의 후보를 함께 기준으로 한 번의 벡터 연산으로 점수를 매깁니다.
+(FeedbackMatrix.joint_entropies 참고)
+단어 길이는 피드백 줄의 추측 단어에서 정해지며, 모든 보드가 같은 길이여야 합니다.
+
+사용 예:
+    python wordleMulti.py "crane BYGBB" "crane BBBBB" "crane GBBBY" "crane BBYBB"
+    python wordleMulti.py --extended "crane BYGBB, slate GBBYB" "crane BBBBB" "" ""
+"""
+
+import argparse
+import time
+
+from wordleCore import WordStore, add_word_file_arguments, search, word_file_paths
+from wordleFeedback import (MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH, FeedbackMatrix, compile_feedback,
+                            parse_feedback_rows)
+
+MIN_BOARDS = 4   # 쿼들
+MAX_BOARDS = 8   # 옥토들
+TOP_GUESSES = 10
+
+def is_solved(rows):
+    """
+    피드백 줄 중 모두 초록인 줄이 있으면 그 보드는 끝난 것입니다.
+    """
+    return any(set(colors.upper()) == {"G"} for _, colors in rows)
+
+def board_candidates(index, rows, length=WORD_LENGTH):
+    """
+    한 보드의 피드백 줄에 맞는 후보 단어를 반환합니다. 줄이 없으면 length 글자 단어 전체입니다.
+    """
+    if not rows:
+        return search(index, " ".join("_" * length), "", "")
+    for guess, colors in rows:
+        if set(colors.upper()) == {"G"}:
+            return [guess]
+    return index.filter_program(compile_feedback(rows))
+
+def parse_boards(boards):
+    """
+    보드 목록(보드마다 피드백 줄 문자열 또는 (추측 단어, 색) 행 리스트)을 읽어 (보드별 행 리스트, 단어 길이)를 반환합니다.
+    단어 길이는 첫 추측 단어의 길이이고, 피드백 줄이 하나도 없으면 WORD_LENGTH입니다.
+    보드 수가 범위를 벗어나거나 보드마다 단어 길이가 다르면 ValueError를 발생시킵니다.
+    """
+    if not MIN_BOARDS <= len(boards) <= MAX_BOARDS:
+        raise ValueError(f"보드 수는 {MIN_BOARDS}~{MAX_BOARDS}개여야 합니다: {len(boards)}")
+    parsed = [parse_feedback_rows(board) if isinstance(board, str) else list(board) for board in boards]
+    lengths = {len(guess) for rows in parsed for guess, _ in rows}
+    if len(lengths) > 1:
+        raise ValueError(f"모든 보드의 단어 길이가 같아야 합니다: {sorted(lengths)}")
+    return parsed, lengths.pop() if lengths else WORD_LENGTH
+
+def solve_boards(index, boards, table=None, top=TOP_GUESSES):
+    """
+    보드 목록(보드마다 피드백 줄 문자열 또는 (추측 단어, 색) 행 리스트)을 풀어
+    ([보드별 {"rows", "solved", "candidates"}], 추천 다음 단어)를 반환합니다.
+    table(FeedbackMatrix)을 주면 끝나지 않은 보드들의 후보를 함께 기준으로
+    [(단어, 비트 합, 후보인 보드 수)] 추천 목록을 만들고, 없거나 단어 길이가 다른 표이면 빈 리스트입니다.
+    """
+    parsed, length = parse_boards(boards)
+    results = []
+    for rows in parsed:
+        results.append({"rows": rows, "solved": is_solved(rows), "candidates": board_candidates(index, rows, length)})
+    suggestions = []
+    if table is not None and table.length == length:
+        open_boards = [result["candidates"] for result in results if not result["solved"] and result["candidates"]]
+        if open_boards:
+            suggestions = table.best_joint_guesses(open_boards, top)
+    return results, suggestions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿼들/옥토들 여러 보드 동시 풀이")
+    parser.add_argument("boards", nargs="+", help=f"보드마다의 피드백 줄 ({MIN_BOARDS}~{MAX_BOARDS}개, 빈 보드는 \"\")")
+    parser.add_argument("--top", type=int, default=TOP_GUESSES, help="보여줄 추천 다음 단어 수")
+    parser.add_argument("--show", type=int, default=10, help="보드마다 보여줄 후보 단어 수")
+    parser.add_argument("--extended", action="store_true", help="확장 단어팩 사용")
+    parser.add_argument("--table", default=None, help="피드백 표 파일 경로")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = word_file_paths(parser, args, args.extended)
+
+    store = WordStore(paths["base"], paths["user"], paths["extended"], db_path=args.db)
+    index = store.index(args.extended)
+    try:
+        boards, length = parse_boards(args.boards)
+    except ValueError as e:
+        parser.error(str(e))
+    table = None
+    if MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH:
+        try:
+            table = FeedbackMatrix.load_or_build(store, args.extended, args.table, length)
+        except ImportError:
+            pass
+    started = time.perf_counter()
+    try:
+        results, suggestions = solve_boards(index, boards, table, args.top)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    for number, result in enumerate(results, 1):
+        candidates = result["candidates"]
+        if result["solved"]:
+            print(f"[{number}] 완료: {candidates[0]}")
+            continue
+        shown = ", ".join(candidates[:args.show])
+        more = f" 외 {len(candidates) - args.show}개" if len(candidates) > args.show else ""
+        print(f"[{number}] 후보 {len(candidates)}개: {shown}{more}")
+    if suggestions:
+        print("추천 다음 단어 (엔트로피 합, 후보인 보드 수):")
+        for rank, (word, bits, boards) in enumerate(suggestions, 1):
+            print(f"  {rank:2d}. {word}  {bits:.2f}비트  {boards}")
+    print(f"소요 시간: {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+워들 단어 사전 검색을 로컬 HTTP/JSON API로 제공하는 서버입니다.
+
+시작할 때 단어 목록을 한 번 읽고 기본/확장 인덱스를 만들어 둔 뒤, 모든 요청이 같은 인덱스를 함께 씁니다.
+단어 파일은 바뀌었을 때만 다시 읽고, 사용자 단어 파일의 변경은 추가/삭제된 단어만 인덱스에 반영합니다. 요청 처리는 asyncio로 하고,
+검색과 JSON 변환처럼 CPU를 쓰는 일은 스레드 풀에서 처리해 이벤트 루프가 멈추지 않게 합니다.
+
+엔드포인트 (모두 JSON 응답):
+    GET  /search?pattern=_a_b_&loose=a(1,4)&exclude=c,d&extended=1&limit=100
+    POST /search   {"pattern": "_ a _ b _", "loose": "a(1,4)", "exclude": "c,d", "extended": false}
+                   조건이 모두 비어 있으면 전체 단어를 알파벳순으로 반환합니다.
+                   feedback에 'crane BYGBB, slate GBBYB' 같은 피드백 줄을 주면 보드 전체 조건으로 검색합니다.
+                   rank=1이면 자리별 글자 빈도로 본 가능성이 큰 단어부터 반환합니다.
+    GET  /words?extended=1        전체 단어 목록 (알파벳순)
+    GET  /stats                   단어 수, 요청 수, 검색 결과 캐시 상태
+    GET  /health                  {"ok": true}
+
+사용 예:
+    python wordleServer.py --port 8765 --db words.wdb
+    curl "http://127.0.0.1:8765/search?pattern=_ a _ _ e&exclude=s,t"
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from wordleCore import QueryCache, UserWordsWatcher, WordStore, add_word_file_arguments, is_empty_query, search
+from wordleFeedback import compile_feedback, parse_feedback_rows
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+QUERY_CACHE_SIZE = 1024      # 서버가 기억해 둘 검색 결과 수
+MAX_HEADER_BYTES = 16 * 1024  # 요청 줄 + 헤더 최대 크기
+MAX_BODY_BYTES = 64 * 1024    # 요청 본문 최대 크기
+KEEPALIVE_TIMEOUT = 15        # 다음 요청을 기다리는 최대 시간 (초)
+USER_WORDS_POLL_SECONDS = 1.0  # 사용자 단어 파일이 바뀌었는지 확인하는 간격 (초)
+
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           408: "Request Timeout", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HttpError(Exception):
+    """
+    클라이언트에게 상태 코드와 함께 돌려줄 오류입니다.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _flag(value):
+    """
+    쿼리 문자열이나 JSON 값의 참/거짓을 해석합니다. ("1", "true", "yes", "on", true)
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+def _text(params, name):
+    """
+    텍스트 조건 값을 문자열로 반환합니다. 없거나 null이면 ""이고, 문자열이 아니면 400 오류입니다.
+    """
+    value = params.get(name)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise HttpError(400, f"{name}은 문자열이어야 합니다: {json.dumps(value, ensure_ascii=False)}")
+    return value.strip()
+
+def _limit(value):
+    if value in (None, ""):
+        return None
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"limit은 정수여야 합니다: {value}")
+    if limit < 0:
+        raise HttpError(400, f"limit은 0 이상이어야 합니다: {limit}")
+    return limit
+
+class WordleServer:
+    """
+    단어 저장소 하나를 여러 클라이언트가 함께 쓰는 검색 서버입니다.
+    """
+
+    def __init__(self, store, workers=None):
+        self.store = store
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wordle-server")
+        self._store_lock = threading.Lock()  # 파일이 바뀌었을 때 인덱스를 한 번만 다시 만들도록 합니다.
+        self.started = time.time()
+        self.requests = 0
+        self.routes = {
+            "/search": ("GET", "POST"),
+            "/words": ("GET",),
+            "/stats": ("GET",),
+            "/health": ("GET",),
+        }
+
+    def load(self):
+        """
+        기본/확장 단어 목록과 인덱스를 미리 만들어 둡니다.
+        """
+        with self._store_lock:
+            self.store.load_all()
+
+    def index(self, use_extended):
+        with self._store_lock:
+            return self.store.index(use_extended), list(self.store.missing)
+
+    def alphabetical(self, use_extended):
+        """
+        전체 단어 목록을 알파벳순으로 반환합니다. (.wdb를 읽었으면 정렬해 둔 순서를 그대로, 아니면 한 번만 정렬)
+        """
+        with self._store_lock:
+            return self.store.alphabetical(use_extended)[0], list(self.store.missing)
+
+    # =========================
+    # 요청 처리 (스레드 풀)
+    # =========================
+
+    def search_response(self, params):
+        """
+        /search: 조건에 맞는 단어 목록을 반환합니다. 조건이 모두 비어 있으면 전체 단어 목록입니다.
+        """
+        fixed_pattern = _text(params, "pattern")
+        loose_letters = _text(params, "loose")
+        exclude_letters = _text(params, "exclude")
+        feedback = _text(params, "feedback")
+        use_extended = _flag(params.get("extended", False))
+        rank = _flag(params.get("rank", False))
+        limit = _limit(params.get("limit"))
+        index, missing = self.index(use_extended)
+        started = time.perf_counter()
+        try:
+            if feedback:
+                program = compile_feedback(parse_feedback_rows(feedback), fixed_pattern, loose_letters, exclude_letters)
+                words = index.filter_program(program)
+            elif is_empty_query(fixed_pattern, loose_letters, exclude_letters):
+                words, _ = self.alphabetical(use_extended)
+            else:
+                words = search(index, fixed_pattern, loose_letters, exclude_letters)
+        except (ValueError, re.error) as e:
+            raise HttpError(400, f"입력을 해석할 수 없습니다: {e}")
+        if rank:
+            words = getattr(index, "index", index).stats.rank(words)
+        return {"pattern": fixed_pattern, "loose": loose_letters, "exclude": exclude_letters, "feedback": feedback,
+                "extended": use_extended, "rank": rank, "total": len(index.words), "count": len(words),
+                "words": words if limit is None else words[:limit], "missing": missing,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+    def words_response(self, params):
+        """
+        /words: 전체 단어 목록을 알파벳순으로 반환합니다.
+        """
+        use_extended = _flag(params.get("extended", False))
+        limit = _limit(params.get("limit"))
+        words, missing = self.alphabetical(use_extended)
+        return {"extended": use_extended, "count": len(words),
+                "words": words if limit is None else words[:limit], "missing": missing}
+
+    def stats_response(self, params):
+        """
+        /stats: 단어 수, 요청 수, 검색 결과 캐시 상태를 반환합니다.
+        """
+        stats = {"uptime_s": round(time.time() - self.started, 1), "requests": self.requests}
+        for use_extended, name in ((False, "base"), (True, "extended")):
+            index, missing = self.index(use_extended)
+            view = {"words": len(index.words), "engine": type(getattr(index, "index", index)).__name__,
+                    "missing": missing}
+            if isinstance(index, QueryCache):  # 인덱스에도 단어 통계(stats 속성)가 있으므로 캐시인지 직접 확인합니다.
+                view["cache"] = index.stats()
+            stats[name] = view
+        return stats
+
+    def handle(self, method, path, params):
+        """
+        요청 하나를 처리해 (상태 코드, JSON 바이트)를 반환합니다. 스레드 풀에서 실행됩니다.
+        """
+        if path == "/health":
+            body = {"ok": True}
+        elif path == "/search":
+            body = self.search_response(params)
+        elif path == "/words":
+            body = self.words_response(params)
+        else:
+            body = self.stats_response(params)
+        return 200, json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    # =========================
+    # HTTP (이벤트 루프)
+    # =========================
+
+    async def read_request(self, reader):
+        """
+        요청 하나를 읽어 (메서드, 경로, 파라미터, keep-alive 여부)를 반환합니다. 연결이 끝났으면 None입니다.
+        """
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise HttpError(400, "요청이 끝나지 않았습니다.")
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "요청 헤더가 너무 큽니다.")
+        except asyncio.TimeoutError:
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HttpError(400, f"잘못된 요청 줄입니다: {lines[0]}")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query, keep_blank_values=True).items()}
+        content_length = headers.get("content-length", "") or "0"
+        if not content_length.isascii() or not content_length.isdigit():
+            raise HttpError(400, f"Content-Length가 올바르지 않습니다: {content_length}")
+        length = int(content_length)
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "요청 본문이 너무 큽니다.")
+        if length:
+            body = await reader.readexactly(length)
+            try:
+                data = json.loads(body.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                raise HttpError(400, "요청 본문은 JSON 객체여야 합니다.")
+            if not isinstance(data, dict):
+                raise HttpError(400, "요청 본문은 JSON 객체여야 합니다.")
+            params.update(data)
+        return method.upper(), url.path.rstrip("/") or "/", params, keep_alive
+
+    async def dispatch(self, method, path, params):
+        if method == "OPTIONS":
+            return 204, b""
+        allowed = self.routes.get(path)
+        if allowed is None:
+            raise HttpError(404, f"알 수 없는 경로입니다: {path}")
+        if method not in allowed:
+            raise HttpError(405, f"{path}는 {', '.join(allowed)} 요청만 받습니다.")
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.handle, method, path, params)
+
+    async def serve_client(self, reader, writer):
+        """
+        연결 하나에서 들어오는 요청들을 차례로 처리합니다. (HTTP/1.1 keep-alive)
+        """
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    method, path, params, keep_alive = request
+                    status, body = await self.dispatch(method, path, params)
+                except HttpError as e:
+                    status = e.status
+                    body = json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8")
+                except Exception as e:  # 처리 중 예상하지 못한 오류는 500으로 알려줍니다.
+                    status = 500
+                    body = json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False).encode("utf-8")
+                head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                        "Content-Type: application/json; charset=utf-8",
+                        f"Content-Length: {len(body)}",
+                        "Access-Control-Allow-Origin: *",
+                        "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+                        "Access-Control-Allow-Headers: Content-Type",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """
+        서버를 시작하고 멈출 때까지 요청을 받습니다. ready(주소)는 요청을 받을 준비가 되면 호출됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.load)
+        # 사용자 단어 파일이 바뀌면 요청을 기다리지 않고 바뀐 단어만 인덱스에 반영해 둡니다.
+        watcher = UserWordsWatcher(self.store, USER_WORDS_POLL_SECONDS, lock=self._store_lock).start()
+        server = await asyncio.start_server(self.serve_client, host, port, limit=MAX_HEADER_BYTES)
+        address = server.sockets[0].getsockname()
+        if ready is not None:
+            ready(address)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.stop()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워들 단어 사전 로컬 HTTP/JSON 검색 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"주소 (기본값: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="검색 스레드 수 (기본값: 자동)")
+    parser.add_argument("--backend", choices=("bitset", "numpy"), default=None, help="검색 엔진 (기본값: 자동)")
+    parser.add_argument("--cache-size", type=int, default=QUERY_CACHE_SIZE, help="기억해 둘 검색 결과 수 (0이면 캐시 없음)")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+
+    store = WordStore(args.words, args.user_words, args.extended_words, backend=args.backend,
+                      db_path=args.db, cache_size=args.cache_size)
+    server = WordleServer(store, args.workers)
+
+    def ready(address):
+        print(f"워들 단어 사전 서버: http://{address[0]}:{address[1]}/ (Ctrl+C로 종료)", file=sys.stderr)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
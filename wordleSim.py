@@ -0,0 +1,211 @@
+"""
+모든 정답으로 워들 게임을 끝까지 풀어 보는 시뮬레이션 도구입니다.
+
+정답 후보(words.txt + user_words.txt의 다섯 글자 단어, --length로 다른 길이)마다 게임을 한 판씩 진행합니다.
+매 턴 추측 단어를 정책(policy)으로 고르고, 받은 피드백을 GUI 입력창과 같은 세 값
+(패턴, 유동 글자, 제외 글자)으로 바꾼 다음 검색 인덱스로 남은 후보를 찾습니다.
+
+정책:
+- entropy: 피드백 표로 기대 정보량(엔트로피)이 가장 큰 단어 (NumPy 필요)
+- first:   남은 후보 중 알파벳순 첫 단어
+- random:  남은 후보 중 무작위 단어 (정답마다 시드가 정해져 있어 결과가 재현됩니다)
+- likelihood: 남은 후보 중 자리별 글자 빈도로 본 가능성이 가장 큰 단어 (WordStats.likelihood, NumPy 불필요)
+
+정답 목록을 여러 조각으로 나누어 프로세스 풀에서 처리합니다. 각 작업 프로세스는 단어 목록을 한 번만 읽고,
+피드백 표는 같은 파일을 메모리 맵으로 열어 읽기 전용 페이지를 공유합니다.
+결과로 몇 번 만에 맞혔는지의 분포, 실패한 정답, 턴당 지연 시간(p50/p99), 전체 소요 시간을 보여줍니다.
+
+사용 예:
+    python wordleSim.py --policy entropy --workers 8 -o sim.json
+    python wordleSim.py --policy first --opener crane --limit 200
+    python wordleSim.py --length 6 --workers 4
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from wordleCore import WordStore, add_word_file_arguments, search, word_file_paths
+from wordleFeedback import (MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH, FeedbackMatrix, colors_from_code,
+                            feedback_code, feedback_to_fields, feedback_words)
+
+POLICIES = ("entropy", "first", "random", "likelihood")
+MAX_TURNS = 6
+
+# 작업 프로세스마다 한 번만 준비해 두는 상태
+_worker = None
+
+class Solver:
+    """
+    정책 하나로 게임을 푸는 객체입니다. 작업 프로세스마다 하나씩 만듭니다.
+    """
+
+    def __init__(self, paths, use_extended=False, policy="entropy", db_path=None, table_path=None,
+                 opener=None, max_turns=MAX_TURNS, seed=0, length=WORD_LENGTH):
+        store = WordStore(paths["base"], paths["user"], paths["extended"], db_path=db_path)
+        self.index = store.index(use_extended)
+        self.policy = policy
+        self.opener = opener
+        self.max_turns = max_turns
+        self.seed = seed
+        self.table = (FeedbackMatrix.load_or_build(store, use_extended, table_path, length)
+                      if policy == "entropy" else None)
+        self.stats = store.word_stats(use_extended) if policy == "likelihood" else None
+        self.start_candidates = search(self.index, " ".join("_" * length), "", "")
+
+    def choose(self, candidates, turn, rnd):
+        """
+        남은 후보 단어 목록에서 이번 턴의 추측 단어를 고릅니다.
+        """
+        if turn == 1 and self.opener:
+            return self.opener
+        if turn == 1 and self.policy != "random":
+            # 첫 수는 정답과 상관없이 같으므로 한 번만 계산합니다.
+            self.opener = self.choose(candidates, 0, rnd)
+            return self.opener
+        if self.policy == "entropy":
+            best = self.table.best_guesses(candidates, top=1)
+            if best:
+                return best[0][0]
+        elif self.policy == "random":
+            return rnd.choice(candidates)
+        elif self.policy == "likelihood":
+            return max(candidates, key=self.stats.likelihood)
+        return candidates[0]
+
+    def play(self, answer):
+        """
+        answer가 정답인 게임 한 판을 진행해 결과 딕셔너리를 반환합니다.
+        맞히지 못하면 solved가 False이고, turns는 추측한 횟수입니다.
+        """
+        rnd = random.Random(f"{self.seed}:{answer}")
+        candidates = self.start_candidates
+        rows = []
+        latencies = []
+        solved = False
+        while len(rows) < self.max_turns and candidates:
+            started = time.perf_counter()
+            guess = self.choose(candidates, len(rows) + 1, rnd)
+            colors = colors_from_code(feedback_code(guess, answer), len(guess))
+            rows.append((guess, colors))
+            if guess == answer:
+                latencies.append(time.perf_counter() - started)
+                solved = True
+                break
+            # 이미 틀린 단어는 피드백과 맞더라도 정답이 아니므로 뺍니다.
+            guessed = {word for word, _ in rows}
+            candidates = [word for word in search(self.index, *feedback_to_fields(rows)) if word not in guessed]
+            latencies.append(time.perf_counter() - started)
+        return {"answer": answer, "solved": solved, "turns": len(rows),
+                "guesses": [guess for guess, _ in rows], "latencies": latencies}
+
+def _init_worker(options):
+    """
+    작업 프로세스 시작 시 단어 목록과 피드백 표를 열어 둡니다.
+    """
+    global _worker
+    _worker = Solver(**options)
+
+def play_shard(answers):
+    """
+    정답 조각 하나의 게임들을 진행합니다.
+    """
+    return [_worker.play(answer) for answer in answers]
+
+def run_simulation(answers, options, workers=None, shards_per_worker=4):
+    """
+    정답 목록을 조각으로 나누어 모든 게임을 진행하고, 정답 순서대로 결과 목록을 반환합니다.
+    workers가 1이면 현재 프로세스에서 처리합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(answers) <= 1:
+        _init_worker(options)
+        return play_shard(answers)
+    shard_size = max(1, -(-len(answers) // (workers * shards_per_worker)))
+    shards = [answers[i:i + shard_size] for i in range(0, len(answers), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options,)) as executor:
+        return [game for shard in executor.map(play_shard, shards) for game in shard]
+
+def summarize(games, wall_seconds):
+    """
+    게임 결과 목록을 분포, 실패 목록, 턴당 지연 시간으로 요약합니다.
+    """
+    distribution = {}
+    failures = []
+    latencies = []
+    for game in games:
+        latencies += game["latencies"]
+        if game["solved"]:
+            distribution[game["turns"]] = distribution.get(game["turns"], 0) + 1
+        else:
+            failures.append(game["answer"])
+    latencies.sort()
+    solved = len(games) - len(failures)
+
+    def percentile(q):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+    return {"games": len(games), "solved": solved, "failures": failures,
+            "distribution": dict(sorted(distribution.items())),
+            "mean_guesses": round(sum(k * v for k, v in distribution.items()) / solved, 4) if solved else None,
+            "turn_p50_ms": percentile(0.50), "turn_p99_ms": percentile(0.99),
+            "wall_seconds": round(wall_seconds, 3)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워들 게임 시뮬레이션 (모든 정답으로 풀어 보기)")
+    parser.add_argument("--policy", choices=POLICIES, default="entropy", help="추측 단어를 고르는 정책")
+    parser.add_argument("--opener", default=None, help="첫 추측 단어 (기본값: 정책대로)")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="한 게임의 최대 추측 횟수")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 이만큼의 정답만 시뮬레이션")
+    parser.add_argument("--seed", type=int, default=0, help="random 정책의 난수 시드")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH,
+                        help=f"단어 길이 ({MIN_WORD_LENGTH}~{MAX_WORD_LENGTH}, 기본 {WORD_LENGTH})")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("-o", "--output", default=None, help="결과 JSON 파일 (게임별 기록 포함)")
+    parser.add_argument("--extended", action="store_true", help="확장 단어팩을 추측 단어와 검색에 사용")
+    parser.add_argument("--table", default=None, help="피드백 표 파일 경로")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = word_file_paths(parser, args, args.extended)
+    if not MIN_WORD_LENGTH <= args.length <= MAX_WORD_LENGTH:
+        parser.error(f"단어 길이는 {MIN_WORD_LENGTH}~{MAX_WORD_LENGTH}여야 합니다: {args.length}")
+    if args.opener is not None:
+        args.opener = args.opener.strip().lower()
+        if len(args.opener) != args.length or not args.opener.isalpha():
+            parser.error(f"첫 추측 단어는 알파벳 {args.length}글자여야 합니다: {args.opener}")
+
+    store = WordStore(paths["base"], paths["user"], paths["extended"], db_path=args.db)
+    answers = feedback_words(store.words(False), args.length)[:args.limit]
+    options = {"paths": paths, "use_extended": args.extended, "policy": args.policy, "db_path": args.db,
+               "table_path": args.table, "opener": args.opener, "max_turns": args.max_turns, "seed": args.seed,
+               "length": args.length}
+    if args.policy == "entropy":
+        # 작업 프로세스들이 같은 파일을 열도록 피드백 표를 미리 만들어 둡니다.
+        FeedbackMatrix.load_or_build(store, args.extended, args.table, args.length)
+
+    started = time.perf_counter()
+    games = run_simulation(answers, options, args.workers)
+    report = summarize(games, time.perf_counter() - started)
+
+    print(f"정책: {args.policy}, 게임 {report['games']}판, 성공 {report['solved']}판, "
+          f"평균 {report['mean_guesses']}번, 소요 시간 {report['wall_seconds']}초")
+    for turns, count in report["distribution"].items():
+        print(f"  {turns}번: {count}")
+    print(f"  턴당 지연 시간 p50 {report['turn_p50_ms']} ms, p99 {report['turn_p99_ms']} ms")
+    if report["failures"]:
+        print(f"  실패: {', '.join(report['failures'])}")
+    if args.output:
+        report.update(policy=args.policy, opener=args.opener, extended=args.extended, length=args.length,
+                      games=[{key: game[key] for key in ("answer", "solved", "turns", "guesses")} for game in games])
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+if __name__ == "__main__":
+    main()
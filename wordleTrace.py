@@ -0,0 +1,179 @@
+"""
+검색 과정의 단계별 시간 측정과 프로파일링 도구입니다.
+
+검색 한 번을 아래 단계로 나누어 시간을 잽니다.
+- load:    단어 목록과 검색 인덱스 준비
+- parse:   입력값 해석 (parse_query, parse_loose_letters)
+- regex:   패턴 정규식 컴파일 (filter_words를 쓸 때)
+- filter:  조건에 맞는 단어 찾기
+- sort:    전체 단어 목록 정렬 (조건이 없을 때)
+- suggest: 추천 다음 단어 계산
+- render:  결과창 출력 (GUI)
+
+StageTimer를 filter_words, 검색 인덱스의 filter, search에 timer로 넘기면 단계별 시간이 쌓입니다.
+timer를 넘기지 않으면 아무것도 재지 않는 NULL_TIMER가 쓰입니다.
+
+사용 예:
+    python wordleTrace.py "_ a _ _ e" "r(1)" "s,t"              # 단계별 시간 출력
+    python wordleTrace.py "_ a _ _ e" "r(1)" "s,t" --profile    # cProfile/tracemalloc 보고서 출력
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+# wordleCore가 NULL_TIMER 때문에 이 모듈을 항상 불러오므로, 프로파일링·로그·명령줄 모듈(cProfile, pstats,
+# tracemalloc, json, argparse)은 실제로 쓰는 함수 안에서 불러옵니다. (GUI/서버 시작 시간을 늘리지 않습니다.)
+
+STAGES = ("load", "parse", "regex", "filter", "sort", "rank", "suggest", "render")
+
+class StageTimer:
+    """
+    검색 한 번의 단계별 소요 시간(초)을 모으는 객체입니다. 같은 단계를 여러 번 재면 더해집니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}  # 단계 이름 -> 누적 시간 (초)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        with 블록 안의 실행 시간을 name 단계에 더합니다.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def elapsed(self):
+        """
+        타이머를 만든 뒤 지난 시간(초)을 반환합니다. (단계 사이의 대기 시간까지 포함)
+        """
+        return time.perf_counter() - self.started
+
+    def ordered(self):
+        """
+        (단계 이름, 시간) 목록을 STAGES 순서대로 반환합니다. 그 밖의 단계는 뒤에 붙습니다.
+        """
+        names = [name for name in STAGES if name in self.stages]
+        names += [name for name in self.stages if name not in STAGES]
+        return [(name, self.stages[name]) for name in names]
+
+    def summary(self):
+        """
+        상태 표시줄에 보여줄 짧은 요약입니다. 예: "load 0.1 · parse 0.0 · filter 2.3 · render 8.4 ms"
+        """
+        return " · ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in self.ordered()) + " ms"
+
+    def record(self, **fields):
+        """
+        추적 로그에 남길 딕셔너리를 만듭니다. fields(검색 조건 등)가 함께 들어갑니다.
+        """
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        record.update(fields)
+        record["stages_ms"] = {name: round(seconds * 1000, 3) for name, seconds in self.ordered()}
+        record["total_ms"] = round(self.elapsed() * 1000, 3)
+        return record
+
+class _NullTimer:
+    """
+    시간을 재지 않는 타이머입니다. timer를 넘기지 않았을 때 쓰입니다.
+    """
+
+    _context = nullcontext()
+
+    def stage(self, name):
+        return self._context
+
+    def add(self, name, seconds):
+        pass
+
+NULL_TIMER = _NullTimer()
+
+def append_trace(path, record):
+    """
+    추적 기록 하나를 JSON Lines 파일에 한 줄로 덧붙입니다.
+    """
+    import json
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+def profile_call(func, *args, top=25, **kwargs):
+    """
+    func(*args, **kwargs)를 cProfile과 tracemalloc을 켠 채 한 번 실행합니다.
+    반환값: (func의 반환값, 보고서 문자열)
+    보고서에는 누적 시간 순 함수 top개와 메모리 최대 사용량, 메모리를 많이 할당한 줄이 들어갑니다.
+    """
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    out = io.StringIO()
+    out.write(f"[메모리] 현재 {current / 1024:.1f} KB, 최대 {peak / 1024:.1f} KB\n\n")
+    out.write("[메모리를 많이 할당한 줄]\n")
+    for stat in snapshot.statistics("lineno")[:10]:
+        out.write(f"  {stat}\n")
+    out.write("\n[함수별 시간 (누적 시간 순)]\n")
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+    return result, out.getvalue()
+
+def main(argv=None):
+    import argparse
+
+    from wordleCore import WordStore, add_word_file_arguments, search, word_file_paths
+
+    parser = argparse.ArgumentParser(description="검색 한 번의 단계별 시간을 재거나 프로파일링합니다.")
+    parser.add_argument("pattern", nargs="?", default="", help="확정된 글자 패턴 (예: \"_ a _ b _\")")
+    parser.add_argument("loose", nargs="?", default="", help="유동 글자 (예: \"a(1,4) b(3,4)\")")
+    parser.add_argument("exclude", nargs="?", default="", help="제외할 글자 (예: \"c,d,e\")")
+    parser.add_argument("--extended", action="store_true", help="확장 단어팩 사용")
+    parser.add_argument("--backend", choices=("bitset", "numpy"), default=None, help="검색 엔진 (기본값: 자동)")
+    parser.add_argument("--profile", action="store_true", help="cProfile/tracemalloc 보고서를 함께 출력")
+    parser.add_argument("--trace", default=None, help="추적 기록을 덧붙일 JSON Lines 파일")
+    add_word_file_arguments(parser)
+    args = parser.parse_args(argv)
+    paths = word_file_paths(parser, args, args.extended)
+
+    def run():
+        timer = StageTimer()
+        with timer.stage("load"):
+            store = WordStore(paths["base"], paths["user"], paths["extended"], backend=args.backend,
+                              db_path=args.db)
+            index = store.index(args.extended)
+        matches = search(index, args.pattern, args.loose, args.exclude, timer)
+        return timer, matches
+
+    if args.profile:
+        (timer, matches), report = profile_call(run)
+    else:
+        timer, matches = run()
+    record = timer.record(pattern=args.pattern, loose=args.loose, exclude=args.exclude,
+                          extended=args.extended, count=len(matches))
+    print(f"단어 {len(matches)}개: {timer.summary()} (전체 {record['total_ms']:.1f} ms)")
+    if args.profile:
+        print()
+        print(report)
+    if args.trace:
+        append_trace(args.trace, record)
+
+if __name__ == "__main__":
+    main()